@@ -1,7 +1,8 @@
 """Order repository interface."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
 
 from src.domain.entity.order_entity import Order
 
@@ -36,9 +37,30 @@ class IOrderRepo(ABC):
         pass
 
     @abstractmethod
-    async def get_buyer_orders_with_details(self, buyer_id: int) -> List[dict]:
+    async def list_orders_with_details(
+        self,
+        *,
+        buyer_id: Optional[int] = None,
+        seller_id: Optional[int] = None,
+        status: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+    ) -> List[dict]:
+        """Up to ``limit`` orders with id above ``after_id``, ascending by id (keyset page)."""
         pass
 
     @abstractmethod
-    async def get_seller_orders_with_details(self, seller_id: int) -> List[dict]:
+    def iter_orders_with_details(
+        self,
+        *,
+        buyer_id: Optional[int] = None,
+        seller_id: Optional[int] = None,
+        status: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[dict]:
+        """Every matching order in id order, fetched ``chunk_size`` rows at a time."""
         pass
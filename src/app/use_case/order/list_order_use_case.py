@@ -1,30 +1,107 @@
-from typing import Any, Optional
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, AsyncIterator, Optional
 
 from src.app.interface.i_order_repo import IOrderRepo
+from src.platform.exception.exceptions import DomainError
 from src.platform.logging.loguru_io import Logger
 
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+EXPORT_CHUNK_SIZE = 1000
+
+
+def encode_cursor(order_id: int) -> str:
+    return base64.urlsafe_b64encode(str(order_id).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> int:
+    """Last order id of the previous page; DomainError for a malformed cursor."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        order_id = int(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise DomainError('Invalid cursor', 400) from None
+    if order_id < 0:
+        raise DomainError('Invalid cursor', 400)
+    return order_id
+
+
 class ListOrdersUseCase:
     def __init__(self, order_repo: IOrderRepo):
         self.order_repo = order_repo
 
     @Logger.io
     async def list_buyer_orders(
-        self, buyer_id: int, status: Optional[str] = None
-    ) -> list[dict[str, Any]]:
-        orders = await self.order_repo.get_buyer_orders_with_details(buyer_id)
-        if status:
-            orders = [order for order in orders if order['status'] == status]
-
-        return orders
+        self,
+        buyer_id: int,
+        status: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ) -> dict[str, Any]:
+        return await self._list_page(
+            cursor,
+            limit,
+            buyer_id=buyer_id,
+            status=status,
+            created_after=created_after,
+            created_before=created_before,
+        )
 
     @Logger.io
     async def list_seller_orders(
-        self, seller_id: int, status: Optional[str] = None
-    ) -> list[dict[str, Any]]:
-        orders = await self.order_repo.get_seller_orders_with_details(seller_id)
+        self,
+        seller_id: int,
+        status: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ) -> dict[str, Any]:
+        return await self._list_page(
+            cursor,
+            limit,
+            seller_id=seller_id,
+            status=status,
+            created_after=created_after,
+            created_before=created_before,
+        )
 
-        if status:
-            orders = [order for order in orders if order['status'] == status]
+    @Logger.io
+    def export_orders(
+        self,
+        *,
+        buyer_id: Optional[int] = None,
+        seller_id: Optional[int] = None,
+        status: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Every matching order of one buyer or seller, streamed in id order."""
+        if (buyer_id is None) == (seller_id is None):
+            raise DomainError('Export needs exactly one of buyer_id or seller_id', 400)
+        return self.order_repo.iter_orders_with_details(
+            buyer_id=buyer_id,
+            seller_id=seller_id,
+            status=status,
+            created_after=created_after,
+            created_before=created_before,
+            chunk_size=EXPORT_CHUNK_SIZE,
+        )
 
-        return orders
+    async def _list_page(self, cursor: Optional[str], limit: int, **filters: Any) -> dict[str, Any]:
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        # One extra row tells whether another page follows
+        orders = await self.order_repo.list_orders_with_details(
+            after_id=decode_cursor(cursor) if cursor else None, limit=limit + 1, **filters
+        )
+        has_more = len(orders) > limit
+        items = orders[:limit]
+        return {
+            'items': items,
+            'next_cursor': encode_cursor(items[-1]['id']) if has_more else None,
+        }
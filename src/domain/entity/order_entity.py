@@ -8,10 +8,10 @@ from django.utils import timezone
 
 from src.domain.enum.order_status import OrderStatus
 from src.platform.exception.exceptions import DomainError
-from src.platform.logging.loguru_io import Logger
+from src.platform.logging.loguru_io import IOLayer, Logger
 
 
-@Logger.io
+@Logger.io(layer=IOLayer.VALIDATOR)
 def validate_positive_price(instance, attribute, value):
     if value <= 0:
         raise DomainError('Price must be positive', 400)
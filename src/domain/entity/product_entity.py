@@ -6,23 +6,23 @@ import attrs
 
 from src.domain.enum.product_status import ProductStatus
 from src.platform.exception.exceptions import DomainError
-from src.platform.logging.loguru_io import Logger
+from src.platform.logging.loguru_io import IOLayer, Logger
 
 
-@Logger.io
+@Logger.io(layer=IOLayer.VALIDATOR)
 def validate_positive_price(instance, attribute, value):
     # value = -1
     if value < 0:
         raise DomainError('Price must be positive')
 
 
-@Logger.io
+@Logger.io(layer=IOLayer.VALIDATOR)
 def validate_name(instance, attribute, value):
     if not value or not value.strip():
         raise DomainError('Product name is required')
 
 
-@Logger.io
+@Logger.io(layer=IOLayer.VALIDATOR)
 def validate_description(instance, attribute, value):
     if not value or not value.strip():
         raise DomainError('Product description is required')
@@ -0,0 +1,231 @@
+"""Order repository implementation backed by an asyncpg connection pool."""
+
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
+
+import asyncpg
+
+from src.app.interface.i_order_repo import IOrderRepo
+from src.domain.entity.order_entity import Order, OrderStatus
+from src.platform.database.asyncpg_pool import AsyncpgPool, asyncpg_pool
+from src.platform.exception.exceptions import DomainError, ForbiddenError, NotFoundError
+from src.platform.logging.loguru_io import Logger
+
+
+ORDER_COLUMNS = (
+    'id, buyer_id, seller_id, product_id, price, status, created_at, updated_at, paid_at'
+)
+
+# Display names are first_name, else the local part of the email, as in the ORM listing
+SELECT_WITH_DETAILS = """
+    SELECT o.id, o.buyer_id, o.seller_id, o.product_id, o.price, o.status,
+           o.created_at, o.paid_at, p.name AS product_name,
+           COALESCE(NULLIF(b.first_name, ''), split_part(b.email, '@', 1)) AS buyer_name,
+           COALESCE(NULLIF(s.first_name, ''), split_part(s.email, '@', 1)) AS seller_name
+    FROM "order" o
+    JOIN product p ON p.id = o.product_id
+    JOIN auth_user b ON b.id = o.buyer_id
+    JOIN auth_user s ON s.id = o.seller_id
+"""
+
+
+class OrderRepoAsyncpgImpl(IOrderRepo):
+    def __init__(self, pool: AsyncpgPool = asyncpg_pool):
+        self._pool = pool
+
+    @staticmethod
+    def _to_entity(row: asyncpg.Record) -> Order:
+        return Order(
+            buyer_id=row['buyer_id'],
+            seller_id=row['seller_id'],
+            product_id=row['product_id'],
+            price=row['price'],
+            status=OrderStatus(row['status']),
+            created_at=row['created_at'],
+            updated_at=row['updated_at'],
+            paid_at=row['paid_at'],
+            id=row['id'],
+        )
+
+    @Logger.io
+    async def create(self, order: Order) -> Order:
+        # created_at / updated_at follow the ORM's auto_now_add / auto_now fields
+        async with self._pool.acquire() as connection:
+            row = await connection.fetchrow(
+                f"""
+                INSERT INTO "order"
+                    (buyer_id, seller_id, product_id, price, status,
+                     created_at, updated_at, paid_at)
+                VALUES ($1, $2, $3, $4, $5, now(), now(), $6)
+                RETURNING {ORDER_COLUMNS}
+                """,
+                order.buyer_id,
+                order.seller_id,
+                order.product_id,
+                order.price,
+                order.status.value,
+                order.paid_at,
+            )
+        return self._to_entity(row)
+
+    @Logger.io
+    async def get_by_id(self, order_id: int) -> Optional[Order]:
+        async with self._pool.acquire() as connection:
+            row = await connection.fetchrow(
+                f'SELECT {ORDER_COLUMNS} FROM "order" WHERE id = $1', order_id
+            )
+        return self._to_entity(row) if row else None
+
+    @Logger.io
+    async def get_by_product_id(self, product_id: int) -> Optional[Order]:
+        async with self._pool.acquire() as connection:
+            row = await connection.fetchrow(
+                f"""
+                SELECT {ORDER_COLUMNS} FROM "order"
+                WHERE product_id = $1 AND status <> $2
+                ORDER BY id LIMIT 1
+                """,
+                product_id,
+                OrderStatus.CANCELLED.value,
+            )
+        return self._to_entity(row) if row else None
+
+    @Logger.io
+    async def get_by_buyer(self, buyer_id: int) -> List[Order]:
+        async with self._pool.acquire() as connection:
+            rows = await connection.fetch(
+                f'SELECT {ORDER_COLUMNS} FROM "order" WHERE buyer_id = $1 ORDER BY id', buyer_id
+            )
+        return [self._to_entity(row) for row in rows]
+
+    @Logger.io
+    async def get_by_seller(self, seller_id: int) -> List[Order]:
+        async with self._pool.acquire() as connection:
+            rows = await connection.fetch(
+                f'SELECT {ORDER_COLUMNS} FROM "order" WHERE seller_id = $1 ORDER BY id', seller_id
+            )
+        return [self._to_entity(row) for row in rows]
+
+    @Logger.io
+    async def update(self, order: Order) -> Order:
+        async with self._pool.acquire() as connection:
+            row = await connection.fetchrow(
+                f"""
+                UPDATE "order"
+                SET buyer_id = $2, seller_id = $3, product_id = $4, price = $5,
+                    status = $6, updated_at = $7, paid_at = $8
+                WHERE id = $1
+                RETURNING {ORDER_COLUMNS}
+                """,
+                order.id,
+                order.buyer_id,
+                order.seller_id,
+                order.product_id,
+                order.price,
+                order.status.value,
+                order.updated_at,
+                order.paid_at,
+            )
+        if not row:
+            raise ValueError(f'Order with id {order.id} not found')
+        return self._to_entity(row)
+
+    @Logger.io
+    async def cancel_order_atomically(self, order_id: int, buyer_id: int) -> Order:
+        async with self._pool.acquire() as connection:
+            # The conditional UPDATE locks and changes the row in one statement
+            row = await connection.fetchrow(
+                f"""
+                UPDATE "order" SET status = $3, updated_at = now()
+                WHERE id = $1 AND buyer_id = $2 AND status = $4
+                RETURNING {ORDER_COLUMNS}
+                """,
+                order_id,
+                buyer_id,
+                OrderStatus.CANCELLED.value,
+                OrderStatus.PENDING_PAYMENT.value,
+            )
+            if row:
+                return self._to_entity(row)
+            existing = await connection.fetchrow(
+                'SELECT buyer_id, status FROM "order" WHERE id = $1', order_id
+            )
+
+        if not existing:
+            raise NotFoundError('Order not found')
+        if existing['buyer_id'] != buyer_id:
+            raise ForbiddenError('Only the buyer can cancel this order')
+        if existing['status'] == OrderStatus.PAID.value:
+            raise DomainError('Cannot cancel paid order')
+        if existing['status'] == OrderStatus.CANCELLED.value:
+            raise DomainError('Order already cancelled')
+        raise DomainError('Unable to cancel order')
+
+    async def _fetch_details(
+        self,
+        buyer_id: Optional[int],
+        seller_id: Optional[int],
+        status: Optional[str],
+        created_after: Optional[datetime],
+        created_before: Optional[datetime],
+        after_id: Optional[int],
+        limit: int,
+    ) -> List[dict]:
+        conditions, args = [], []
+        for condition, value in (
+            ('o.buyer_id = ${}', buyer_id),
+            ('o.seller_id = ${}', seller_id),
+            ('o.status = ${}', status),
+            ('o.created_at >= ${}', created_after),
+            ('o.created_at < ${}', created_before),
+            ('o.id > ${}', after_id),
+        ):
+            if value is not None:
+                args.append(value)
+                conditions.append(condition.format(len(args)))
+        args.append(limit)
+        where = f'WHERE {" AND ".join(conditions)} ' if conditions else ''
+        async with self._pool.acquire() as connection:
+            rows = await connection.fetch(
+                SELECT_WITH_DETAILS + f'{where}ORDER BY o.id LIMIT ${len(args)}', *args
+            )
+        return [dict(row) for row in rows]
+
+    @Logger.io
+    async def list_orders_with_details(
+        self,
+        *,
+        buyer_id: Optional[int] = None,
+        seller_id: Optional[int] = None,
+        status: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+    ) -> List[dict]:
+        return await self._fetch_details(
+            buyer_id, seller_id, status, created_after, created_before, after_id, limit
+        )
+
+    @Logger.io(aggregate=True)
+    async def iter_orders_with_details(
+        self,
+        *,
+        buyer_id: Optional[int] = None,
+        seller_id: Optional[int] = None,
+        status: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[dict]:
+        # Keyset chunks, as in the ORM repo: no connection is held between chunks
+        after_id = None
+        while True:
+            chunk = await self._fetch_details(
+                buyer_id, seller_id, status, created_after, created_before, after_id, chunk_size
+            )
+            for row in chunk:
+                yield row
+            if len(chunk) < chunk_size:
+                return
+            after_id = chunk[-1]['id']
@@ -1,18 +1,83 @@
 """Order repository implementation backed by Django ORM."""
 
-from typing import List, Optional
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
 
-from asgiref.sync import sync_to_async
 from django.db import transaction
+from django.db.models import CharField, F, Func, QuerySet, Value
+from django.db.models.functions import Coalesce, NullIf
 from django.utils import timezone
 
 from src.app.interface.i_order_repo import IOrderRepo
 from src.domain.entity.order_entity import Order, OrderStatus
 from src.platform.models.order_model import OrderModel
+from src.platform.database.db_executor import db_executor
 from src.platform.exception.exceptions import DomainError, ForbiddenError, NotFoundError
 from src.platform.logging.loguru_io import Logger
 
 
+UPDATE_ORDER_SQL = (
+    'UPDATE "order" SET buyer_id = %s, seller_id = %s, product_id = %s, price = %s, '
+    'status = %s, updated_at = %s, paid_at = %s WHERE id = %s RETURNING *'
+)
+
+
+def display_name(user_field: str) -> Coalesce:
+    """SQL for ``first_name or email.split('@')[0]`` of the related user."""
+    return Coalesce(
+        NullIf(F(f'{user_field}__first_name'), Value('')),
+        Func(
+            F(f'{user_field}__email'),
+            Value('@'),
+            Value(1),
+            function='SPLIT_PART',
+            output_field=CharField(),
+        ),
+    )
+
+
+def order_filters(
+    buyer_id: Optional[int] = None,
+    seller_id: Optional[int] = None,
+    status: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+) -> dict:
+    filters: dict = {}
+    if buyer_id is not None:
+        filters['buyer_id'] = buyer_id
+    if seller_id is not None:
+        filters['seller_id'] = seller_id
+    if status is not None:
+        filters['status'] = status
+    if created_after is not None:
+        filters['created_at__gte'] = created_after
+    if created_before is not None:
+        filters['created_at__lt'] = created_before
+    return filters
+
+
+def order_details(**filters) -> QuerySet:
+    """Order listing rows as dicts, projected in SQL without model instances."""
+    return (
+        OrderModel.objects.filter(**filters)
+        .order_by('id')
+        .values(
+            'id',
+            'buyer_id',
+            'seller_id',
+            'product_id',
+            'price',
+            'status',
+            'created_at',
+            'paid_at',
+            product_name=F('product__name'),
+            buyer_name=display_name('buyer'),
+            seller_name=display_name('seller'),
+        )
+    )
+
+
 class OrderRepoImpl(IOrderRepo):
     @staticmethod
     def _to_entity(db_order: OrderModel) -> Order:
@@ -32,7 +97,8 @@ class OrderRepoImpl(IOrderRepo):
 
     @Logger.io
     async def create(self, order: Order) -> Order:
-        db_order = await sync_to_async(OrderModel.objects.create)(
+        db_order = await db_executor.run(
+            OrderModel.objects.create,
             buyer_id=order.buyer_id,
             seller_id=order.seller_id,
             product_id=order.product_id,
@@ -46,49 +112,54 @@ class OrderRepoImpl(IOrderRepo):
 
     @Logger.io
     async def get_by_id(self, order_id: int) -> Optional[Order]:
-        db_order = await sync_to_async(OrderModel.objects.filter(id=order_id).first)()
+        db_order = await db_executor.run(OrderModel.objects.filter(id=order_id).first)
         return self._to_entity(db_order) if db_order else None
 
     @Logger.io
     async def get_by_product_id(self, product_id: int) -> Optional[Order]:
-        db_order = await sync_to_async(
+        db_order = await db_executor.run(
             lambda: OrderModel.objects.filter(product_id=product_id)
             .exclude(status=OrderStatus.CANCELLED.value)
             .first()
-        )()
+        )
         return self._to_entity(db_order) if db_order else None
 
     @Logger.io
     async def get_by_buyer(self, buyer_id: int) -> List[Order]:
-        db_orders = await sync_to_async(
+        db_orders = await db_executor.run(
             lambda: list(OrderModel.objects.filter(buyer_id=buyer_id).order_by('id'))
-        )()
+        )
         return [self._to_entity(db_order) for db_order in db_orders]
 
     @Logger.io
     async def get_by_seller(self, seller_id: int) -> List[Order]:
-        db_orders = await sync_to_async(
+        db_orders = await db_executor.run(
             lambda: list(OrderModel.objects.filter(seller_id=seller_id).order_by('id'))
-        )()
+        )
         return [self._to_entity(db_order) for db_order in db_orders]
 
     @Logger.io
     async def update(self, order: Order) -> Order:
         def _update() -> OrderModel | None:
-            updated = OrderModel.objects.filter(id=order.id).update(
-                buyer_id=order.buyer_id,
-                seller_id=order.seller_id,
-                product_id=order.product_id,
-                price=order.price,
-                status=order.status.value,
-                updated_at=order.updated_at,
-                paid_at=order.paid_at,
+            # One round trip: the updated row comes back through RETURNING
+            rows = list(
+                OrderModel.objects.raw(
+                    UPDATE_ORDER_SQL,
+                    [
+                        order.buyer_id,
+                        order.seller_id,
+                        order.product_id,
+                        order.price,
+                        order.status.value,
+                        order.updated_at,
+                        order.paid_at,
+                        order.id,
+                    ],
+                )
             )
-            if not updated:
-                return None
-            return OrderModel.objects.get(id=order.id)
+            return rows[0] if rows else None
 
-        db_order = await sync_to_async(_update)()
+        db_order = await db_executor.run(_update)
         if not db_order:
             raise ValueError(f'Order with id {order.id} not found')
         return self._to_entity(db_order)
@@ -123,67 +194,46 @@ class OrderRepoImpl(IOrderRepo):
                 db_order.save(update_fields=['status', 'updated_at'])
                 return db_order
 
-        db_order = await sync_to_async(_cancel)()
+        db_order = await db_executor.run(_cancel)
         return self._to_entity(db_order)
 
     @Logger.io
-    async def get_buyer_orders_with_details(self, buyer_id: int) -> List[dict]:
-        def _fetch() -> List[OrderModel]:
-            return list(
-                OrderModel.objects.select_related('product', 'buyer', 'seller')
-                .filter(buyer_id=buyer_id)
-                .order_by('id')
-            )
-
-        db_orders = await sync_to_async(_fetch)()
-        return [
-            {
-                'id': db_order.id,
-                'buyer_id': db_order.buyer_id,
-                'seller_id': db_order.seller_id,
-                'product_id': db_order.product_id,
-                'price': db_order.price,
-                'status': db_order.status,
-                'created_at': db_order.created_at,
-                'paid_at': db_order.paid_at,
-                'product_name': getattr(db_order.product, 'name', 'Unknown Product'),
-                'buyer_name': db_order.buyer.first_name or db_order.buyer.email.split('@')[0]
-                if db_order.buyer
-                else 'Unknown Buyer',
-                'seller_name': db_order.seller.first_name or db_order.seller.email.split('@')[0]
-                if db_order.seller
-                else 'Unknown Seller',
-            }
-            for db_order in db_orders
-        ]
-
-    @Logger.io
-    async def get_seller_orders_with_details(self, seller_id: int) -> List[dict]:
-        def _fetch() -> List[OrderModel]:
-            return list(
-                OrderModel.objects.select_related('product', 'buyer', 'seller')
-                .filter(seller_id=seller_id)
-                .order_by('id')
-            )
-
-        db_orders = await sync_to_async(_fetch)()
-        return [
-            {
-                'id': db_order.id,
-                'buyer_id': db_order.buyer_id,
-                'seller_id': db_order.seller_id,
-                'product_id': db_order.product_id,
-                'price': db_order.price,
-                'status': db_order.status,
-                'created_at': db_order.created_at,
-                'paid_at': db_order.paid_at,
-                'product_name': getattr(db_order.product, 'name', 'Unknown Product'),
-                'buyer_name': db_order.buyer.first_name or db_order.buyer.email.split('@')[0]
-                if db_order.buyer
-                else 'Unknown Buyer',
-                'seller_name': db_order.seller.first_name or db_order.seller.email.split('@')[0]
-                if db_order.seller
-                else 'Unknown Seller',
-            }
-            for db_order in db_orders
-        ]
+    async def list_orders_with_details(
+        self,
+        *,
+        buyer_id: Optional[int] = None,
+        seller_id: Optional[int] = None,
+        status: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+    ) -> List[dict]:
+        # Served by the (buyer_id|seller_id, status, id) and (buyer_id|seller_id, id) indexes
+        filters = order_filters(buyer_id, seller_id, status, created_after, created_before)
+        if after_id is not None:
+            filters['id__gt'] = after_id
+
+        return await db_executor.run(lambda: list(order_details(**filters)[:limit]))
+
+    @Logger.io(aggregate=True)
+    async def iter_orders_with_details(
+        self,
+        *,
+        buyer_id: Optional[int] = None,
+        seller_id: Optional[int] = None,
+        status: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[dict]:
+        # Keyset chunks instead of a server-side cursor: no connection or transaction
+        # stays pinned to a slow download, and each chunk may run on any DB worker
+        filters = order_filters(buyer_id, seller_id, status, created_after, created_before)
+        while True:
+            chunk = await db_executor.run(lambda: list(order_details(**filters)[:chunk_size]))
+            for row in chunk:
+                yield row
+            if len(chunk) < chunk_size:
+                return
+            filters['id__gt'] = chunk[-1]['id']
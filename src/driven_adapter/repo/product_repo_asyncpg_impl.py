@@ -0,0 +1,155 @@
+"""Product repository implementation backed by an asyncpg connection pool."""
+
+from typing import List, Optional, Tuple
+
+import asyncpg
+
+from src.app.interface.i_product_repo import IProductRepo
+from src.domain.entity.product_entity import Product, ProductStatus
+from src.domain.entity.user_entity import User
+from src.domain.enum.user_role_enum import UserRole
+from src.platform.database.asyncpg_pool import AsyncpgPool, asyncpg_pool
+from src.platform.exception.exceptions import DomainError
+from src.platform.logging.loguru_io import Logger
+
+
+PRODUCT_COLUMNS = 'id, name, description, price, seller_id, is_active, status'
+
+
+class ProductRepoAsyncpgImpl(IProductRepo):
+    def __init__(self, pool: AsyncpgPool = asyncpg_pool):
+        self._pool = pool
+
+    @staticmethod
+    def _to_entity(row: asyncpg.Record) -> Product:
+        return Product(
+            name=row['name'],
+            description=row['description'],
+            price=row['price'],
+            seller_id=row['seller_id'],
+            is_active=row['is_active'],
+            status=ProductStatus(row['status']),
+            id=row['id'],
+        )
+
+    @Logger.io
+    async def create(self, product: Product) -> Product:
+        async with self._pool.acquire() as connection:
+            row = await connection.fetchrow(
+                f"""
+                INSERT INTO product
+                    (name, description, price, seller_id, is_active, status,
+                     created_at, updated_at)
+                VALUES ($1, $2, $3, $4, $5, $6, now(), now())
+                RETURNING {PRODUCT_COLUMNS}
+                """,
+                product.name,
+                product.description,
+                product.price,
+                product.seller_id,
+                product.is_active,
+                product.status.value,
+            )
+        return self._to_entity(row)
+
+    @Logger.io
+    async def get_by_id(self, product_id: int) -> Optional[Product]:
+        async with self._pool.acquire() as connection:
+            row = await connection.fetchrow(
+                f'SELECT {PRODUCT_COLUMNS} FROM product WHERE id = $1', product_id
+            )
+        return self._to_entity(row) if row else None
+
+    @Logger.io
+    async def get_by_id_with_seller(
+        self, product_id: int
+    ) -> Tuple[Optional[Product], Optional[User]]:
+        async with self._pool.acquire() as connection:
+            row = await connection.fetchrow(
+                """
+                SELECT p.id, p.name, p.description, p.price, p.seller_id, p.is_active,
+                       p.status, u.email AS seller_email, u.role AS seller_role
+                FROM product p
+                LEFT JOIN auth_user u ON u.id = p.seller_id
+                WHERE p.id = $1
+                """,
+                product_id,
+            )
+        if not row:
+            return None, None
+        seller = None
+        if row['seller_email'] is not None:
+            seller = User(
+                id=row['seller_id'],
+                email=row['seller_email'],
+                name=row['seller_email'],
+                role=UserRole(row['seller_role']),
+            )
+        return self._to_entity(row), seller
+
+    @Logger.io
+    async def update(self, product: Product) -> Product:
+        async with self._pool.acquire() as connection:
+            row = await connection.fetchrow(
+                f"""
+                UPDATE product
+                SET name = $2, description = $3, price = $4, is_active = $5, status = $6
+                WHERE id = $1
+                RETURNING {PRODUCT_COLUMNS}
+                """,
+                product.id,
+                product.name,
+                product.description,
+                product.price,
+                product.is_active,
+                product.status.value,
+            )
+        if not row:
+            raise ValueError(f'Product with id {product.id} not found')
+        return self._to_entity(row)
+
+    @Logger.io
+    async def delete(self, product_id: int) -> bool:
+        # ON DELETE CASCADE is emulated by the ORM, not declared on the foreign key
+        async with self._pool.acquire() as connection, connection.transaction():
+            await connection.execute('DELETE FROM "order" WHERE product_id = $1', product_id)
+            status = await connection.execute('DELETE FROM product WHERE id = $1', product_id)
+        return status != 'DELETE 0'
+
+    @Logger.io
+    async def get_by_seller(self, seller_id: int) -> List[Product]:
+        async with self._pool.acquire() as connection:
+            rows = await connection.fetch(
+                f'SELECT {PRODUCT_COLUMNS} FROM product WHERE seller_id = $1 ORDER BY id',
+                seller_id,
+            )
+        return [self._to_entity(row) for row in rows]
+
+    async def list_available(self) -> List[Product]:
+        async with self._pool.acquire() as connection:
+            rows = await connection.fetch(
+                f"""
+                SELECT {PRODUCT_COLUMNS} FROM product
+                WHERE is_active AND status = $1
+                ORDER BY id
+                """,
+                ProductStatus.AVAILABLE.value,
+            )
+        return [self._to_entity(row) for row in rows]
+
+    @Logger.io
+    async def release_product_atomically(self, product_id: int) -> Product:
+        async with self._pool.acquire() as connection:
+            row = await connection.fetchrow(
+                f"""
+                UPDATE product SET status = $2, updated_at = now()
+                WHERE id = $1 AND status = $3
+                RETURNING {PRODUCT_COLUMNS}
+                """,
+                product_id,
+                ProductStatus.AVAILABLE.value,
+                ProductStatus.RESERVED.value,
+            )
+        if not row:
+            raise DomainError('Unable to release product')
+        return self._to_entity(row)
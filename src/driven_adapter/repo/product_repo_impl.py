@@ -2,7 +2,6 @@
 
 from typing import List, Optional, Tuple
 
-from asgiref.sync import sync_to_async
 from django.contrib.auth import get_user_model
 from django.db import transaction
 
@@ -11,12 +10,18 @@ from src.domain.entity.product_entity import Product, ProductStatus
 from src.domain.entity.user_entity import User
 from src.domain.enum.user_role_enum import UserRole
 from src.platform.models.product_model import ProductModel
+from src.platform.database.db_executor import db_executor
 from src.platform.exception.exceptions import DomainError
 from src.platform.logging.loguru_io import Logger
 
 
 UserModel = get_user_model()
 
+UPDATE_PRODUCT_SQL = (
+    'UPDATE product SET name = %s, description = %s, price = %s, is_active = %s, '
+    'status = %s WHERE id = %s RETURNING *'
+)
+
 
 class ProductRepoImpl(IProductRepo):
     @staticmethod
@@ -37,14 +42,14 @@ class ProductRepoImpl(IProductRepo):
         return User(
             id=db_user.id,
             email=db_user.email,
-            # pyrefly: ignore  # bad-argument-type
-            name=getattr(db_user, 'name', db_user.username),
+            name=db_user.email,  # Use email as name since username is None
             role=UserRole(db_user.role),
         )
 
     @Logger.io
     async def create(self, product: Product) -> Product:
-        db_product = await sync_to_async(ProductModel.objects.create)(
+        db_product = await db_executor.run(
+            ProductModel.objects.create,
             name=product.name,
             description=product.description,
             price=product.price,
@@ -56,7 +61,7 @@ class ProductRepoImpl(IProductRepo):
 
     @Logger.io
     async def get_by_id(self, product_id: int) -> Optional[Product]:
-        db_product = await sync_to_async(ProductModel.objects.filter(id=product_id).first)()
+        db_product = await db_executor.run(ProductModel.objects.filter(id=product_id).first)
         return self._to_entity(db_product) if db_product else None
 
     @Logger.io
@@ -66,7 +71,7 @@ class ProductRepoImpl(IProductRepo):
         def _fetch():
             return ProductModel.objects.select_related('seller').filter(id=product_id).first()
 
-        db_product = await sync_to_async(_fetch)()
+        db_product = await db_executor.run(_fetch)
         if not db_product:
             return None, None
         seller_user = db_product.seller
@@ -76,42 +81,47 @@ class ProductRepoImpl(IProductRepo):
     @Logger.io
     async def update(self, product: Product) -> Product:
         def _update() -> ProductModel | None:
-            updated = ProductModel.objects.filter(id=product.id).update(
-                name=product.name,
-                description=product.description,
-                price=product.price,
-                is_active=product.is_active,
-                status=product.status.value,
+            # One round trip: the updated row comes back through RETURNING
+            rows = list(
+                ProductModel.objects.raw(
+                    UPDATE_PRODUCT_SQL,
+                    [
+                        product.name,
+                        product.description,
+                        product.price,
+                        product.is_active,
+                        product.status.value,
+                        product.id,
+                    ],
+                )
             )
-            if not updated:
-                return None
-            return ProductModel.objects.get(id=product.id)
+            return rows[0] if rows else None
 
-        db_product = await sync_to_async(_update)()
+        db_product = await db_executor.run(_update)
         if not db_product:
             raise ValueError(f'Product with id {product.id} not found')
         return self._to_entity(db_product)
 
     @Logger.io
     async def delete(self, product_id: int) -> bool:
-        deleted, _ = await sync_to_async(ProductModel.objects.filter(id=product_id).delete)()
+        deleted, _ = await db_executor.run(ProductModel.objects.filter(id=product_id).delete)
         return deleted > 0
 
     @Logger.io
     async def get_by_seller(self, seller_id: int) -> List[Product]:
-        db_products = await sync_to_async(
+        db_products = await db_executor.run(
             lambda: list(ProductModel.objects.filter(seller_id=seller_id).order_by('id'))
-        )()
+        )
         return [self._to_entity(db_product) for db_product in db_products]
 
     async def list_available(self) -> List[Product]:
-        db_products = await sync_to_async(
+        db_products = await db_executor.run(
             lambda: list(
                 ProductModel.objects.filter(
                     is_active=True, status=ProductStatus.AVAILABLE.value
                 ).order_by('id')
             )
-        )()
+        )
         return [self._to_entity(db_product) for db_product in db_products]
 
     @Logger.io
@@ -130,5 +140,5 @@ class ProductRepoImpl(IProductRepo):
                 db_product.save(update_fields=['status', 'updated_at'])
                 return db_product
 
-        db_product = await sync_to_async(_release)()
+        db_product = await db_executor.run(_release)
         return self._to_entity(db_product)
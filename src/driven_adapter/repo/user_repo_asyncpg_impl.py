@@ -0,0 +1,29 @@
+"""User repository implementation backed by an asyncpg connection pool."""
+
+from typing import Optional
+
+from src.app.interface.i_user_repo import IUserRepo
+from src.domain.entity.user_entity import User
+from src.domain.enum.user_role_enum import UserRole
+from src.platform.database.asyncpg_pool import AsyncpgPool, asyncpg_pool
+from src.platform.logging.loguru_io import Logger
+
+
+class UserRepoAsyncpgImpl(IUserRepo):
+    def __init__(self, pool: AsyncpgPool = asyncpg_pool):
+        self._pool = pool
+
+    @Logger.io
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        async with self._pool.acquire() as connection:
+            row = await connection.fetchrow(
+                'SELECT id, email, role FROM auth_user WHERE id = $1', user_id
+            )
+        if not row:
+            return None
+        return User(
+            id=row['id'],
+            email=row['email'],
+            name=row['email'],  # Use email as name since username is None
+            role=UserRole(row['role']),
+        )
@@ -2,12 +2,12 @@
 
 from typing import Optional
 
-from asgiref.sync import sync_to_async
 from django.contrib.auth import get_user_model
 
 from src.app.interface.i_user_repo import IUserRepo
 from src.domain.entity.user_entity import User
 from src.domain.enum.user_role_enum import UserRole
+from src.platform.database.db_executor import db_executor
 from src.platform.logging.loguru_io import Logger
 
 
@@ -26,7 +26,7 @@ class UserRepoImpl(IUserRepo):
 
     @Logger.io
     async def get_by_id(self, user_id: int) -> Optional[User]:
-        db_user = await sync_to_async(UserModel.objects.filter(id=user_id).first)()
+        db_user = await db_executor.run(UserModel.objects.filter(id=user_id).first)
         if not db_user:
             return None
         return self._to_entity(db_user)
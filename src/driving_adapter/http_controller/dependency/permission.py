@@ -1,8 +1,11 @@
-"""Django Ninja permissions based on Django groups."""
+"""Django Ninja permissions based on Django groups and the superuser flag."""
+
+import hmac
 
 from django.http import HttpRequest
 from ninja_extra.permissions import BasePermission
 
+from src.platform.config.env_config import env_config
 from src.platform.exception.exceptions import ForbiddenError
 
 
@@ -35,3 +38,26 @@ class IsSeller(BasePermission):
         if not request.user.groups.filter(name='seller').exists():
             raise ForbiddenError('Only sellers can perform this action')
         return True
+
+
+class IsAdmin(BasePermission):
+    """Permission to check if user is a superuser."""
+
+    def has_permission(self, request: HttpRequest, controller) -> bool:
+        if not request.user or not request.user.is_authenticated:
+            raise ForbiddenError('Authentication required')
+        if not request.user.is_superuser:
+            raise ForbiddenError('Only admins can perform this action')
+        return True
+
+
+class IsAdminOrMetricsScraper(IsAdmin):
+    """Permission for admins, or for a scraper presenting METRICS_SCRAPE_TOKEN."""
+
+    def has_permission(self, request: HttpRequest, controller) -> bool:
+        token = env_config.METRICS_SCRAPE_TOKEN
+        scheme, _, credentials = request.headers.get('Authorization', '').partition(' ')
+        if token and scheme.lower() == 'bearer':
+            if hmac.compare_digest(credentials.encode(), token.get_secret_value().encode()):
+                return True
+        return super().has_permission(request, controller)
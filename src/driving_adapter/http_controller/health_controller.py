@@ -0,0 +1,35 @@
+"""Readiness probe reporting database reachability and connection pool statistics."""
+
+from django.db import DatabaseError
+from django.http import HttpRequest, JsonResponse
+from ninja_extra import ControllerBase, api_controller, http_get
+
+from src.platform.database.db_executor import db_executor
+from src.platform.database.db_pool import check_database, pool_stats, ready
+from src.platform.logging.loguru_io_config import custom_logger
+
+
+@api_controller('/health', tags=['health'])
+class HealthController(ControllerBase):
+    # Not wrapped by Logger.io: probes arrive every few seconds
+    @http_get('/ready', include_in_schema=False)
+    async def get_readiness(self, request: HttpRequest):
+        if not ready.is_set():
+            return JsonResponse({'status': 'not_ready'}, status=503)
+        try:
+            await db_executor.run(check_database)
+        except DatabaseError as e:
+            # The probe is unauthenticated: driver messages name hosts, users and SQL
+            custom_logger.warning(f'Readiness check failed, database unavailable: {e}')
+            return JsonResponse({'status': 'database_unavailable'}, status=503)
+        return JsonResponse(
+            {
+                'status': 'ready',
+                'db_pool': pool_stats(),
+                'db_executor': {
+                    'workers': db_executor.max_workers,
+                    'queued': db_executor.queued,
+                    'in_flight': db_executor.in_flight,
+                },
+            }
+        )
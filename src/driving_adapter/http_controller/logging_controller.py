@@ -0,0 +1,30 @@
+"""Admin controller changing log levels and Logger.io tracing at runtime."""
+
+from django.http import HttpRequest
+from ninja_extra import ControllerBase, api_controller, http_get, http_put
+
+from src.driving_adapter.http_controller.dependency.permission import IsAdmin
+from src.driving_adapter.http_controller.schema.logging_schema import (
+    LogSettingsRequest,
+    LogSettingsResponse,
+)
+from src.platform.exception.exceptions import DomainError
+from src.platform.logging.log_control import apply_log_settings, log_settings
+from src.platform.logging.loguru_io import Logger
+
+
+@api_controller('/logging', tags=['logging'], permissions=[IsAdmin])
+class LoggingController(ControllerBase):
+    @http_get('/settings', response=LogSettingsResponse)
+    def get_settings(self, request: HttpRequest):
+        return log_settings()
+
+    @http_put('/settings', response=LogSettingsResponse)
+    def update_settings(self, request: HttpRequest, payload: LogSettingsRequest):
+        try:
+            apply_log_settings(payload.levels, payload.tracing)
+        except ValueError as e:
+            raise DomainError(str(e), 400)
+        settings = log_settings()
+        Logger.base.info(f'Log settings changed by {request.user}: {settings}')
+        return settings
@@ -0,0 +1,18 @@
+"""Metrics controller serving process metrics in the Prometheus text format."""
+
+from django.http import HttpRequest, HttpResponse
+from ninja_extra import ControllerBase, api_controller, http_get
+
+from src.driving_adapter.http_controller.dependency.permission import IsAdminOrMetricsScraper
+from src.platform.metrics.registry import metrics_registry
+
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+@api_controller('/metrics', tags=['metrics'], permissions=[IsAdminOrMetricsScraper])
+class MetricsController(ControllerBase):
+    # Not wrapped by Logger.io: scrapes would otherwise show up in the metrics they read
+    @http_get('/', include_in_schema=False)
+    def get_metrics(self, request: HttpRequest):
+        return HttpResponse(metrics_registry.render(), content_type=PROMETHEUS_CONTENT_TYPE)
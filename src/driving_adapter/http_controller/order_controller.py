@@ -1,20 +1,24 @@
 """Order controller implemented with Django Ninja Extra."""
 
-from typing import Any, Optional
+from datetime import datetime
+import json
+from typing import Any, AsyncIterator, Optional
 
-from django.http import HttpRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpRequest, StreamingHttpResponse
 from injector import inject
 from ninja_extra import ControllerBase, api_controller, http_delete, http_get, http_post
 
 from src.app.use_case.order.cancel_order_use_case import CancelOrderUseCase
 from src.app.use_case.order.create_order_use_case import CreateOrderUseCase
 from src.app.use_case.order.get_order_use_case import GetOrderUseCase
-from src.app.use_case.order.list_order_use_case import ListOrdersUseCase
+from src.app.use_case.order.list_order_use_case import DEFAULT_PAGE_SIZE, ListOrdersUseCase
 from src.app.use_case.order.mock_order_payment_use_case import MockOrderPaymentUseCase
 from src.domain.enum.user_role_enum import UserRole
 from src.driving_adapter.http_controller.dependency.permission import IsAuthenticated, IsBuyer
 from src.driving_adapter.http_controller.schema.order_schema import (
     OrderCreateRequest,
+    OrderPageResponse,
     OrderResponse,
     PaymentRequest,
     PaymentResponse,
@@ -36,6 +40,26 @@ def _build_order_response(order) -> OrderResponse:
     )
 
 
+NDJSON_CONTENT_TYPE = 'application/x-ndjson'
+NDJSON_LINES_PER_WRITE = 500
+
+
+@Logger.io(aggregate=True)
+async def _ndjson_lines(orders: AsyncIterator[dict[str, Any]]) -> AsyncIterator[bytes]:
+    """One JSON document per line, sent in batches to keep ASGI messages few.
+
+    Traced in aggregate so each export logs the size of the body actually sent.
+    """
+    lines = []
+    async for order in orders:
+        lines.append(json.dumps(order, cls=DjangoJSONEncoder))
+        if len(lines) >= NDJSON_LINES_PER_WRITE:
+            yield ('\n'.join(lines) + '\n').encode()
+            lines = []
+    if lines:
+        yield ('\n'.join(lines) + '\n').encode()
+
+
 @api_controller('/order', tags=['order'])
 class OrderController(ControllerBase):
     @inject
@@ -69,25 +93,61 @@ class OrderController(ControllerBase):
 
         return self.create_response(_build_order_response(order), status_code=201)
 
-    @http_get('/my-orders', response=list[dict[str, Any]], permissions=[IsAuthenticated])
+    @http_get('/my-orders', response=OrderPageResponse, permissions=[IsAuthenticated])
     @Logger.io
-    async def list_my_orders(self, request: HttpRequest):
-        # Extract order_status from query parameters manually
-        order_status_raw = request.GET.get('order_status')
-        order_status: Optional[str] = str(order_status_raw) if order_status_raw else None
-
+    async def list_my_orders(
+        self,
+        request: HttpRequest,
+        order_status: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ):
         user = request.user
         role = getattr(user, 'role', UserRole.BUYER.value)
+        filters = {
+            'status': order_status,
+            'cursor': cursor,
+            'limit': limit,
+            'created_after': created_after,
+            'created_before': created_before,
+        }
 
         if role == UserRole.BUYER.value:
             if user.id is None:
                 raise DomainError('Authenticated user ID cannot be None')
-            return await self.list_orders_use_case.list_buyer_orders(user.id, order_status)
+            return await self.list_orders_use_case.list_buyer_orders(user.id, **filters)
         if role == UserRole.SELLER.value:
             if user.id is None:
                 raise DomainError('Authenticated user ID cannot be None')
-            return await self.list_orders_use_case.list_seller_orders(user.id, order_status)
-        return []
+            return await self.list_orders_use_case.list_seller_orders(user.id, **filters)
+        return {'items': [], 'next_cursor': None}
+
+    @http_get('/export', permissions=[IsAuthenticated])
+    @Logger.io
+    async def export_orders(
+        self,
+        request: HttpRequest,
+        order_status: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ):
+        user = request.user
+        if user.id is None:
+            raise DomainError('Authenticated user ID cannot be None')
+        owner = 'seller_id' if getattr(user, 'role', None) == UserRole.SELLER.value else 'buyer_id'
+        orders = self.list_orders_use_case.export_orders(
+            **{owner: user.id},
+            status=order_status,
+            created_after=created_after,
+            created_before=created_before,
+        )
+        return StreamingHttpResponse(
+            _ndjson_lines(orders),
+            content_type=NDJSON_CONTENT_TYPE,
+            headers={'Content-Disposition': 'attachment; filename="orders.ndjson"'},
+        )
 
     @http_get('/{order_id}', response=OrderResponse, permissions=[IsAuthenticated])
     @Logger.io
@@ -117,9 +177,23 @@ class OrderController(ControllerBase):
         await self.cancel_order_use_case.cancel(order_id=order_id, buyer_id=buyer.id)
         return self.create_response(None, status_code=204)
 
-    @http_get('/seller/{seller_id}', response=list[dict[str, Any]], permissions=[IsAuthenticated])
+    @http_get('/seller/{seller_id}', response=OrderPageResponse, permissions=[IsAuthenticated])
     @Logger.io
     async def list_seller_orders(
-        self, request: HttpRequest, seller_id: int, order_status: Optional[str] = None
+        self,
+        request: HttpRequest,
+        seller_id: int,
+        order_status: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
     ):
-        return await self.list_orders_use_case.list_seller_orders(seller_id, order_status)
+        return await self.list_orders_use_case.list_seller_orders(
+            seller_id,
+            status=order_status,
+            cursor=cursor,
+            limit=limit,
+            created_after=created_after,
+            created_before=created_before,
+        )
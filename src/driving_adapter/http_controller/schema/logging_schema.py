@@ -0,0 +1,21 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class LogSettingsRequest(BaseModel):
+    levels: dict[str, str] = Field(default_factory=dict)
+    tracing: dict[str, Optional[bool]] = Field(default_factory=dict)
+
+    class Config:
+        json_schema_extra = {
+            'example': {
+                'levels': {'stdout': 'INFO'},
+                'tracing': {'src.driven_adapter': False, 'order_use_case.py::': True},
+            }
+        }
+
+
+class LogSettingsResponse(BaseModel):
+    levels: dict[str, str | int]
+    tracing: dict[str, bool]
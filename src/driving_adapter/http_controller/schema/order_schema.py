@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import BaseModel
 
@@ -82,3 +82,30 @@ class PaymentResponse(BaseModel):
                 'paid_at': '2025-10-09T12:30:00',
             }
         }
+
+
+class OrderPageResponse(BaseModel):
+    items: list[dict[str, Any]]
+    next_cursor: Optional[str]
+
+    class Config:
+        json_schema_extra = {
+            'example': {
+                'items': [
+                    {
+                        'id': 1,
+                        'buyer_id': 3,
+                        'seller_id': 2,
+                        'product_id': 1,
+                        'price': 35900,
+                        'status': 'paid',
+                        'created_at': '2025-10-09T12:00:00',
+                        'paid_at': '2025-10-09T12:30:00',
+                        'product_name': 'iPhone 18',
+                        'buyer_name': 'buyer',
+                        'seller_name': 'seller',
+                    }
+                ],
+                'next_cursor': 'MQ',
+            }
+        }
@@ -2,6 +2,9 @@
 
 from ninja_extra import NinjaExtraAPI
 
+from src.driving_adapter.http_controller.health_controller import HealthController
+from src.driving_adapter.http_controller.logging_controller import LoggingController
+from src.driving_adapter.http_controller.metrics_controller import MetricsController
 from src.driving_adapter.http_controller.order_controller import OrderController
 from src.driving_adapter.http_controller.product_controller import ProductController
 from src.driving_adapter.http_controller.user_controller import UserController
@@ -12,5 +15,12 @@ from src.platform.exception.exception_handler import setup_exception_handlers
 api = NinjaExtraAPI()
 
 # Register controllers
-api.register_controllers(UserController, ProductController, OrderController)
+api.register_controllers(
+    UserController,
+    ProductController,
+    OrderController,
+    MetricsController,
+    LoggingController,
+    HealthController,
+)
 setup_exception_handlers(api)
@@ -12,7 +12,15 @@ import django  # noqa: E402
 from django.core.asgi import get_asgi_application  # noqa: E402
 import uvicorn  # noqa: E402
 
+from src.platform.database.asyncpg_pool import asyncpg_pool  # noqa: E402
+from src.platform.database.db_executor import db_executor  # noqa: E402
+from src.platform.database.db_pool import close_db_pool, open_db_pool, ready  # noqa: E402
+from src.platform.logging.log_control import (  # noqa: E402
+    install_reload_signal,
+    remove_reload_signal,
+)
 from src.platform.logging.loguru_io import Logger  # noqa: E402
+from src.platform.logging.loguru_io_config import stdout_writer  # noqa: E402
 
 
 django.setup()
@@ -24,15 +32,31 @@ shutdown_event = asyncio.Event()
 @asynccontextmanager
 async def app_lifespan() -> AsyncGenerator[None, None]:
     """Manage startup and shutdown routines for the application lifecycle."""
+    loop = asyncio.get_running_loop()
     try:
         Logger.base.info('Application starting up...')
+        # kill -USR1 <pid> reloads log levels and tracing from LOG_CONTROL_FILE
+        install_reload_signal(loop)
+        # Connect min_size pooled connections before reporting ready
+        try:
+            await asyncio.to_thread(open_db_pool)
+        except Exception as e:  # The pool keeps connecting; readiness reports the database
+            Logger.base.warning(f'Database pool not filled at startup: {e}')
+        ready.set()
         yield
     except asyncio.CancelledError:
         Logger.base.info('Application startup cancelled')
         raise
     finally:
         Logger.base.info('Application shutting down...')
+        ready.clear()
         shutdown_event.set()
+        remove_reload_signal(loop)
+        await asyncpg_pool.close()
+        await asyncio.to_thread(db_executor.shutdown)
+        await asyncio.to_thread(close_db_pool)
+        # Flush queued console lines before the worker exits
+        await asyncio.to_thread(stdout_writer.drain, 5.0)
 
 
 async def lifespan(
@@ -16,9 +16,13 @@ from src.app.use_case.product.delete_product_use_case import DeleteProductUseCas
 from src.app.use_case.product.get_product_use_case import GetProductUseCase
 from src.app.use_case.product.list_product_use_case import ListProductUseCase
 from src.app.use_case.product.update_product_use_case import UpdateProductUseCase
+from src.driven_adapter.repo.order_repo_asyncpg_impl import OrderRepoAsyncpgImpl
 from src.driven_adapter.repo.order_repo_impl import OrderRepoImpl
+from src.driven_adapter.repo.product_repo_asyncpg_impl import ProductRepoAsyncpgImpl
 from src.driven_adapter.repo.product_repo_impl import ProductRepoImpl
+from src.driven_adapter.repo.user_repo_asyncpg_impl import UserRepoAsyncpgImpl
 from src.driven_adapter.repo.user_repo_impl import UserRepoImpl
+from src.platform.config.env_config import env_config
 from src.platform.notification.mock_email_dispatcher import (
     MockEmailDispatcher,
     get_mock_email_dispatcher,
@@ -26,7 +30,13 @@ from src.platform.notification.mock_email_dispatcher import (
 
 
 class CoreInfrastructureModule(Module):
-    """Provide core infrastructure dependencies."""
+    """Provide core infrastructure dependencies.
+
+    Repositories use the Django ORM unless REPO_BACKEND is 'asyncpg'.
+    """
+
+    def __init__(self, repo_backend: str = env_config.REPO_BACKEND):
+        self.repo_backend = repo_backend
 
     @singleton
     @provider
@@ -37,16 +47,22 @@ class CoreInfrastructureModule(Module):
     @singleton
     @provider
     def provide_user_repo(self) -> IUserRepo:
+        if self.repo_backend == 'asyncpg':
+            return UserRepoAsyncpgImpl()
         return UserRepoImpl()
 
     @singleton
     @provider
     def provide_product_repo(self) -> IProductRepo:
+        if self.repo_backend == 'asyncpg':
+            return ProductRepoAsyncpgImpl()
         return ProductRepoImpl()
 
     @singleton
     @provider
     def provide_order_repo(self) -> IOrderRepo:
+        if self.repo_backend == 'asyncpg':
+            return OrderRepoAsyncpgImpl()
         return OrderRepoImpl()
 
 
@@ -1,4 +1,6 @@
 from pathlib import Path
+from typing import Literal
+from urllib.parse import quote
 
 from pydantic import SecretStr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -26,6 +28,26 @@ class ENV_CONFIG(BaseSettings):
     POSTGRES_DB: str
     POSTGRES_PORT: int
 
+    # ORM repositories run on DB_EXECUTOR_WORKERS threads, each with its own connection
+    # kept open for DB_CONN_MAX_AGE seconds
+    DB_EXECUTOR_WORKERS: int = 8
+    DB_CONN_MAX_AGE: int = 60
+
+    # Pooled profile (psycopg[pool]): connections come from a shared pool instead
+    DB_POOL: bool = False
+    DB_POOL_MIN_SIZE: int = 2
+    DB_POOL_MAX_SIZE: int = 10
+    DB_POOL_MAX_LIFETIME: float = 1800.0
+    DB_POOL_TIMEOUT: float = 10.0
+
+    # Repository implementations: 'orm' (Django ORM) or 'asyncpg' (native async pool)
+    REPO_BACKEND: Literal['orm', 'asyncpg'] = 'orm'
+    ASYNCPG_POOL_MIN_SIZE: int = 2
+    ASYNCPG_POOL_MAX_SIZE: int = 10
+
+    # Bearer token Prometheus sends to /metrics; unset, only admins may read metrics
+    METRICS_SCRAPE_TOKEN: SecretStr | None = None
+
     BACKEND_CORS_ORIGINS: list[str] = []
 
     @field_validator('BACKEND_CORS_ORIGINS', mode='before')
@@ -39,10 +61,12 @@ class ENV_CONFIG(BaseSettings):
 
     @property
     def DATABASE_URL_SYNC(self) -> str:
-        """Django ORM 使用"""
-        password = self.POSTGRES_PASSWORD.get_secret_value()
+        """Django ORM 與 asyncpg 使用"""
+        # Credentials are percent-encoded so '@', ':' or '/' in them keep the URL intact
+        user = quote(self.POSTGRES_USER, safe='')
+        password = quote(self.POSTGRES_PASSWORD.get_secret_value(), safe='')
         return (
-            f'postgresql://{self.POSTGRES_USER}:{password}'
+            f'postgresql://{user}:{password}'
             f'@{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}'
         )
 
@@ -78,11 +78,25 @@ DATABASES = {
         'PASSWORD': env_config.POSTGRES_PASSWORD.get_secret_value(),
         'HOST': env_config.POSTGRES_SERVER,
         'PORT': env_config.POSTGRES_PORT,
+        # CONN_MAX_AGE stays 0: under ASGI only the DB executor workers (db_executor.py)
+        # keep persistent connections, for DB_CONN_MAX_AGE seconds
+        'CONN_HEALTH_CHECKS': True,
         # TODO: Enable SSL in production
         # 'OPTIONS': {'sslmode': 'require'},
     }
 }
 
+if env_config.DB_POOL:
+    # psycopg 3 native pool; CONN_HEALTH_CHECKS pings each connection on checkout
+    DATABASES['default']['OPTIONS'] = {
+        'pool': {
+            'min_size': env_config.DB_POOL_MIN_SIZE,
+            'max_size': env_config.DB_POOL_MAX_SIZE,
+            'max_lifetime': env_config.DB_POOL_MAX_LIFETIME,
+            'timeout': env_config.DB_POOL_TIMEOUT,
+        },
+    }
+
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
     {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator'},
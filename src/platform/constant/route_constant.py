@@ -31,3 +31,16 @@ ORDER_GET = f'{ORDER_BASE}/{{order_id}}'
 ORDER_PAY = f'{ORDER_BASE}/{{order_id}}/pay'
 ORDER_CANCEL = f'{ORDER_BASE}/{{order_id}}'
 ORDER_MY_ORDERS = f'{ORDER_BASE}/my-orders'
+ORDER_EXPORT = f'{ORDER_BASE}/export'
+
+# Metrics routes
+METRICS_BASE = '/metrics'
+METRICS_GET = f'{METRICS_BASE}/'
+
+# Health routes
+HEALTH_BASE = '/health'
+HEALTH_READY = f'{HEALTH_BASE}/ready'
+
+# Logging control routes
+LOGGING_BASE = '/logging'
+LOGGING_SETTINGS = f'{LOGGING_BASE}/settings'
@@ -0,0 +1,87 @@
+"""asyncpg connection pool for the native async repository implementations."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import asyncpg
+
+from src.platform.config.env_config import env_config
+
+
+class AsyncpgPool:
+    """Lazily created asyncpg pool bound to the running event loop.
+
+    asyncpg pools cannot be shared across event loops, so the pool is created on
+    the first ``acquire`` inside a loop and re-created when a different loop (a new
+    test, a management command) asks for a connection. A replaced or closed pool is
+    closed on its own loop while that loop runs, and terminated once it has stopped.
+    Each connection caches the prepared statements of the queries it runs, so
+    repeated repository queries skip parsing and planning after their first
+    execution on that connection.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        min_size: int = 2,
+        max_size: int = 10,
+        statement_cache_size: int = 256,
+    ):
+        self._dsn = dsn
+        self._min_size = min_size
+        self._max_size = max_size
+        self._statement_cache_size = statement_cache_size
+        self._pool: Optional[asyncpg.Pool] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def get(self) -> asyncpg.Pool:
+        loop = asyncio.get_running_loop()
+        if self._pool is not None and self._loop is loop:
+            return self._pool
+        if self._loop is not loop:
+            stale, stale_loop = self._pool, self._loop
+            self._pool, self._loop, self._lock = None, loop, asyncio.Lock()
+            await self._close(stale, stale_loop)
+        async with self._lock:
+            if self._pool is None:
+                self._pool = await asyncpg.create_pool(
+                    self._dsn,
+                    min_size=self._min_size,
+                    max_size=self._max_size,
+                    statement_cache_size=self._statement_cache_size,
+                )
+        return self._pool
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[asyncpg.Connection]:
+        pool = await self.get()
+        async with pool.acquire() as connection:
+            yield connection
+
+    async def close(self) -> None:
+        pool, self._pool = self._pool, None
+        await self._close(pool, self._loop)
+
+    @staticmethod
+    async def _close(
+        pool: Optional[asyncpg.Pool], loop: Optional[asyncio.AbstractEventLoop]
+    ) -> None:
+        if pool is None:
+            return
+        if loop is asyncio.get_running_loop():
+            await pool.close()
+        elif loop is not None and loop.is_running():
+            # A pool only works on its own loop: close it there and wait for that here
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(pool.close(), loop))
+        else:
+            # Nothing can await a close on a stopped loop; drop the connections instead
+            pool.terminate()
+
+
+asyncpg_pool = AsyncpgPool(
+    env_config.DATABASE_URL_SYNC,
+    min_size=env_config.ASYNCPG_POOL_MIN_SIZE,
+    max_size=env_config.ASYNCPG_POOL_MAX_SIZE,
+)
@@ -0,0 +1,143 @@
+"""Thread pool running blocking ORM work off the event loop.
+
+``sync_to_async`` defaults to ``thread_sensitive=True``, which runs every call of
+the process on one shared thread, so concurrent requests wait for each other's
+queries. ``DBExecutor`` runs them on a fixed set of worker threads instead. Django
+connections are per thread, so each worker keeps its own connection open between
+jobs for up to ``conn_max_age`` seconds; ``close_old_connections`` runs around every
+job to drop expired or broken ones, as Django does around each request.
+
+Only the workers get persistent connections. The ASGI handler runs each request's
+sync code (sessions, auth) on a thread of its own, so a project-wide CONN_MAX_AGE
+would leave one open connection behind per request thread; those keep Django's
+default of closing when the request finishes.
+
+Work inside one job shares a connection, so ``transaction.atomic`` blocks must be
+entered and left within a single job.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+import threading
+from time import perf_counter
+from typing import Any, Callable, Iterator, TypeVar
+
+from django.db import close_old_connections, connections
+
+from src.platform.config.env_config import env_config
+from src.platform.metrics.histogram import Histogram, format_value
+from src.platform.metrics.registry import metrics_registry
+
+
+T = TypeVar('T')
+
+QUEUE_DEPTH_METRIC = 'db_executor_queue_depth'
+IN_FLIGHT_METRIC = 'db_executor_in_flight'
+WORKERS_METRIC = 'db_executor_workers'
+WAIT_METRIC = 'db_executor_wait_seconds'
+RUN_METRIC = 'db_executor_run_seconds'
+
+
+class DBExecutor:
+    """Runs sync callables on dedicated DB worker threads from async code.
+
+    ``run`` copies the caller's context into the worker, so context variables such
+    as the Logger.io call chain stay visible to the ORM's own logging. Queue depth,
+    in-flight jobs, queue wait and run time are exported through the metrics endpoint.
+    """
+
+    def __init__(self, max_workers: int = 8, name: str = 'db-executor', conn_max_age: int = 0):
+        self.max_workers = max_workers
+        self.conn_max_age = conn_max_age
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=name, initializer=self._init_worker
+        )
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.in_flight = 0
+        self.wait_time = Histogram()
+        self.run_time = Histogram()
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        context = contextvars.copy_context()
+        # Emptied by whichever comes first: the worker starting the job, or the future
+        # finishing without it (cancelled while queued, or dropped by shutdown)
+        pending = [True]
+        with self._lock:
+            self.queued += 1
+        future = self._executor.submit(
+            self._call, context, pending, perf_counter(), func, args, kwargs
+        )
+        future.add_done_callback(lambda _: self._settle(pending))
+        return await asyncio.wrap_future(future)
+
+    def _init_worker(self) -> None:
+        # Connection handlers are per thread: the override stays on this worker
+        if self.conn_max_age:
+            for connection in connections.all():
+                connection.settings_dict = {
+                    **connection.settings_dict,
+                    'CONN_MAX_AGE': self.conn_max_age,
+                }
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _leave_queue(self, pending: list[bool]) -> None:
+        # Caller holds self._lock; a job leaves the queue only once
+        if pending:
+            pending.pop()
+            self.queued -= 1
+
+    def _settle(self, pending: list[bool]) -> None:
+        with self._lock:
+            self._leave_queue(pending)
+
+    def _call(
+        self,
+        context: contextvars.Context,
+        pending: list[bool],
+        submitted_at: float,
+        func: Callable[..., T],
+        args: tuple,
+        kwargs: dict,
+    ) -> T:
+        started_at = perf_counter()
+        with self._lock:
+            self._leave_queue(pending)
+            self.in_flight += 1
+        self.wait_time.observe(started_at - submitted_at)
+        close_old_connections()
+        try:
+            return context.run(func, *args, **kwargs)
+        finally:
+            close_old_connections()
+            self.run_time.observe(perf_counter() - started_at)
+            with self._lock:
+                self.in_flight -= 1
+
+    def collect(self) -> Iterator[str]:
+        for metric, help_text, value in (
+            (QUEUE_DEPTH_METRIC, 'DB jobs waiting for a worker.', self.queued),
+            (IN_FLIGHT_METRIC, 'DB jobs running on a worker.', self.in_flight),
+            (WORKERS_METRIC, 'DB worker threads.', self.max_workers),
+        ):
+            yield f'# HELP {metric} {help_text}'
+            yield f'# TYPE {metric} gauge'
+            yield f'{metric} {format_value(value)}'
+        for metric, help_text, histogram in (
+            (WAIT_METRIC, 'Time DB jobs waited for a worker.', self.wait_time),
+            (RUN_METRIC, 'Time DB jobs ran on a worker.', self.run_time),
+        ):
+            yield f'# HELP {metric} {help_text}'
+            yield f'# TYPE {metric} histogram'
+            yield from histogram.render(metric, {})
+
+
+db_executor = DBExecutor(
+    max_workers=env_config.DB_EXECUTOR_WORKERS,
+    # The pooled profile hands connections back to the pool after every job instead
+    conn_max_age=0 if env_config.DB_POOL else env_config.DB_CONN_MAX_AGE,
+)
+metrics_registry.register('db_executor', db_executor.collect)
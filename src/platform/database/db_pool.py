@@ -0,0 +1,97 @@
+"""psycopg 3 connection pool of the Django ORM: lifecycle, readiness and statistics.
+
+With DB_POOL enabled, settings configure Django 5.1's native pool (``OPTIONS['pool']``,
+which needs ``psycopg[pool]``). Django creates the pool lazily on the first query,
+so the ASGI lifespan opens it at startup to have ``min_size`` connections ready
+before traffic arrives, and closes it at shutdown. Without DB_POOL these functions
+are no-ops and the pool statistics are empty.
+"""
+
+import threading
+from typing import Any, Iterator, Optional
+
+from django.db import connections
+
+from src.platform.metrics.histogram import format_labels, format_value
+from src.platform.metrics.registry import metrics_registry
+
+
+CONNECTIONS_METRIC = 'db_pool_connections'
+MAX_SIZE_METRIC = 'db_pool_max_size'
+WAITING_METRIC = 'db_pool_requests_waiting'
+REQUESTS_METRIC = 'db_pool_requests_total'
+WAIT_METRIC = 'db_pool_wait_seconds_total'
+TIMEOUTS_METRIC = 'db_pool_timeouts_total'
+LOST_METRIC = 'db_pool_connections_lost_total'
+
+# Set by the ASGI lifespan between startup and shutdown
+ready = threading.Event()
+
+
+def db_pool(alias: str = 'default') -> Optional[Any]:
+    """The alias' psycopg_pool.ConnectionPool, or None when pooling is off."""
+    return getattr(connections[alias], 'pool', None)
+
+
+def open_db_pool(alias: str = 'default', timeout: float = 30.0) -> bool:
+    """Open the pool and wait for ``min_size`` connections; blocking, run it in a thread."""
+    pool = db_pool(alias)
+    if pool is None:
+        return False
+    pool.open(wait=True, timeout=timeout)
+    return True
+
+
+def close_db_pool(alias: str = 'default') -> None:
+    if db_pool(alias) is not None:
+        connections[alias].close_pool()
+
+
+def check_database(alias: str = 'default') -> None:
+    """Round trip to the database; raises when it is unreachable. Blocking."""
+    with connections[alias].cursor() as cursor:
+        cursor.execute('SELECT 1')
+
+
+def pool_stats(alias: str = 'default') -> dict[str, float]:
+    """In use / idle connections, waiting requests and cumulative wait and timeout counts."""
+    pool = db_pool(alias)
+    if pool is None:
+        return {}
+    stats = pool.get_stats()
+    size = stats.get('pool_size', 0)
+    idle = stats.get('pool_available', 0)
+    return {
+        'in_use': size - idle,
+        'idle': idle,
+        'max_size': stats.get('pool_max', pool.max_size),
+        'waiting': stats.get('requests_waiting', 0),
+        'requests': stats.get('requests_num', 0),
+        'wait_seconds': stats.get('requests_wait_ms', 0) / 1000,
+        'timeouts': stats.get('requests_errors', 0),
+        'connections_lost': stats.get('connections_lost', 0),
+    }
+
+
+def collect() -> Iterator[str]:
+    stats = pool_stats()
+    if not stats:
+        return
+    yield f'# HELP {CONNECTIONS_METRIC} Pooled DB connections by state.'
+    yield f'# TYPE {CONNECTIONS_METRIC} gauge'
+    for state in ('in_use', 'idle'):
+        yield f'{CONNECTIONS_METRIC}{format_labels({"state": state})} {stats[state]}'
+    for metric, metric_type, help_text, key in (
+        (MAX_SIZE_METRIC, 'gauge', 'Maximum pooled DB connections.', 'max_size'),
+        (WAITING_METRIC, 'gauge', 'Requests waiting for a pooled connection.', 'waiting'),
+        (REQUESTS_METRIC, 'counter', 'Connection requests served by the pool.', 'requests'),
+        (WAIT_METRIC, 'counter', 'Time spent waiting for a pooled connection.', 'wait_seconds'),
+        (TIMEOUTS_METRIC, 'counter', 'Connection requests that timed out or failed.', 'timeouts'),
+        (LOST_METRIC, 'counter', 'Pooled connections found broken.', 'connections_lost'),
+    ):
+        yield f'# HELP {metric} {help_text}'
+        yield f'# TYPE {metric} {metric_type}'
+        yield f'{metric} {format_value(stats[key])}'
+
+
+metrics_registry.register('db_pool', collect)
@@ -0,0 +1,108 @@
+"""Background writer turning a blocking stream into a non-blocking loguru sink."""
+
+from collections import deque
+from enum import StrEnum
+import threading
+from typing import Optional, TextIO
+
+
+class OverflowPolicy(StrEnum):
+    DROP_OLDEST = 'drop_oldest'  # Never block the caller; the oldest queued line is lost
+    BLOCK = 'block'  # Wait for the writer thread to make room
+
+
+class BackgroundStreamWriter:
+    """Queues formatted records and writes them from a dedicated thread in batches.
+
+    Loguru calls ``write`` on the thread that logs, so a plain stream sink blocks the
+    event loop on every terminal or pipe write. Here ``write`` only appends to a
+    bounded queue; the writer thread joins everything queued (up to ``batch_size``
+    records) into a single ``write()`` followed by one ``flush()``. Records dropped
+    by the overflow policy are reported in the next batch. ``isatty`` is forwarded
+    so loguru keeps colorizing terminals. There is deliberately no ``stop``: loguru
+    calls it whenever the handler is removed, and handlers are re-added to change
+    their level. The owner calls ``close`` at exit, which drains the queue first.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        *,
+        max_queue: int = 10_000,
+        batch_size: int = 1_000,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        name: str = 'log-writer',
+    ):
+        self._stream = stream
+        self._max_queue = max_queue
+        self._batch_size = batch_size
+        self._overflow = OverflowPolicy(overflow)
+        self._queue: deque[str] = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._idle = threading.Condition(self._lock)
+        self._writing = False
+        self._closed = False
+        self._dropped_since_write = 0
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def isatty(self) -> bool:
+        isatty = getattr(self._stream, 'isatty', None)
+        return bool(isatty and isatty())
+
+    def write(self, message: str) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            if len(self._queue) >= self._max_queue:
+                if self._overflow is OverflowPolicy.BLOCK:
+                    while len(self._queue) >= self._max_queue and not self._closed:
+                        self._not_full.wait()
+                else:
+                    self._queue.popleft()
+                    self.dropped += 1
+                    self._dropped_since_write += 1
+            self._queue.append(message)
+            self._not_empty.notify()
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued record has been written; False on timeout."""
+        with self._lock:
+            return self._idle.wait_for(lambda: not self._queue and not self._writing, timeout)
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        self.drain(timeout)
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                while not self._queue and not self._closed:
+                    self._not_empty.wait()
+                if not self._queue:
+                    return
+                batch = [
+                    self._queue.popleft() for _ in range(min(len(self._queue), self._batch_size))
+                ]
+                dropped, self._dropped_since_write = self._dropped_since_write, 0
+                self._writing = True
+                self._not_full.notify_all()
+
+            if dropped:
+                batch.insert(0, f'[log writer] {dropped} records dropped: queue full\n')
+            try:
+                self._stream.write(''.join(batch))
+                self._stream.flush()
+            except Exception:  # A broken stream must not kill the writer thread
+                pass
+            finally:
+                with self._lock:
+                    self._writing = False
+                    self._idle.notify_all()
@@ -1,9 +1,11 @@
-"""Generator wrapper for LoguruIO."""
+"""Generator wrappers for LoguruIO."""
 
-from typing import TYPE_CHECKING
+from asyncio import CancelledError
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Awaitable, Optional
 
 from src.platform.logging.loguru_io_config import GeneratorMethod
-from src.platform.logging.loguru_io_utils import reset_call_depth
+from src.platform.logging.loguru_io_context import IOCallContext, StreamStats
 
 
 if TYPE_CHECKING:
@@ -19,48 +21,171 @@ class GeneratorWrapper:
         return self
 
     def __next__(self):
+        context = IOCallContext(self._custom_logger)
         try:
-            self._custom_logger.log_args_kwargs_content(None, yield_method=GeneratorMethod.NEXT)
+            context.log_args_kwargs_content(None, yield_method=GeneratorMethod.NEXT)
             out = next(self.gen_obj)
-            self._custom_logger.log_return_content(out, yield_method=GeneratorMethod.NEXT)
+            context.log_return_content(out, yield_method=GeneratorMethod.NEXT)
             return out
         except StopIteration as e:
-            self._custom_logger.log_return_content(e.value, yield_method=GeneratorMethod.NEXT)
+            context.log_return_content(e.value, yield_method=GeneratorMethod.NEXT)
             raise
         except Exception:
+            context.fail()
             raise
         finally:
-            reset_call_depth()
+            context.close()
 
     def send(self, value):
+        context = IOCallContext(self._custom_logger)
         try:
-            self._custom_logger.log_args_kwargs_content(value, yield_method=GeneratorMethod.SEND)
+            context.log_args_kwargs_content(value, yield_method=GeneratorMethod.SEND)
             out = self.gen_obj.send(value)
-            self._custom_logger.log_return_content(out, yield_method=GeneratorMethod.SEND)
+            context.log_return_content(out, yield_method=GeneratorMethod.SEND)
             return out
         except StopIteration as e:
-            self._custom_logger.log_return_content(e.value, yield_method=GeneratorMethod.SEND)
+            context.log_return_content(e.value, yield_method=GeneratorMethod.SEND)
             raise
         except Exception:
+            context.fail()
             raise
         finally:
-            reset_call_depth()
+            context.close()
 
     def throw(self, exc_type, exc_val=None, tb=None):
+        context = IOCallContext(self._custom_logger)
         try:
-            self._custom_logger.log_args_kwargs_content(
+            context.log_args_kwargs_content(
                 exc_type=exc_type, exc_val=exc_val, tb=tb, yield_method=GeneratorMethod.THROW
             )
             out = self.gen_obj.throw(exc_type, exc_val, tb)
-            self._custom_logger.log_return_content(out, yield_method=GeneratorMethod.THROW)
+            context.log_return_content(out, yield_method=GeneratorMethod.THROW)
             return out
         except StopIteration as e:
-            self._custom_logger.log_return_content(e.value, yield_method=GeneratorMethod.THROW)
+            context.log_return_content(e.value, yield_method=GeneratorMethod.THROW)
             raise
         except Exception:
+            context.fail()
             raise
         finally:
-            reset_call_depth()
+            context.close()
 
     def close(self):
         self.gen_obj.close()
+
+
+class AsyncGeneratorWrapper:
+    """Async generator proxy tracing ``__anext__``, ``asend`` and ``athrow``.
+
+    Every step is traced like ``GeneratorWrapper`` does for sync generators, unless
+    the decorator was given ``aggregate=True``. Then steps are only counted and
+    timed, and a single record with the item count, bytes and time spent in the
+    generator is written when the stream is exhausted, fails, is cancelled or is
+    closed with ``aclose``. A stream abandoned without ``aclose`` writes nothing.
+    """
+
+    def __init__(self, agen_obj, custom_logger):
+        self.agen_obj = agen_obj  # Store the original async generator to forward calls to
+        self._custom_logger: LoguruIO = custom_logger
+        self._stats: Optional[StreamStats] = StreamStats() if custom_logger.aggregate else None
+        self._finished = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._stats is not None:
+            return await self._aggregate(self.agen_obj.__anext__())
+        context = IOCallContext(self._custom_logger)
+        try:
+            context.log_args_kwargs_content(None, yield_method=GeneratorMethod.ANEXT)
+            out = await self.agen_obj.__anext__()
+            context.log_return_content(out, yield_method=GeneratorMethod.ANEXT)
+            return out
+        except StopAsyncIteration:
+            context.log_return_content(None, yield_method=GeneratorMethod.ANEXT)
+            raise
+        except Exception:
+            context.fail()
+            raise
+        finally:
+            context.close()
+
+    async def asend(self, value):
+        if self._stats is not None:
+            return await self._aggregate(self.agen_obj.asend(value))
+        context = IOCallContext(self._custom_logger)
+        try:
+            context.log_args_kwargs_content(value, yield_method=GeneratorMethod.ASEND)
+            out = await self.agen_obj.asend(value)
+            context.log_return_content(out, yield_method=GeneratorMethod.ASEND)
+            return out
+        except StopAsyncIteration:
+            context.log_return_content(None, yield_method=GeneratorMethod.ASEND)
+            raise
+        except Exception:
+            context.fail()
+            raise
+        finally:
+            context.close()
+
+    async def athrow(self, exc_type, exc_val=None, tb=None):
+        # The three-argument form is deprecated; only forward what the caller passed
+        args = (exc_type,) if exc_val is None and tb is None else (exc_type, exc_val, tb)
+        if self._stats is not None:
+            return await self._aggregate(self.agen_obj.athrow(*args))
+        context = IOCallContext(self._custom_logger)
+        try:
+            context.log_args_kwargs_content(
+                exc_type=exc_type, exc_val=exc_val, tb=tb, yield_method=GeneratorMethod.ATHROW
+            )
+            out = await self.agen_obj.athrow(*args)
+            context.log_return_content(out, yield_method=GeneratorMethod.ATHROW)
+            return out
+        except StopAsyncIteration:
+            context.log_return_content(None, yield_method=GeneratorMethod.ATHROW)
+            raise
+        except Exception:
+            context.fail()
+            raise
+        finally:
+            context.close()
+
+    async def aclose(self):
+        try:
+            await self.agen_obj.aclose()
+        finally:
+            if self._stats is not None:
+                self._summarize('closed', failed=False, frames_above=0)
+
+    async def _aggregate(self, step: Awaitable[Any]) -> Any:
+        started = perf_counter()
+        try:
+            out = await step
+        except StopAsyncIteration:
+            self._stats.elapsed += perf_counter() - started
+            self._summarize('exhausted', failed=False, frames_above=1)
+            raise
+        except CancelledError:
+            self._stats.elapsed += perf_counter() - started
+            self._summarize('cancelled', failed=False, frames_above=1)
+            raise
+        except Exception as e:
+            self._stats.elapsed += perf_counter() - started
+            self._summarize(f'failed: {type(e).__name__}', failed=True, frames_above=1)
+            raise
+        self._stats.add(out, perf_counter() - started)
+        return out
+
+    def _summarize(self, outcome: str, failed: bool, frames_above: int) -> None:
+        if self._finished:
+            return
+        self._finished = True
+        self._stats.outcome = outcome
+        context = IOCallContext(self._custom_logger)
+        try:
+            context.log_stream_stats(self._stats, frames_above=frames_above + 1)
+            if failed:
+                context.fail()
+        finally:
+            context.close()
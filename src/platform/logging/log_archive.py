@@ -0,0 +1,150 @@
+"""Compression and retention of rotated log files, off the logging worker.
+
+Loguru runs ``compression`` and ``retention`` inline when a file sink rotates, so a
+large file stalls every queued record until it is compressed. ``LogArchiver``
+provides both callables, but they only hand the work to a single background
+worker and return immediately. zlib and zstandard release the GIL while they
+compress, so logging threads keep running during the work.
+
+Archives are written as a sequence of independent gzip members (or zstd frames),
+one per ``block_size`` bytes of input, and each block is cut at a line boundary.
+``zcat``, ``gzip.open`` and ``zstd -d`` read them as one stream, and the sidecar
+index written alongside (see ``log_index``) lets a search decompress single blocks.
+
+This module and ``log_index`` only import the standard library at import time, so
+tools can use them without loading the logging configuration.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import gzip
+from importlib.util import find_spec
+import logging
+import os
+from threading import Lock
+from time import time
+from typing import Any, Callable, Iterable, Optional
+
+from src.platform.logging.log_index import LogIndex, index_path
+
+
+CODEC_SUFFIXES = {'gz': '.gz', 'zst': '.zst'}
+DEFAULT_BLOCK_SIZE = 4 * 1024 * 1024
+
+archive_logger = logging.getLogger(__name__)
+
+
+def block_compressor(codec: str, level: Optional[int] = None) -> Callable[[bytes], bytes]:
+    if codec == 'gz':
+        compresslevel = 6 if level is None else level
+        return lambda block: gzip.compress(block, compresslevel=compresslevel, mtime=0)
+    if codec == 'zst':
+        import zstandard
+
+        compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+        return compressor.compress
+    raise ValueError(f'Unknown log compression codec: {codec!r}')
+
+
+def iter_blocks(source: Any, block_size: int) -> Iterable[bytes]:
+    """Yield ``block_size`` chunks of a binary file, each extended to the end of a line."""
+    while block := source.read(block_size):
+        if not block.endswith(b'\n'):
+            block += source.readline()
+        yield block
+
+
+def compress_log(
+    path: str,
+    codec: str = 'gz',
+    level: Optional[int] = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> str:
+    """Compress ``path`` block by block into ``path`` + codec suffix, then remove it.
+
+    The archive's block index is built on the way and saved next to it.
+    """
+    compress = block_compressor(codec, level)
+    index = LogIndex(codec)
+    target = path + CODEC_SUFFIXES[codec]
+    if os.path.exists(target):
+        root, ext = os.path.splitext(path)
+        target = f'{root}.{time():.0f}{ext}{CODEC_SUFFIXES[codec]}'
+    partial_target = target + '.part'
+
+    with open(path, 'rb') as source, open(partial_target, 'wb') as out:
+        for block in iter_blocks(source, block_size):
+            compressed = compress(block)
+            index.add_block(out.tell(), len(compressed), block)
+            out.write(compressed)
+    # The archive only appears once complete; the source stays until then
+    os.replace(partial_target, target)
+    index.save(index_path(target))
+    os.remove(path)
+    return target
+
+
+def remove_expired(paths: Iterable[str], max_age_seconds: float) -> list[str]:
+    cutoff = time() - max_age_seconds
+    removed = []
+    for path in paths:
+        try:
+            if os.stat(path).st_mtime <= cutoff:
+                os.remove(path)
+                removed.append(path)
+        except FileNotFoundError:
+            pass  # Already compressed or removed by another worker
+    return removed
+
+
+class LogArchiver:
+    """Compression and retention callables for a loguru file sink.
+
+    ``compress`` and ``retain`` are passed to ``logger.add`` as ``compression`` and
+    ``retention``; a ``None`` codec keeps rotated files uncompressed. The worker thread
+    is created on the first rotation. A failure is reported through standard logging
+    and never reaches the sink.
+    """
+
+    def __init__(
+        self,
+        codec: Optional[str] = 'gz',
+        level: Optional[int] = None,
+        retention_seconds: float = 14 * 24 * 3600,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ):
+        if codec is not None and codec not in CODEC_SUFFIXES:
+            raise ValueError(f'Unknown log compression codec: {codec!r}')
+        if codec == 'zst' and find_spec('zstandard') is None:
+            raise ValueError("Log compression 'zst' requires the zstandard package")
+        self.codec = codec
+        self.level = level
+        self.retention_seconds = retention_seconds
+        self.block_size = block_size
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = Lock()
+
+    def compress(self, path: str) -> None:
+        self._submit(compress_log, path, self.codec, self.level, self.block_size)
+
+    def retain(self, logs: list[str]) -> None:
+        self._submit(remove_expired, logs, self.retention_seconds)
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _submit(self, func: Callable[..., Any], *args: Any) -> Future:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='log-archive')
+            future = self._executor.submit(func, *args)
+        future.add_done_callback(_report_failure)
+        return future
+
+
+def _report_failure(future: Future) -> None:
+    error = future.exception()
+    if error is not None:
+        archive_logger.error('Log archiving failed', exc_info=error)
@@ -0,0 +1,103 @@
+"""Runtime control of sink levels and Logger.io tracing.
+
+Settings are applied from the admin endpoint or, on SIGUSR1, reloaded from the
+JSON file named by LOG_CONTROL_FILE, for example:
+
+    {"levels": {"stdout": "INFO", "file": "DEBUG"},
+     "tracing": {"src.driven_adapter": false, "order_use_case.py::": true}}
+
+``levels`` maps sink names to loguru levels. ``tracing`` maps a module or call
+target prefix to whether Logger.io traces it; ``null`` removes the override.
+"""
+
+import asyncio
+import json
+import os
+import signal
+from typing import Any, Mapping, Optional
+
+from src.platform.logging.loguru_io_config import custom_logger, log_sinks
+from src.platform.logging.loguru_io_policy import trace_policies
+
+
+LOG_CONTROL_FILE = os.environ.get('LOG_CONTROL_FILE') or None
+
+
+def set_tracing(prefix: str, enabled: Optional[bool]) -> None:
+    # Keeps the sampling settings of an existing rule for the same prefix
+    rule = trace_policies.rules().get(prefix)
+    sample_rate = rule.sample_rate if rule else None
+    slow_call_ms = rule.slow_call_ms if rule else None
+    if enabled is None and sample_rate is None and slow_call_ms is None:
+        trace_policies.reset(prefix)
+    else:
+        trace_policies.configure(
+            prefix, sample_rate=sample_rate, slow_call_ms=slow_call_ms, enabled=enabled
+        )
+
+
+def apply_log_settings(
+    levels: Optional[Mapping[str, str]] = None,
+    tracing: Optional[Mapping[str, Optional[bool]]] = None,
+) -> None:
+    """Apply sink levels and tracing overrides; nothing changes if any entry is invalid."""
+    levels = levels or {}
+    tracing = tracing or {}
+    current_levels = log_sinks.levels()
+    for name, level in levels.items():
+        if name not in current_levels:
+            raise ValueError(f'Unknown log sink: {name}')
+        if not isinstance(level, str):
+            raise ValueError(f'Log level of {name} must be a level name, got {level!r}')
+        custom_logger.level(level)  # ValueError for unknown level names
+    for prefix, enabled in tracing.items():
+        if enabled is not None and not isinstance(enabled, bool):
+            raise ValueError(f'Tracing of {prefix} must be true, false or null, got {enabled!r}')
+
+    for name, level in levels.items():
+        log_sinks.set_level(name, level)
+    for prefix, enabled in tracing.items():
+        set_tracing(prefix, enabled)
+
+
+def log_settings() -> dict[str, Any]:
+    return {
+        'levels': log_sinks.levels(),
+        'tracing': {
+            prefix: rule.enabled
+            for prefix, rule in trace_policies.rules().items()
+            if rule.enabled is not None
+        },
+    }
+
+
+def reload_log_settings(path: Optional[str] = None) -> None:
+    """Signal handler body: a bad file is reported and leaves the settings untouched."""
+    path = path or LOG_CONTROL_FILE
+    if path is None:
+        custom_logger.warning('SIGUSR1 received but LOG_CONTROL_FILE is not set')
+        return
+    try:
+        with open(path, encoding='utf-8') as file:
+            settings = json.load(file)
+        apply_log_settings(settings.get('levels'), settings.get('tracing'))
+    except (OSError, ValueError, AttributeError, TypeError) as error:
+        custom_logger.error(f'Log settings not reloaded from {path}: {error}')
+        return
+    custom_logger.info(f'Log settings reloaded from {path}: {log_settings()}')
+
+
+def install_reload_signal(loop: asyncio.AbstractEventLoop) -> bool:
+    """Reload log settings on SIGUSR1; False where the loop cannot handle signals."""
+    try:
+        loop.add_signal_handler(signal.SIGUSR1, reload_log_settings)
+    except (AttributeError, NotImplementedError, RuntimeError, ValueError):
+        return False
+    return True
+
+
+def remove_reload_signal(loop: asyncio.AbstractEventLoop) -> None:
+    try:
+        loop.remove_signal_handler(signal.SIGUSR1)
+    except (AttributeError, NotImplementedError, RuntimeError, ValueError):
+        pass
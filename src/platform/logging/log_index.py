@@ -0,0 +1,202 @@
+"""Sidecar block index of compressed IO log archives.
+
+Archives written by ``log_archive`` are a sequence of independently compressed,
+line-aligned blocks. The index written next to each archive (``<archive>.idx``)
+lists every block's byte offset and compressed length, and for each chain start
+time, call target and level the blocks holding a record with that key. A search
+only seeks to and decompresses the blocks it needs. Archives without an index, such
+as files compressed before indexing existed, are indexed by one sequential pass
+over their members.
+"""
+
+from collections.abc import Iterator
+import gzip
+import json
+import os
+from typing import Any, BinaryIO, Optional
+import zlib
+
+
+INDEX_SUFFIX = '.idx'
+INDEX_VERSION = 1
+KEY_FIELDS = ('chain', 'target', 'level')
+
+# io_log_format: time | level | markers file::function:line=>call_target | message | elapsed | chain
+FIELD_SEPARATOR = ' | '
+TIME_WIDTH = len('YYYY-MM-DD HH:mm:ss.SSS')
+
+
+def parse_record_keys(line: str) -> Optional[tuple[str, str, str]]:
+    """(chain start time, call target, level) of a record's first line; None otherwise.
+
+    Continuation lines (tracebacks, multi-line messages) return None and belong to
+    the record above them. Records logged outside a traced chain have empty chain
+    and target keys.
+    """
+    parts = line.split(FIELD_SEPARATOR, 2)
+    if len(parts) < 3 or len(parts[0]) != TIME_WIDTH:
+        return None
+    location = parts[2].partition(FIELD_SEPARATOR)[0]
+    chain = line.rstrip('\r\n').rpartition(FIELD_SEPARATOR)[2].strip()
+    return chain, location.partition('=>')[2], parts[1].strip()
+
+
+def codec_of(path: str) -> Optional[str]:
+    if path.endswith('.gz'):
+        return 'gz'
+    if path.endswith('.zst'):
+        return 'zst'
+    return None
+
+
+def index_path(archive_path: str) -> str:
+    return archive_path + INDEX_SUFFIX
+
+
+class LogIndex:
+    """Block offsets of one archive and, per key field, the blocks holding each key."""
+
+    def __init__(self, codec: Optional[str]):
+        self.codec = codec
+        self.blocks: list[tuple[int, int]] = []
+        self.keys: dict[str, dict[str, list[int]]] = {field: {} for field in KEY_FIELDS}
+
+    def add_block(self, offset: int, length: int, data: bytes) -> None:
+        block_id = len(self.blocks)
+        self.blocks.append((offset, length))
+        for line in data.decode('utf-8', 'replace').splitlines():
+            record_keys = parse_record_keys(line)
+            if record_keys is None:
+                continue
+            for field, key in zip(KEY_FIELDS, record_keys, strict=True):
+                if not key:
+                    continue
+                block_ids = self.keys[field].setdefault(key, [])
+                if not block_ids or block_ids[-1] != block_id:
+                    block_ids.append(block_id)
+
+    def lookup(
+        self,
+        chain: Optional[str] = None,
+        target: Optional[str] = None,
+        level: Optional[str] = None,
+    ) -> list[int]:
+        """Ids of blocks that may hold a record matching every given filter.
+
+        ``target`` matches any call target containing it; the other filters are exact.
+        """
+        candidates = set(range(len(self.blocks)))
+        if chain is not None:
+            candidates.intersection_update(self.keys['chain'].get(chain, ()))
+        if target is not None:
+            candidates.intersection_update(
+                block_id
+                for key, block_ids in self.keys['target'].items()
+                if target in key
+                for block_id in block_ids
+            )
+        if level is not None:
+            candidates.intersection_update(self.keys['level'].get(level, ()))
+        return sorted(candidates)
+
+    def save(self, path: str) -> None:
+        partial_path = path + '.part'
+        with open(partial_path, 'w', encoding='utf-8') as file:
+            json.dump(
+                {
+                    'version': INDEX_VERSION,
+                    'codec': self.codec,
+                    'blocks': self.blocks,
+                    'keys': self.keys,
+                },
+                file,
+                separators=(',', ':'),
+            )
+        os.replace(partial_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional['LogIndex']:
+        try:
+            with open(path, encoding='utf-8') as file:
+                payload = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if payload.get('version') != INDEX_VERSION:
+            return None
+        index = cls(payload['codec'])
+        index.blocks = [tuple(block) for block in payload['blocks']]
+        index.keys = payload['keys']
+        return index
+
+
+def _decompressobj(codec: str) -> Any:
+    if codec == 'gz':
+        return zlib.decompressobj(wbits=31)
+    if codec == 'zst':
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompressobj()
+    raise ValueError(f'Unknown log compression codec: {codec!r}')
+
+
+def iter_members(
+    source: BinaryIO, codec: str, chunk_size: int = 1024 * 1024
+) -> Iterator[tuple[int, int, bytes]]:
+    """Yield (offset, compressed length, data) for each gzip member / zstd frame."""
+    offset = 0
+    pending = b''
+    while chunk := pending or source.read(chunk_size):
+        decompressor = _decompressobj(codec)
+        fed, pieces = 0, []
+        while True:
+            fed += len(chunk)
+            pieces.append(decompressor.decompress(chunk))
+            if decompressor.eof:
+                pending = decompressor.unused_data
+                break
+            chunk = source.read(chunk_size)
+            if not chunk:  # Truncated member, e.g. an archive still being written
+                pending = b''
+                break
+        length = fed - len(pending)
+        yield offset, length, b''.join(pieces)
+        offset += length
+
+
+def build_index(archive_path: str) -> LogIndex:
+    codec = codec_of(archive_path)
+    if codec is None:
+        raise ValueError(f'Not a compressed log archive: {archive_path}')
+    index = LogIndex(codec)
+    with open(archive_path, 'rb') as source:
+        for offset, length, data in iter_members(source, codec):
+            index.add_block(offset, length, data)
+    return index
+
+
+def load_or_build_index(archive_path: str) -> LogIndex:
+    """The archive's sidecar index, (re)built and saved when missing or stale."""
+    sidecar = index_path(archive_path)
+    try:
+        fresh = os.stat(sidecar).st_mtime >= os.stat(archive_path).st_mtime
+    except OSError:
+        fresh = False
+    index = LogIndex.load(sidecar) if fresh else None
+    if index is None:
+        index = build_index(archive_path)
+        try:
+            index.save(sidecar)
+        except OSError:
+            pass  # Read-only archive directory: search without persisting the index
+    return index
+
+
+def read_block(source: BinaryIO, index: LogIndex, block_id: int) -> bytes:
+    offset, length = index.blocks[block_id]
+    source.seek(offset)
+    data = source.read(length)
+    if index.codec == 'zst':
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
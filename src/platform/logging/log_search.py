@@ -0,0 +1,115 @@
+"""Search rotated IO logs through their sidecar block indexes.
+
+Usage:
+    python -m src.platform.logging.log_search logs/ --chain 1760000000.123456   # one request
+    python -m src.platform.logging.log_search logs/ --target OrderUseCase --level ERROR
+    python -m src.platform.logging.log_search logs/2026-01-01_00.log.gz --reindex
+
+Directories are expanded to their ``*.log``, ``*.log.gz`` and ``*.log.zst`` files.
+For archives, only the blocks the index lists for the given filters are read and
+decompressed; a missing or stale index is rebuilt first. The uncompressed file
+still being written is scanned line by line.
+"""
+
+import argparse
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+import sys
+from typing import Optional, TextIO
+
+from src.platform.logging.log_index import (
+    build_index,
+    codec_of,
+    index_path,
+    load_or_build_index,
+    parse_record_keys,
+    read_block,
+)
+
+
+LOG_PATTERNS = ('*.log', '*.log.gz', '*.log.zst')
+
+
+class RecordFilter:
+    __slots__ = ('chain', 'target', 'level')
+
+    def __init__(
+        self,
+        chain: Optional[str] = None,
+        target: Optional[str] = None,
+        level: Optional[str] = None,
+    ):
+        self.chain = chain
+        self.target = target
+        self.level = level.upper() if level else None
+
+    def matches(self, record_keys: tuple[str, str, str]) -> bool:
+        chain, target, level = record_keys
+        return (
+            (self.chain is None or chain == self.chain)
+            and (self.target is None or self.target in target)
+            and (self.level is None or level == self.level)
+        )
+
+
+def expand_paths(paths: Iterable[Path]) -> list[Path]:
+    files = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(sorted({file for pattern in LOG_PATTERNS for file in path.glob(pattern)}))
+        else:
+            files.append(path)
+    return files
+
+
+def filter_records(lines: Iterable[str], record_filter: RecordFilter) -> Iterator[str]:
+    """Yield matching records, each followed by its continuation lines."""
+    matched = False
+    for line in lines:
+        record_keys = parse_record_keys(line)
+        if record_keys is not None:
+            matched = record_filter.matches(record_keys)
+        if matched:
+            yield line
+
+
+def search_file(path: Path, record_filter: RecordFilter) -> Iterator[str]:
+    if codec_of(str(path)) is None:
+        with path.open(encoding='utf-8', errors='replace') as file:
+            yield from filter_records(file, record_filter)
+        return
+
+    index = load_or_build_index(str(path))
+    block_ids = index.lookup(record_filter.chain, record_filter.target, record_filter.level)
+    with path.open('rb') as source:
+        for block_id in block_ids:
+            text = read_block(source, index, block_id).decode('utf-8', 'replace')
+            yield from filter_records(text.splitlines(keepends=True), record_filter)
+
+
+def main(argv: Optional[list[str]] = None, out: TextIO = sys.stdout) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('paths', type=Path, nargs='+', help='log files or directories')
+    parser.add_argument('--chain', help='chain_start_time of the request, as logged')
+    parser.add_argument('--target', help='call target containing this text')
+    parser.add_argument('--level', help='log level, e.g. ERROR')
+    parser.add_argument('--reindex', action='store_true', help='rebuild archive indexes only')
+    args = parser.parse_args(argv)
+
+    files = expand_paths(args.paths)
+    if args.reindex:
+        for path in files:
+            if codec_of(str(path)) is not None:
+                index = build_index(str(path))
+                index.save(index_path(str(path)))
+                out.write(f'{path}: {len(index.blocks)} blocks\n')
+        return
+
+    record_filter = RecordFilter(args.chain, args.target, args.level)
+    for path in files:
+        for line in search_file(path, record_filter):
+            out.write(line if line.endswith('\n') else line + '\n')
+
+
+if __name__ == '__main__':
+    main()
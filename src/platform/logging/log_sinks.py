@@ -0,0 +1,48 @@
+"""Named loguru sinks whose level can be changed while the process runs."""
+
+from threading import Lock
+from typing import Any, Union
+
+
+class LogSinks:
+    """Adds sinks under a name and re-adds them to change their level.
+
+    A loguru handler's level is fixed when it is added. Filtering inside the sink
+    would also lower loguru's global minimum level, so DEBUG records would be built
+    even when no sink wants them. Instead, ``set_level`` removes the handler and adds
+    it again with the same arguments and the new level.
+    """
+
+    def __init__(self, logger: Any):
+        self._logger = logger
+        self._lock = Lock()
+        self._sinks: dict[str, tuple[int, Any, dict[str, Any]]] = {}
+
+    def add(self, name: str, sink: Any, **kwargs: Any) -> int:
+        kwargs.setdefault('level', 'DEBUG')
+        with self._lock:
+            handler_id = self._logger.add(sink, **kwargs)
+            self._sinks[name] = (handler_id, sink, kwargs)
+        return handler_id
+
+    def set_level(self, name: str, level: Union[str, int]) -> None:
+        # Raises ValueError for an unknown level before the current handler is touched
+        level_name = self._logger.level(level).name if isinstance(level, str) else level
+        with self._lock:
+            if name not in self._sinks:
+                raise KeyError(name)
+            handler_id, sink, kwargs = self._sinks[name]
+            if kwargs['level'] == level_name:
+                return
+            kwargs = {**kwargs, 'level': level_name}
+            self._logger.remove(handler_id)
+            self._sinks[name] = (self._logger.add(sink, **kwargs), sink, kwargs)
+
+    def remove(self, name: str) -> None:
+        with self._lock:
+            handler_id, _, _ = self._sinks.pop(name)
+            self._logger.remove(handler_id)
+
+    def levels(self) -> dict[str, Union[str, int]]:
+        with self._lock:
+            return {name: kwargs['level'] for name, (_, _, kwargs) in self._sinks.items()}
@@ -1,64 +1,63 @@
 from functools import wraps
 from inspect import (
+    isasyncgenfunction,
     iscoroutinefunction,
     isgeneratorfunction,
 )
+import sys
 import types
 from typing import Any, Callable, Optional, TypeVar, cast, overload, ParamSpec
 
-from src.platform.logging.generator_wrapper import GeneratorWrapper
+from src.platform.logging.generator_wrapper import AsyncGeneratorWrapper, GeneratorWrapper
+from src.platform.logging.loguru_io_buffer import tail_buffering
 from src.platform.logging.loguru_io_config import (
-    ENTRY_ARROW,
-    EXIT_ARROW,
+    IO_DISABLED_LAYERS,
+    IO_REPR_MAX_CHARS,
     ExtraField,
-    GeneratorMethod,
-    call_depth_var,
+    IOLayer,
     custom_logger,
 )
+from src.platform.logging.loguru_io_context import IOCallContext
+from src.platform.logging.loguru_io_metrics import CallTargetMetrics, io_metrics
+from src.platform.logging.loguru_io_policy import TracePolicy, trace_policies
+from src.platform.logging.loguru_io_span import span_exporter
 from src.platform.logging.loguru_io_utils import (
+    BoundedRepr,
+    CallPlan,
     build_call_target_func_path,
-    fetch_layer_depth,
-    get_chain_start_time,
-    handle_yield,
-    mask_sensitive,
-    normalize_args_kwargs,
-    reset_call_depth,
-    should_mask_keyword,
-    truncate_content,
+    fetch_io_layers,
 )
 
 
 T = TypeVar('T', bound=Callable[..., Any])
 
+# Renderers of traced values; truncate_content keeps the cost per record bounded
+_TRUNCATED_REPR = BoundedRepr(maxchars=IO_REPR_MAX_CHARS)
+_FULL_REPR = BoundedRepr(
+    maxlevel=64, maxitems=sys.maxsize, maxstring=sys.maxsize, maxchars=sys.maxsize
+)
+
 
 class LoguruIO:
-    def __init__(self, custom_logger, reraise: bool = True, truncate_content: bool = False):
+    def __init__(
+        self,
+        custom_logger,
+        reraise: bool = True,
+        truncate_content: bool = False,
+        layer: Optional[IOLayer] = None,
+        aggregate: bool = False,
+    ):
         self._custom_logger = custom_logger
         self.reraise = reraise
         self.truncate_content = truncate_content
-        self.extra = {}
-        self.depth = 2  # Adjusted for wrapper functions
-
-    def log_args_kwargs_content(
-        self, *args, yield_method: Optional[GeneratorMethod] = None, **kwargs
-    ):
-        call_depth_var.set(call_depth_var.get() + 1)
-        self.extra |= {
-            ExtraField.CHAIN_START_TIME: get_chain_start_time(),
-            ExtraField.LAYER_MARKER: fetch_layer_depth(),
-            ExtraField.ENTRY_MARKER: ENTRY_ARROW,
-            ExtraField.EXIT_MARKER: '',
-        }
-        self._custom_logger.bind(**self.extra).opt(depth=self.depth).debug(
-            f'{handle_yield(yield_method)}args: {self.mask_sensitive(args)}, kwargs: {self.mask_sensitive(kwargs)}'
-        )
-
-    def log_return_content(self, return_value, yield_method: Optional[GeneratorMethod] = None):
-        self.extra[ExtraField.ENTRY_MARKER] = ''
-        self.extra[ExtraField.EXIT_MARKER] = EXIT_ARROW
-        self._custom_logger.bind(**self.extra).opt(depth=self.depth).debug(
-            f'{handle_yield(yield_method)}return: {self.mask_sensitive(return_value)}'
-        )
+        self.layer = layer
+        self.aggregate = aggregate  # Async generators: one stats record instead of one per item
+        self.depth = 3  # Wrapper, IOCallContext.log_* and IOCallContext._write
+        self.call_target = ''  # Resolved in __call__
+        self.call_logger = custom_logger  # Bound to the call target in __call__
+        self.policy = TracePolicy(1.0, None)  # Registered for the call target in __call__
+        self.metrics = CallTargetMetrics()  # Registered for the call target in __call__
+        self.call_plan = CallPlan(lambda *args, **kwargs: None)  # Compiled in __call__
 
     def _hide_from_traceback(self, func):
         func.__code__ = func.__code__.replace(
@@ -66,54 +65,87 @@ class LoguruIO:
         )
         return func
 
-    def mask_sensitive(self, data: Any) -> Any:
-        if isinstance(data, dict):
-            new_data = {}
-            for key, value in data.items():
-                new_data[key] = self.mask_sensitive(should_mask_keyword(key, value))
-            processed_data = new_data
-        elif isinstance(data, list | tuple):
-            processed_data = type(data)(self.mask_sensitive(item) for item in data)
-        else:
-            processed_data = mask_sensitive(data)
-
-        # Apply truncation if enabled
-        if self.truncate_content:
-            return truncate_content(processed_data)
-        return processed_data
+    def render(self, data: Any) -> str:
+        renderer = _TRUNCATED_REPR if self.truncate_content else _FULL_REPR
+        return renderer.render(data)
 
     def __call__(self, func):
-        self.extra[ExtraField.CALL_TARGET] = build_call_target_func_path(func)
+        # Compiled out: the caller gets the original function, with no wrapper cost at all
+        if IO_DISABLED_LAYERS and not IO_DISABLED_LAYERS.isdisjoint(
+            fetch_io_layers(func, self.layer)
+        ):
+            return func
+
+        # Everything known at decoration time is bound once; per-call state lives in
+        # an IOCallContext so concurrent calls never share a mutable record.
+        call_target = self.call_target = build_call_target_func_path(func)
+        self.call_logger = self._custom_logger.bind(**{ExtraField.CALL_TARGET: call_target}).opt(
+            depth=self.depth
+        )
+        policy = self.policy = trace_policies.register(
+            call_target, getattr(func, '__module__', None) or ''
+        )
+        self.metrics = io_metrics.register(call_target)
+        call_plan = self.call_plan = CallPlan(func)
         if iscoroutinefunction(func):
 
             @wraps(func)
             async def async_wrapper(*args, **kwargs):
+                if not policy.enabled:
+                    args, kwargs = call_plan.apply(args, kwargs)
+                    return await func(*args, **kwargs)
+                context = IOCallContext(self)
                 try:
-                    self.log_args_kwargs_content(*args, **kwargs)
-                    args, kwargs = normalize_args_kwargs(func, *args, **kwargs)
+                    context.log_args_kwargs_content(*args, **kwargs)
+                    args, kwargs = call_plan.apply(args, kwargs)
                     return_value = await func(*args, **kwargs)
-                    self.log_return_content(return_value)
+                    context.log_return_content(return_value)
                     return return_value
                 except Exception:
+                    context.fail()
                     raise
                 finally:
-                    reset_call_depth()
+                    context.close()
 
             return self._hide_from_traceback(async_wrapper)
 
+        elif isasyncgenfunction(func):
+
+            @wraps(func)
+            def async_generator_wrapper(*args, **kwargs):
+                if not policy.enabled:
+                    return func(*args, **kwargs)
+                context = IOCallContext(self)
+                try:
+                    context.log_args_kwargs_content(*args, **kwargs)
+                    agen_obj = func(*args, **kwargs)
+                    context.log_return_content(agen_obj)
+                    return AsyncGeneratorWrapper(agen_obj, self)
+                except Exception:
+                    context.fail()
+                    raise
+                finally:
+                    context.close()
+
+            return self._hide_from_traceback(async_generator_wrapper)
+
         elif isgeneratorfunction(func):
 
             @wraps(func)
             def generator_wrapper(*args, **kwargs):
+                if not policy.enabled:
+                    return func(*args, **kwargs)
+                context = IOCallContext(self)
                 try:
-                    self.log_args_kwargs_content(*args, **kwargs)
+                    context.log_args_kwargs_content(*args, **kwargs)
                     gen_obj = func(*args, **kwargs)
-                    self.log_return_content(gen_obj)
+                    context.log_return_content(gen_obj)
                     return GeneratorWrapper(gen_obj, self)
                 except Exception:
+                    context.fail()
                     raise
                 finally:
-                    reset_call_depth()
+                    context.close()
 
             return self._hide_from_traceback(generator_wrapper)
 
@@ -121,16 +153,21 @@ class LoguruIO:
 
             @wraps(func)
             def sync_wrapper(*args, **kwargs):
+                if not policy.enabled:
+                    args, kwargs = call_plan.apply(args, kwargs)
+                    return func(*args, **kwargs)
+                context = IOCallContext(self)
                 try:
-                    self.log_args_kwargs_content(*args, **kwargs)
-                    args, kwargs = normalize_args_kwargs(func, *args, **kwargs)
+                    context.log_args_kwargs_content(*args, **kwargs)
+                    args, kwargs = call_plan.apply(args, kwargs)
                     return_value = func(*args, **kwargs)
-                    self.log_return_content(return_value)
+                    context.log_return_content(return_value)
                     return return_value
                 except Exception:
+                    context.fail()
                     raise
                 finally:
-                    reset_call_depth()
+                    context.close()
 
             return self._hide_from_traceback(sync_wrapper)
 
@@ -141,6 +178,10 @@ _T = TypeVar('_T')
 
 class Logger:
     base = custom_logger
+    policies = trace_policies
+    tail_buffering = tail_buffering
+    metrics = io_metrics
+    spans = span_exporter
 
     @overload
     @staticmethod
@@ -149,15 +190,28 @@ class Logger:
     @overload
     @staticmethod
     def io(
-        func: None = ..., *, reraise: bool = ..., truncate_content: bool = ...
+        func: None = ...,
+        *,
+        reraise: bool = ...,
+        truncate_content: bool = ...,
+        layer: Optional[IOLayer] = ...,
+        aggregate: bool = ...,
     ) -> Callable[[Callable[_P, _T]], Callable[_P, _T]]: ...
 
     @staticmethod
-    def io(func=None, *, reraise=True, truncate_content=True):
+    def io(func=None, *, reraise=True, truncate_content=True, layer=None, aggregate=False):
         if func:
             return LoguruIO(
-                custom_logger=custom_logger, reraise=reraise, truncate_content=truncate_content
+                custom_logger=custom_logger,
+                reraise=reraise,
+                truncate_content=truncate_content,
+                layer=layer,
+                aggregate=aggregate,
             )(func)
         return LoguruIO(
-            custom_logger=custom_logger, reraise=reraise, truncate_content=truncate_content
+            custom_logger=custom_logger,
+            reraise=reraise,
+            truncate_content=truncate_content,
+            layer=layer,
+            aggregate=aggregate,
         )
@@ -0,0 +1,114 @@
+"""Tail-based buffering of Logger.io records per call chain."""
+
+from collections import deque
+from functools import partial
+from os.path import basename, splitext
+from time import time
+from types import FrameType
+from typing import Any
+
+from src.platform.logging.loguru_io_config import (
+    IO_TAIL_BUFFER,
+    IO_TAIL_BUFFER_SIZE,
+    IO_TAIL_LATENCY_BUDGET_MS,
+    chain_buffer_var,
+    custom_logger,
+)
+
+
+def _restore_origin(
+    logged_at: float, filename: str, function: str, line: int, name: str, record: dict
+) -> None:
+    # Replayed records keep the time and call site they had when they were buffered
+    now = record['time']
+    record['time'] = now.fromtimestamp(logged_at, now.tzinfo)
+    record['elapsed'] -= now - record['time']
+    record['file'] = type(record['file'])(basename(filename), filename)
+    record['function'] = function
+    record['line'] = line
+    record['name'] = name
+    record['module'] = splitext(basename(filename))[0]
+
+
+class ChainBuffer:
+    """Ring buffer holding the entry/exit records of one call chain.
+
+    Only the call site and timestamp are captured when a record is buffered; the
+    message stays lazy, so traced values are rendered at flush time and show their
+    state at the end of the chain. When more records arrive than fit, the oldest are
+    dropped and a warning with the dropped count precedes the flushed records.
+    """
+
+    __slots__ = ('_records', '_latency_budget', 'dropped', 'failed')
+
+    def __init__(self, size: int, latency_budget: float):
+        self._records: deque[tuple] = deque(maxlen=size)
+        self._latency_budget = latency_budget  # seconds
+        self.dropped = 0
+        self.failed = False
+
+    def append(self, call_logger, message: Any, extra: dict, frame: FrameType) -> None:
+        if len(self._records) == self._records.maxlen:
+            self.dropped += 1
+        code = frame.f_code
+        self._records.append(
+            (
+                call_logger,
+                message,
+                extra,
+                time(),
+                code.co_filename,
+                code.co_name,
+                frame.f_lineno,
+                frame.f_globals.get('__name__'),
+            )
+        )
+
+    def close(self, chain_start_time: float) -> None:
+        if self.failed or time() - chain_start_time >= self._latency_budget:
+            self.flush()
+        self._records.clear()
+
+    def flush(self) -> None:
+        if self.dropped:
+            custom_logger.warning(f'Tail buffer full, {self.dropped} earlier IO records dropped')
+        for call_logger, message, extra, *origin in self._records:
+            call_logger.opt(depth=0).patch(partial(_restore_origin, *origin)).debug(
+                message, **extra
+            )
+
+
+class TailBuffering:
+    """Switch and limits for tail-based buffering, read whenever a chain starts.
+
+    With buffering on, a chain's records are written only if any traced call in it
+    raised or the whole chain took at least ``latency_budget_ms``; otherwise they are
+    discarded when the outermost traced call returns.
+    """
+
+    __slots__ = ('enabled', 'size', 'latency_budget_ms')
+
+    def __init__(self, enabled: bool, size: int, latency_budget_ms: float):
+        self.enabled = enabled
+        self.size = size
+        self.latency_budget_ms = latency_budget_ms
+
+    def start_chain(self) -> None:
+        if self.enabled:
+            chain_buffer_var.set(ChainBuffer(self.size, self.latency_budget_ms / 1000))
+
+
+def mark_chain_failed() -> None:
+    buffer = chain_buffer_var.get()
+    if buffer is not None:
+        buffer.failed = True
+
+
+def close_chain_buffer(chain_start_time: float) -> None:
+    buffer = chain_buffer_var.get()
+    if buffer is not None:
+        chain_buffer_var.set(None)
+        buffer.close(chain_start_time)
+
+
+tail_buffering = TailBuffering(IO_TAIL_BUFFER, IO_TAIL_BUFFER_SIZE, IO_TAIL_LATENCY_BUDGET_MS)
@@ -1,20 +1,34 @@
 """Centralized logging configuration."""
 
+import atexit
 from contextvars import ContextVar
 from enum import StrEnum
 import logging
 import os
 import sys
+import threading
+from typing import TYPE_CHECKING, Optional
 
 from loguru import logger as loguru_logger
 
 from src.platform.constant.path import LOG_DIR
+from src.platform.logging.background_writer import BackgroundStreamWriter, OverflowPolicy
+from src.platform.logging.log_archive import LogArchiver
+from src.platform.logging.log_sinks import LogSinks
 
 
+if TYPE_CHECKING:
+    from src.platform.logging.loguru_io_buffer import ChainBuffer
+    from src.platform.logging.loguru_io_span import ChainSpans
+
 # Constants and shared variables for LoguruIO
 SENSITIVE_KEYWORDS = {
     'password',
+    'card_number',
+    'cvv',
+    'secret',
 }
+MASKED_VALUE = '********'
 
 # Visual markers for logging
 DEPTH_LINE = '│'
@@ -23,6 +37,39 @@ EXIT_ARROW = '└'
 
 chain_start_time_var: ContextVar[float] = ContextVar('first_time_var', default=0)
 call_depth_var: ContextVar[int] = ContextVar('call_depth_var', default=0)
+# Uniform draw shared by every call of a chain for head-based sampling (-1 = not drawn yet)
+chain_sample_var: ContextVar[float] = ContextVar('chain_sample_var', default=-1.0)
+# Whether the chain's root was sampled; if so, every nested call is traced as well
+chain_sampled_var: ContextVar[bool] = ContextVar('chain_sampled_var', default=False)
+# Records of the current chain held back by tail-based buffering (None = write through)
+chain_buffer_var: ContextVar[Optional['ChainBuffer']] = ContextVar('chain_buffer_var', default=None)
+# Spans of the current chain while span export is on, and the id of the innermost open span
+chain_spans_var: ContextVar[Optional['ChainSpans']] = ContextVar('chain_spans_var', default=None)
+current_span_var: ContextVar[Optional[int]] = ContextVar('current_span_var', default=None)
+
+# Default tracing policy, adjustable per call target at runtime via Logger.policies
+IO_SAMPLE_RATE = float(os.environ.get('LOG_IO_SAMPLE_RATE', 1.0))
+IO_SLOW_CALL_MS = (
+    float(os.environ['LOG_IO_SLOW_CALL_MS']) if os.environ.get('LOG_IO_SLOW_CALL_MS') else None
+)
+
+# Layers whose Logger.io decorators return the function untouched, e.g. "domain,validator"
+IO_DISABLED_LAYERS = frozenset(
+    layer.strip()
+    for layer in os.environ.get('LOG_IO_DISABLED_LAYERS', '').split(',')
+    if layer.strip()
+)
+
+# Size limit of each rendered args/kwargs/return value when truncate_content is on
+IO_REPR_MAX_CHARS = int(os.environ.get('LOG_IO_REPR_MAX_CHARS', 1000))
+
+# NDJSON file receiving one line per traced call (span) when set
+IO_SPAN_FILE = os.environ.get('LOG_IO_SPAN_FILE') or None
+
+# Tail-based buffering: keep a chain's records in memory, write them only if it failed or was slow
+IO_TAIL_BUFFER = os.environ.get('LOG_IO_TAIL_BUFFER', '').lower() in ('1', 'true', 'yes')
+IO_TAIL_BUFFER_SIZE = int(os.environ.get('LOG_IO_TAIL_BUFFER_SIZE', 2000))
+IO_TAIL_LATENCY_BUDGET_MS = float(os.environ.get('LOG_IO_TAIL_LATENCY_BUDGET_MS', 1000))
 
 
 class ExtraField(StrEnum):
@@ -33,80 +80,110 @@ class ExtraField(StrEnum):
     CALL_TARGET = 'call_target'
 
 
+class IOLayer(StrEnum):
+    """Layers Logger.io can be compiled out of; modules under src/<layer>/ map by name."""
+
+    DOMAIN = 'domain'
+    VALIDATOR = 'validator'
+    APP = 'app'
+    DRIVEN_ADAPTER = 'driven_adapter'
+    DRIVING_ADAPTER = 'driving_adapter'
+    PLATFORM = 'platform'
+
+
 class GeneratorMethod(StrEnum):
     NEXT = 'next'
     SEND = 'send'
     THROW = 'throw'
+    ANEXT = 'anext'
+    ASEND = 'asend'
+    ATHROW = 'athrow'
+
+
+# Empty extra fields bound on every logger so io_log_format never raises KeyError
+BLANK_EXTRA = {
+    ExtraField.CHAIN_START_TIME: '',
+    ExtraField.LAYER_MARKER: '',
+    ExtraField.ENTRY_MARKER: '',
+    ExtraField.EXIT_MARKER: '',
+    ExtraField.CALL_TARGET: '',
+}
+
+ACCESS_LOGGER_NAME = 'uvicorn.access'
+
+
+def access_log_level(status_code: int) -> str:
+    if status_code >= 500:
+        return 'CRITICAL'
+    if status_code >= 400:
+        return 'ERROR'
+    if status_code >= 300:
+        return 'WARNING'
+    if status_code >= 200:
+        return 'SUCCESS'
+    return 'INFO'
 
 
 class InterceptHandler(logging.Handler):
-    """Handler to intercept standard logging and redirect to loguru."""
+    """Handler to intercept standard logging and redirect to loguru.
 
-    def emit(self, record):
-        # Skip access logs or adjust level based on status code
-        message = record.getMessage()
+    The loguru logger is bound once per handler and stdlib level names are resolved
+    once per name. The call site is taken from the LogRecord, which logging already
+    filled in, instead of walking the frames again, and uvicorn access records are
+    leveled from the status code in their ``args`` rather than by parsing the message.
+    """
 
-        if (message.startswith('format ') and '->' in message) or (
-            'Using selector: KqueueSelector' in message
+    def __init__(self, level: int = logging.NOTSET):
+        super().__init__(level)
+        self._levels: dict[str, str | int] = {}
+        self._current = threading.local()
+        self._logger = loguru_logger.bind(**BLANK_EXTRA).patch(self._apply_origin)
+
+    def emit(self, record):
+        args = record.args
+        if (
+            record.name == ACCESS_LOGGER_NAME
+            and isinstance(args, tuple)
+            and len(args) == 5
+            and isinstance(args[4], int)
         ):
-            return
-
-        # Parse HTTP status code from uvicorn access logs
-        if 'HTTP/1.1' in message:
-            # Extract status code from message like "GET /api/... HTTP/1.1" 404"
-            parts = message.split('"')
-            if len(parts) >= 3:
-                status_part = parts[2].strip().split()[0]
-                try:
-                    status_code = int(status_part)
-                    # Adjust log level based on status code
-                    if status_code >= 500:
-                        level = 'CRITICAL'
-                    elif status_code >= 400:
-                        level = 'ERROR'
-                    elif status_code >= 300:
-                        level = 'WARNING'
-                    elif status_code >= 200:
-                        level = 'SUCCESS'
-                    else:
-                        level = 'INFO'
-                except (ValueError, IndexError):
-                    # Fallback to original level
-                    try:
-                        level = loguru_logger.level(record.levelname).name
-                    except ValueError:
-                        level = record.levelno
-            else:
-                try:
-                    level = loguru_logger.level(record.levelname).name
-                except ValueError:
-                    level = record.levelno
+            # '%s - "%s %s HTTP/%s" %d' % (client, method, path, http_version, status)
+            level = access_log_level(args[4])
+            message = record.getMessage()
         else:
-            # Get corresponding Loguru level if it exists
-            try:
-                level = loguru_logger.level(record.levelname).name
-            except ValueError:
-                level = record.levelno
-
-        # Find caller from where originated the logged message
-        frame, depth = logging.currentframe(), 2
-        # pyrefly: ignore  # bad-assignment
-        while frame and frame.f_code.co_filename == logging.__file__:
-            frame = frame.f_back
-            depth += 1
-
-        # Bind empty extra fields to avoid KeyError
-        logger_with_extra = loguru_logger.bind(
-            **{
-                ExtraField.CHAIN_START_TIME: '',
-                ExtraField.LAYER_MARKER: '',
-                ExtraField.ENTRY_MARKER: '',
-                ExtraField.EXIT_MARKER: '',
-                ExtraField.CALL_TARGET: '',
-            }
-        )
-
-        logger_with_extra.opt(depth=depth, exception=record.exc_info).log(level, message)
+            message = record.getMessage()
+            if (message.startswith('format ') and '->' in message) or (
+                'Using selector: KqueueSelector' in message
+            ):
+                return
+            level = self._level(record)
+
+        self._current.record = record
+        if record.exc_info:
+            self._logger.opt(exception=record.exc_info).log(level, message)
+        else:
+            self._logger.log(level, message)
+
+    def _level(self, record: logging.LogRecord) -> str | int:
+        try:
+            return self._levels[record.levelname]
+        except KeyError:
+            pass
+        # Get corresponding Loguru level if it exists
+        try:
+            level: str | int = loguru_logger.level(record.levelname).name
+        except ValueError:
+            level = record.levelno
+        self._levels[record.levelname] = level
+        return level
+
+    def _apply_origin(self, record: dict) -> None:
+        log_record = self._current.record
+        record['file'] = type(record['file'])(log_record.filename, log_record.pathname)
+        record['function'] = log_record.funcName
+        record['line'] = log_record.lineno
+        record['module'] = log_record.module
+        record['name'] = log_record.name
 
 
 # Log format for LoguruIO decorated functions
@@ -134,26 +211,39 @@ system_log_format = ' | '.join(
 
 # Configure logger
 loguru_logger.remove()  # Remove default handler to avoid duplicate output and use custom format
-custom_logger = loguru_logger.bind(
-    **{
-        ExtraField.CHAIN_START_TIME: '',
-        ExtraField.LAYER_MARKER: '',
-        ExtraField.ENTRY_MARKER: '',
-        ExtraField.EXIT_MARKER: '',
-        ExtraField.CALL_TARGET: '',
-    }
+custom_logger = loguru_logger.bind(**BLANK_EXTRA)
+
+# Add console output with custom format; a background thread does the actual writes
+stdout_writer = BackgroundStreamWriter(
+    sys.stdout,
+    max_queue=int(os.environ.get('LOG_STDOUT_QUEUE_SIZE', 10_000)),
+    overflow=OverflowPolicy(os.environ.get('LOG_STDOUT_OVERFLOW', OverflowPolicy.DROP_OLDEST)),
+    name='log-stdout-writer',
 )
+# Drain queued console lines at exit; runs before loguru's own atexit removal
+atexit.register(stdout_writer.close)
+
+# Sinks are added by name so their levels can be changed at runtime (see log_control)
+log_sinks = LogSinks(custom_logger)
+log_sinks.add('stdout', stdout_writer, format=io_log_format)
 
-# Add console output with custom format
-custom_logger.add(sys.stdout, format=io_log_format)
+# Rotated files are compressed and expired in the background (LOG_COMPRESSION=gz|zst|none)
+LOG_COMPRESSION = os.environ.get('LOG_COMPRESSION', 'gz')
+LOG_COMPRESSION_LEVEL = os.environ.get('LOG_COMPRESSION_LEVEL')
+log_archiver = LogArchiver(
+    codec=None if LOG_COMPRESSION == 'none' else LOG_COMPRESSION,
+    level=int(LOG_COMPRESSION_LEVEL) if LOG_COMPRESSION_LEVEL else None,
+    retention_seconds=int(os.environ.get('LOG_RETENTION_DAYS', 14)) * 24 * 3600,
+)
 
 # Add file output with daily rotation and compression
-custom_logger.add(
+log_sinks.add(
+    'file',
     LOG_DIR / f'{os.environ.get("LOG_FILE_PREFIX", "")}{{time:YYYY-MM-DD_HH}}.log',
     format=io_log_format,
     rotation='1 day',
-    retention='14 days',
-    compression='gz',
+    retention=log_archiver.retain,
+    compression=log_archiver.compress if log_archiver.codec else None,
     enqueue=True,
 )
 
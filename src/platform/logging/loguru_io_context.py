@@ -0,0 +1,233 @@
+"""Per-invocation context for LoguruIO."""
+
+from contextvars import Token
+import sys
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from src.platform.logging.loguru_io_buffer import mark_chain_failed, tail_buffering
+from src.platform.logging.loguru_io_span import Span, span_exporter
+from src.platform.logging.loguru_io_config import (
+    ENTRY_ARROW,
+    EXIT_ARROW,
+    ExtraField,
+    GeneratorMethod,
+    call_depth_var,
+    chain_buffer_var,
+    chain_sampled_var,
+    chain_spans_var,
+    current_span_var,
+)
+from src.platform.logging.loguru_io_utils import (
+    fetch_layer_depth,
+    get_chain_sample,
+    get_chain_start_time,
+    handle_yield,
+    reset_call_depth,
+)
+
+
+if TYPE_CHECKING:
+    from src.platform.logging.loguru_io import LoguruIO
+
+
+class LazyIOMessage:
+    """Log message rendered only when loguru actually builds a record.
+
+    Loguru drops records below every sink's level before touching the message, so
+    stringification, masking and truncation of traced values are skipped entirely
+    when DEBUG is off. The rendered text is cached because loguru calls ``format``
+    on messages that carry keyword extras.
+    """
+
+    __slots__ = ('_render', '_params', '_text')
+
+    def __init__(self, render: Callable[..., str], *params: Any):
+        self._render = render
+        self._params = params
+        self._text: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = self._render(*self._params)
+        return self._text
+
+    def format(self, *args: Any, **kwargs: Any) -> str:
+        return str(self)
+
+
+def _render_args_kwargs(
+    io: 'LoguruIO', yield_method: Optional[GeneratorMethod], args: tuple, kwargs: dict
+) -> str:
+    args = io.call_plan.mask_args(args)
+    return f'{handle_yield(yield_method)}args: {io.render(args)}, kwargs: {io.render(kwargs)}'
+
+
+def _render_return(io: 'LoguruIO', yield_method: Optional[GeneratorMethod], return_value) -> str:
+    return f'{handle_yield(yield_method)}return: {io.render(return_value)}'
+
+
+class StreamStats:
+    """Totals of an async generator traced with ``aggregate=True``."""
+
+    __slots__ = ('items', 'bytes', 'elapsed', 'outcome')
+
+    def __init__(self):
+        self.items = 0
+        self.bytes: Optional[int] = None  # Set once a str or bytes-like item is seen
+        self.elapsed = 0.0  # seconds spent inside the generator, summed over steps
+        self.outcome = 'exhausted'
+
+    def add(self, item: Any, elapsed: float) -> None:
+        self.items += 1
+        self.elapsed += elapsed
+        if isinstance(item, str):
+            size = len(item) if item.isascii() else len(item.encode())
+        elif isinstance(item, (bytes, bytearray, memoryview)):
+            size = item.nbytes if isinstance(item, memoryview) else len(item)
+        else:
+            return
+        self.bytes = size if self.bytes is None else self.bytes + size
+
+
+def _render_stream_stats(stats: StreamStats) -> str:
+    # Streams of objects have no meaningful size, so only sized items get a byte count
+    size = '' if stats.bytes is None else f'{stats.bytes} bytes, '
+    return f'stream: {stats.items} items, {size}{stats.elapsed * 1000:.3f} ms, {stats.outcome}'
+
+
+class IOCallContext:
+    """State of one traced invocation.
+
+    A fresh context is created for every call (and every generator step), so concurrent
+    tasks never see each other's markers. The extra record is built once from the
+    contextvars on entry and reused for the exit record. The target's TracePolicy
+    decides whether the pair is emitted at all (chain sampling) and whether the entry
+    is held back until the call proves slow. With tail buffering on, records go to the
+    chain's buffer instead of the sinks. Latency and errors feed the target's metrics
+    on every call, sampled or not, and so do spans while span export is on.
+    """
+
+    __slots__ = (
+        '_io',
+        '_extra',
+        '_emit',
+        '_deferred_entry',
+        '_started_at',
+        '_failed',
+        '_span',
+        '_span_token',
+    )
+
+    def __init__(self, io: 'LoguruIO'):
+        self._io = io
+        self._extra: dict[str, Any] = {}
+        self._emit = False
+        self._deferred_entry: Optional[LazyIOMessage] = None
+        self._started_at = 0.0
+        self._failed = False
+        self._span: Optional[Span] = None
+        self._span_token: Optional[Token] = None
+
+    def log_args_kwargs_content(
+        self, *args, yield_method: Optional[GeneratorMethod] = None, **kwargs
+    ):
+        if not self._enter(perf_counter()):
+            return
+
+        message = LazyIOMessage(_render_args_kwargs, self._io, yield_method, args, kwargs)
+        if self._io.policy.slow_threshold is not None:
+            self._deferred_entry = message
+            return
+        self._write(message, self._extra)
+
+    def log_stream_stats(self, stats: StreamStats, frames_above: int = 0):
+        """Single exit record standing for every step of an aggregated stream.
+
+        ``frames_above`` counts the helper frames between the wrapper method the
+        caller entered and this one, so the record still points at the caller.
+        """
+        # Metrics and the span cover the time spent in the stream, not one step
+        if not self._enter(perf_counter() - stats.elapsed):
+            return
+
+        slow_threshold = self._io.policy.slow_threshold
+        if slow_threshold is not None and stats.elapsed < slow_threshold:
+            return
+        extra = self._extra
+        extra[ExtraField.ENTRY_MARKER] = ''
+        extra[ExtraField.EXIT_MARKER] = EXIT_ARROW
+        self._write(LazyIOMessage(_render_stream_stats, stats), extra, frames_above)
+
+    def _enter(self, started_at: float) -> bool:
+        # Depth, chain and span bookkeeping of every call; False when not sampled
+        self._started_at = started_at
+        depth = call_depth_var.get() + 1
+        call_depth_var.set(depth)
+        if depth == 1:
+            tail_buffering.start_chain()
+            span_exporter.start_chain(self._started_at)
+        chain_spans = chain_spans_var.get()
+        if chain_spans is not None:
+            self._span = chain_spans.open(
+                self._io.call_target, current_span_var.get(), self._started_at
+            )
+            self._span_token = current_span_var.set(self._span.id)
+        chain_start_time = get_chain_start_time()
+        policy = self._io.policy
+        sample_rate = policy.sample_rate
+        if depth == 1:
+            chain_sampled_var.set(sample_rate >= 1.0 or get_chain_sample() < sample_rate)
+        # A sampled root traces the whole chain; otherwise a target's own rate decides
+        if not chain_sampled_var.get() and get_chain_sample() >= sample_rate:
+            return False
+
+        self._emit = True
+        self._extra = {
+            ExtraField.CHAIN_START_TIME: chain_start_time,
+            ExtraField.LAYER_MARKER: fetch_layer_depth(),
+            ExtraField.ENTRY_MARKER: ENTRY_ARROW,
+            ExtraField.EXIT_MARKER: '',
+        }
+        return True
+
+    def log_return_content(self, return_value, yield_method: Optional[GeneratorMethod] = None):
+        if not self._emit:
+            return
+
+        extra = self._extra
+        if self._deferred_entry is not None:
+            slow_threshold = self._io.policy.slow_threshold
+            if slow_threshold is not None and perf_counter() - self._started_at < slow_threshold:
+                return
+            self._write(self._deferred_entry, extra)
+
+        extra[ExtraField.ENTRY_MARKER] = ''
+        extra[ExtraField.EXIT_MARKER] = EXIT_ARROW
+        self._write(LazyIOMessage(_render_return, self._io, yield_method, return_value), extra)
+
+    def fail(self):
+        self._failed = True
+        mark_chain_failed()
+
+    def close(self):
+        ended = perf_counter()
+        self._io.metrics.observe(ended - self._started_at, self._failed)
+        if self._span is not None:
+            self._span.ended = ended
+            self._span.failed = self._failed
+            current_span_var.reset(self._span_token)
+        reset_call_depth()
+
+    def _write(self, message: LazyIOMessage, extra: dict[str, Any], frames_above: int = 0):
+        call_logger = self._io.call_logger
+        depth = self._io.depth + frames_above
+        buffer = chain_buffer_var.get()
+        if buffer is None:
+            if frames_above:
+                call_logger = call_logger.opt(depth=depth)
+            # Extra fields travel as keyword arguments so no per-call bind() is needed
+            call_logger.debug(message, **extra)
+        else:
+            # Same call site loguru resolves for the logger's opt(depth=...)
+            buffer.append(call_logger, message, dict(extra), sys._getframe(depth))
@@ -0,0 +1,66 @@
+"""Latency histograms and call/error counters per Logger.io call target."""
+
+from typing import Iterator, Optional
+
+from src.platform.logging.loguru_io_config import ExtraField
+from src.platform.metrics.histogram import Histogram, format_labels
+from src.platform.metrics.registry import metrics_registry
+
+
+DURATION_METRIC = 'logger_io_duration_seconds'
+CALLS_METRIC = 'logger_io_calls_total'
+ERRORS_METRIC = 'logger_io_errors_total'
+
+
+class CallTargetMetrics:
+    """Counters of one call target, shared by every decorated function resolving to it."""
+
+    __slots__ = ('latency', 'errors')
+
+    def __init__(self):
+        self.latency = Histogram()
+        self.errors = 0
+
+    def observe(self, seconds: float, failed: bool) -> None:
+        self.latency.observe(seconds)
+        if failed:
+            self.errors += 1
+
+
+class IOMetrics:
+    """Collects every call of every traced target, independent of sampling and sink levels."""
+
+    def __init__(self):
+        self._targets: dict[str, CallTargetMetrics] = {}
+
+    def register(self, call_target: str) -> CallTargetMetrics:
+        metrics = self._targets.get(call_target)
+        if metrics is None:
+            metrics = self._targets[call_target] = CallTargetMetrics()
+        return metrics
+
+    def get(self, call_target: str) -> Optional[CallTargetMetrics]:
+        return self._targets.get(call_target)
+
+    def collect(self) -> Iterator[str]:
+        targets = sorted(self._targets.items())
+        yield f'# HELP {DURATION_METRIC} Wall time of Logger.io traced calls.'
+        yield f'# TYPE {DURATION_METRIC} histogram'
+        for call_target, metrics in targets:
+            yield from metrics.latency.render(
+                DURATION_METRIC, {ExtraField.CALL_TARGET: call_target}
+            )
+        yield f'# HELP {CALLS_METRIC} Logger.io traced calls.'
+        yield f'# TYPE {CALLS_METRIC} counter'
+        for call_target, metrics in targets:
+            labels = format_labels({ExtraField.CALL_TARGET: call_target})
+            yield f'{CALLS_METRIC}{labels} {metrics.latency.count}'
+        yield f'# HELP {ERRORS_METRIC} Logger.io traced calls that raised.'
+        yield f'# TYPE {ERRORS_METRIC} counter'
+        for call_target, metrics in targets:
+            labels = format_labels({ExtraField.CALL_TARGET: call_target})
+            yield f'{ERRORS_METRIC}{labels} {metrics.errors}'
+
+
+io_metrics = IOMetrics()
+metrics_registry.register('logger_io', io_metrics.collect)
@@ -0,0 +1,119 @@
+"""Runtime tracing policies for Logger.io call targets."""
+
+from typing import Optional
+
+from src.platform.logging.loguru_io_config import IO_SAMPLE_RATE, IO_SLOW_CALL_MS
+
+
+class TracePolicy:
+    """Resolved tracing settings for one call target.
+
+    Decorated functions keep a reference to their policy and read it on every call,
+    so the registry updates these objects in place instead of replacing them.
+    ``enabled`` is the only field a wrapper reads before deciding to trace at all.
+    """
+
+    __slots__ = ('enabled', 'sample_rate', 'slow_threshold')
+
+    def __init__(self, sample_rate: float, slow_threshold: Optional[float], enabled: bool = True):
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.slow_threshold = slow_threshold  # seconds; None emits every call
+
+
+class TraceRule:
+    """Override for every call target or module starting with a prefix; None fields inherit."""
+
+    __slots__ = ('sample_rate', 'slow_call_ms', 'enabled')
+
+    def __init__(
+        self,
+        sample_rate: Optional[float] = None,
+        slow_call_ms: Optional[float] = None,
+        enabled: Optional[bool] = None,
+    ):
+        self.sample_rate = sample_rate
+        self.slow_call_ms = slow_call_ms
+        self.enabled = enabled
+
+
+class TracePolicyRegistry:
+    """Holds prefix rules and keeps every registered call target's policy resolved.
+
+    ``sample_rate`` is the probability (0..1) that a call is traced. The draw is made
+    once per call chain and the chain's root decides first: a sampled root traces the
+    whole chain end to end. In a chain whose root was skipped, nested targets compare
+    the same draw with their own rate, so raising the rate of a single target traces
+    it in more chains.
+    ``slow_call_ms`` only emits the entry/exit pair when the call took at least that
+    long; a value <= 0 turns slow-call mode off.
+    ``enabled=False`` stops tracing the matching targets altogether. A prefix matches
+    either the call target (``order_repo_impl.py::OrderRepoImpl``) or the module of
+    the decorated function (``src.driven_adapter``).
+    """
+
+    def __init__(self, sample_rate: float = 1.0, slow_call_ms: Optional[float] = None):
+        self._default = TraceRule(sample_rate=sample_rate, slow_call_ms=slow_call_ms, enabled=True)
+        self._rules: dict[str, TraceRule] = {}
+        self._policies: dict[str, TracePolicy] = {}
+        self._modules: dict[str, str] = {}
+
+    def register(self, call_target: str, module: str = '') -> TracePolicy:
+        policy = self._policies.get(call_target)
+        if policy is None:
+            policy = self._policies[call_target] = TracePolicy(1.0, None)
+            self._modules[call_target] = module
+            self._resolve(call_target, policy)
+        return policy
+
+    def configure(
+        self,
+        prefix: str,
+        *,
+        sample_rate: Optional[float] = None,
+        slow_call_ms: Optional[float] = None,
+        enabled: Optional[bool] = None,
+    ) -> None:
+        if sample_rate is not None and not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f'sample_rate must be between 0 and 1, got {sample_rate}')
+        self._rules[prefix] = TraceRule(
+            sample_rate=sample_rate, slow_call_ms=slow_call_ms, enabled=enabled
+        )
+        self._resolve_all()
+
+    def reset(self, prefix: Optional[str] = None) -> None:
+        if prefix is None:
+            self._rules.clear()
+        else:
+            self._rules.pop(prefix, None)
+        self._resolve_all()
+
+    def rules(self) -> dict[str, TraceRule]:
+        return dict(self._rules)
+
+    def _resolve_all(self) -> None:
+        for call_target, policy in self._policies.items():
+            self._resolve(call_target, policy)
+
+    def _resolve(self, call_target: str, policy: TracePolicy) -> None:
+        sample_rate = self._default.sample_rate
+        slow_call_ms = self._default.slow_call_ms
+        enabled = True
+        module = self._modules.get(call_target, '')
+        # Shorter prefixes first so the most specific rule wins
+        for prefix in sorted(self._rules, key=len):
+            if not (call_target.startswith(prefix) or (module and module.startswith(prefix))):
+                continue
+            rule = self._rules[prefix]
+            if rule.sample_rate is not None:
+                sample_rate = rule.sample_rate
+            if rule.slow_call_ms is not None:
+                slow_call_ms = rule.slow_call_ms
+            if rule.enabled is not None:
+                enabled = rule.enabled
+        policy.enabled = enabled
+        policy.sample_rate = 1.0 if sample_rate is None else sample_rate
+        policy.slow_threshold = slow_call_ms / 1000 if slow_call_ms and slow_call_ms > 0 else None
+
+
+trace_policies = TracePolicyRegistry(sample_rate=IO_SAMPLE_RATE, slow_call_ms=IO_SLOW_CALL_MS)
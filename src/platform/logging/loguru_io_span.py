@@ -0,0 +1,108 @@
+"""Structured span export for Logger.io call chains.
+
+Every traced call of a chain becomes a span with its parent's id, its start offset
+and its duration relative to the chain start. A chain's spans are written as
+newline-delimited JSON in one batch when its outermost traced call returns.
+``python -m src.platform.logging.span_report`` turns the file back into trees.
+"""
+
+from itertools import count
+import json
+from pathlib import Path
+from secrets import token_hex
+from threading import Lock
+from typing import Optional, TextIO
+
+from src.platform.logging.loguru_io_config import IO_SPAN_FILE, chain_spans_var
+
+
+class Span:
+    __slots__ = ('id', 'parent_id', 'call_target', 'started', 'ended', 'failed')
+
+    def __init__(self, span_id: int, parent_id: Optional[int], call_target: str, started: float):
+        self.id = span_id
+        self.parent_id = parent_id
+        self.call_target = call_target
+        self.started = started  # perf_counter()
+        self.ended: Optional[float] = None
+        self.failed = False
+
+
+class ChainSpans:
+    """Spans of one chain; tasks and threads spawned by the chain share this object."""
+
+    __slots__ = ('trace_id', 'origin', 'spans', '_ids')
+
+    def __init__(self, origin: float):
+        self.trace_id = token_hex(8)
+        self.origin = origin  # perf_counter() when the chain's outermost call started
+        self.spans: list[Span] = []
+        self._ids = count(1)
+
+    def open(self, call_target: str, parent_id: Optional[int], started: float) -> Span:
+        span = Span(next(self._ids), parent_id, call_target, started)
+        self.spans.append(span)
+        return span
+
+    def to_lines(self, chain_start_time: float) -> list[str]:
+        lines = []
+        for span in self.spans:
+            duration = None if span.ended is None else (span.ended - span.started) * 1000
+            lines.append(
+                json.dumps(
+                    {
+                        'trace': self.trace_id,
+                        'chain_start_time': chain_start_time,
+                        'id': span.id,
+                        'parent': span.parent_id,
+                        'target': span.call_target,
+                        'start_ms': round((span.started - self.origin) * 1000, 3),
+                        'dur_ms': None if duration is None else round(duration, 3),
+                        'error': span.failed,
+                    },
+                    separators=(',', ':'),
+                )
+            )
+        return lines
+
+
+class SpanExporter:
+    """Appends finished chains to an NDJSON file; no path turns span export off."""
+
+    def __init__(self, path: Optional[str | Path] = None):
+        self._lock = Lock()
+        self._file: Optional[TextIO] = None
+        self.path: Optional[Path] = None
+        self.configure(path)
+
+    def configure(self, path: Optional[str | Path]) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self.path = Path(path) if path else None
+
+    def start_chain(self, origin: float) -> None:
+        if self.path is not None:
+            chain_spans_var.set(ChainSpans(origin))
+
+    def export(self, chain_spans: ChainSpans, chain_start_time: float) -> None:
+        if self.path is None or not chain_spans.spans:
+            return
+        payload = '\n'.join(chain_spans.to_lines(chain_start_time)) + '\n'
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self.path.open('a', encoding='utf-8')
+            self._file.write(payload)
+            self._file.flush()
+
+
+def close_chain_spans(chain_start_time: float) -> None:
+    chain_spans = chain_spans_var.get()
+    if chain_spans is not None:
+        chain_spans_var.set(None)
+        span_exporter.export(chain_spans, chain_start_time)
+
+
+span_exporter = SpanExporter(IO_SPAN_FILE)
@@ -1,14 +1,29 @@
-from inspect import FullArgSpec, getfile, getfullargspec, getsourcelines
+from copy import copy
+from dataclasses import fields as dataclass_fields, is_dataclass
+from functools import lru_cache
+from inspect import Parameter, getfile, getsourcelines, signature, unwrap
+from itertools import islice
 from os.path import basename
-from re import sub
+from random import random
+import re
+import reprlib
+import threading
 from time import time
 from typing import Any, Callable, Optional
 
+import attrs
+from pydantic import BaseModel
+
+from src.platform.logging.loguru_io_buffer import close_chain_buffer
+from src.platform.logging.loguru_io_span import close_chain_spans
 from src.platform.logging.loguru_io_config import (
     DEPTH_LINE,
+    MASKED_VALUE,
     SENSITIVE_KEYWORDS,
     GeneratorMethod,
     call_depth_var,
+    chain_sample_var,
+    chain_sampled_var,
     chain_start_time_var,
 )
 
@@ -25,76 +40,273 @@ def get_chain_start_time() -> float:
     return start_time
 
 
+def get_chain_sample() -> float:
+    sample = chain_sample_var.get()
+    if sample < 0:
+        sample = random()
+        chain_sample_var.set(sample)
+    return sample
+
+
 def fetch_layer_depth() -> str:
     return DEPTH_LINE * (call_depth_var.get() - 1)
 
 
 def build_call_target_func_path(func: Callable[..., Any]) -> str:
-    lineno = getsourcelines(func)[1]
-    return f'{basename(getfile(getattr(func, "__func__", func)))}::{func.__qualname__}:{lineno}'
+    # Read the location off the code object; inspect.getsourcelines would read and
+    # tokenize the whole source file for every decorated function at import time.
+    target = unwrap(getattr(func, '__func__', func))
+    code = getattr(target, '__code__', None)
+    if code is None:
+        filename, lineno = getfile(target), getsourcelines(target)[1]
+    else:
+        filename, lineno = code.co_filename, code.co_firstlineno
+    return f'{basename(filename)}::{func.__qualname__}:{lineno}'
+
+
+def fetch_io_layers(func: Callable[..., Any], layer: Optional[str] = None) -> set[str]:
+    # src.<layer>.… modules belong to that layer; an explicit layer is added on top
+    parts = (getattr(func, '__module__', None) or '').split('.', 2)
+    layers = {parts[1]} if len(parts) > 1 and parts[0] == 'src' else set()
+    if layer:
+        layers.add(layer)
+    return layers
 
 
 def reset_call_depth():
     layer = call_depth_var.get() - 1
     call_depth_var.set(layer)
     if not layer:
+        chain_start_time = chain_start_time_var.get()
         chain_start_time_var.set(0)
+        chain_sample_var.set(-1.0)
+        chain_sampled_var.set(False)
+        close_chain_buffer(chain_start_time)
+        close_chain_spans(chain_start_time)
+
+
+class CallPlan:
+    """Argument normalization compiled once per decorated function.
+
+    Drops keyword arguments the target does not accept and trims surplus positional
+    arguments, like the old per-call ``getfullargspec`` pass, but from precomputed
+    name sets and counts built from the ``inspect.Signature``. Positions of
+    parameters with sensitive names are recorded too, so a password passed by
+    position is masked like one passed by keyword.
+    """
 
+    __slots__ = (
+        'passthrough',
+        'accepted_names',
+        'positional_names',
+        'positional_count',
+        'sensitive_positions',
+    )
 
-def normalize_args_kwargs(
-    func: Callable[..., Any], *args: Any, **kwargs: Any
-) -> tuple[tuple[Any, ...], dict[Any, Any]]:
-    if hasattr(func, '__wrapped__'):
-        func = func.__wrapped__  # type: ignore
-    full_arg_spec: FullArgSpec = getfullargspec(func)
-    spec_args: list[str] = full_arg_spec.args
-
-    if not full_arg_spec.varkw:
-        kw_list: list[str] = spec_args + full_arg_spec.kwonlyargs
-        kwargs = {k: v for k, v in kwargs.items() if k in kw_list}
-
-    if not full_arg_spec.varargs:
-        spec_default: list[Any] = list(full_arg_spec.defaults) if full_arg_spec.defaults else []
-        args_dict = dict(
-            zip(
-                spec_args,
-                [None] * (len(spec_args) - len(spec_default)) + spec_default,
-                strict=False,
+    def __init__(self, func: Callable[..., Any]):
+        target = getattr(func, '__wrapped__', func)
+        try:
+            parameters = signature(target, follow_wrapped=False).parameters.values()
+        except (TypeError, ValueError):
+            parameters = None
+
+        self.accepted_names: Optional[frozenset[str]] = None
+        self.positional_names: frozenset[str] = frozenset()
+        self.positional_count: Optional[int] = None
+        self.sensitive_positions: frozenset[int] = frozenset()
+
+        if parameters is not None:
+            kinds = {parameter.kind for parameter in parameters}
+            positional = [
+                parameter.name
+                for parameter in parameters
+                if parameter.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+            ]
+            self.sensitive_positions = frozenset(
+                index for index, name in enumerate(positional) if is_sensitive_name(name)
             )
-        )
-        if args_dict := {k: v for k, v in args_dict.items() if k not in kwargs}:
-            args_max_len: int = len(args_dict)
-            args_min_len: int = len([value for value in args_dict.values() if value is None])
-            if len(args) not in range(args_min_len, args_max_len + 1):
-                args = args[:args_max_len]
-        else:
-            args = ()
+            if Parameter.VAR_KEYWORD not in kinds:
+                self.accepted_names = frozenset(
+                    positional + [p.name for p in parameters if p.kind is Parameter.KEYWORD_ONLY]
+                )
+            if Parameter.VAR_POSITIONAL not in kinds:
+                self.positional_names = frozenset(positional)
+                self.positional_count = len(positional)
+
+        # Targets taking both *args and **kwargs never need normalization
+        self.passthrough = self.accepted_names is None and self.positional_count is None
+
+    def apply(
+        self, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        if self.passthrough:
+            return args, kwargs
+
+        accepted_names = self.accepted_names
+        if kwargs and accepted_names is not None and not accepted_names.issuperset(kwargs):
+            kwargs = {k: v for k, v in kwargs.items() if k in accepted_names}
+
+        if self.positional_count is not None:
+            limit = self.positional_count
+            if kwargs:
+                limit -= len(self.positional_names.intersection(kwargs))
+            if len(args) > limit:
+                args = args[:limit]
+
+        return args, kwargs
 
-    return args, kwargs
+    def mask_args(self, args: tuple[Any, ...]) -> tuple[Any, ...]:
+        positions = self.sensitive_positions
+        if not positions or not args:
+            return args
+        return tuple(MASKED_VALUE if i in positions else arg for i, arg in enumerate(args))
 
 
-def mask_sensitive(data_str: Any) -> Any:
+# Every keyword in one compiled pattern; matches names containing any of them
+_SENSITIVE_NAME = re.compile(
+    '|'.join(re.escape(keyword) for keyword in sorted(SENSITIVE_KEYWORDS)), re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=4096)
+def is_sensitive_name(name: str) -> bool:
+    return _SENSITIVE_NAME.search(name) is not None
+
+
+def should_mask_keyword(keyword: Any, value: Any) -> Any:
+    return MASKED_VALUE if isinstance(keyword, str) and is_sensitive_name(keyword) else value
+
+
+# (field name, masked) pairs per structured type; None for types rendered as-is
+FieldMask = tuple[tuple[str, bool], ...]
+_field_masks: dict[type, Optional[FieldMask]] = {}
+
+
+def fetch_field_mask(cls: type) -> Optional[FieldMask]:
     try:
-        data_str_ = str(data_str)
-        new_data_str = sub(  # type: ignore
-            r"\1\2='********'\3",
-            data_str_,
+        return _field_masks[cls]
+    except KeyError:
+        pass
+    if issubclass(cls, BaseModel):
+        names = list(cls.model_fields)
+    elif attrs.has(cls):
+        names = [field.name for field in attrs.fields(cls)]
+    elif is_dataclass(cls):
+        names = [field.name for field in dataclass_fields(cls)]
+    else:
+        names = None
+    mask = None if names is None else tuple((name, is_sensitive_name(name)) for name in names)
+    _field_masks[cls] = mask
+    return mask
+
+
+class BoundedRepr(reprlib.Repr):
+    """reprlib-style renderer whose cost is bounded by its limits, not by the payload.
+
+    Besides reprlib's per-level limits on depth, items and string length, a render
+    stops walking once ``maxchars`` characters have been produced: remaining items
+    become ``...`` without being looked at. Querysets are never evaluated, and
+    pydantic models, attrs instances and dataclasses are rendered field by field
+    instead of through their own full ``repr``, with sensitive fields and dict keys
+    masked on the way. Top-level strings are kept as-is, like ``str()`` formatting,
+    up to ``maxchars``.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxlevel: int = 4,
+        maxitems: int = 20,
+        maxstring: int = 200,
+        maxchars: int = 1000,
+    ):
+        super().__init__(
+            maxlevel=maxlevel,
+            maxtuple=maxitems,
+            maxlist=maxitems,
+            maxarray=maxitems,
+            maxdict=maxitems,
+            maxset=maxitems,
+            maxfrozenset=maxitems,
+            maxdeque=maxitems,
+            maxstring=maxstring,
+            maxlong=maxstring,
+            maxother=maxstring,
         )
-        return data_str if data_str_ == new_data_str else new_data_str
-    except Exception:
-        return data_str
+        self.maxchars = maxchars
+        self._methods: dict[type, Callable[..., str]] = {}
+        self._local = threading.local()
+        self._spent = 0
 
+    def render(self, x: Any) -> str:
+        if isinstance(x, str):
+            return x if len(x) <= self.maxchars else x[: self.maxchars] + self.fillvalue
+        # Budget state lives on a per-thread copy, so concurrent renders never share it
+        renderer = getattr(self._local, 'renderer', None)
+        if renderer is None:
+            renderer = self._local.renderer = copy(self)
+        renderer._spent = 0
+        s = renderer.repr1(x, self.maxlevel)
+        return s if len(s) <= self.maxchars else s[: self.maxchars] + self.fillvalue
 
-def should_mask_keyword(keyword: Any, value: Any) -> Any:
-    return '********' if keyword in SENSITIVE_KEYWORDS else value
+    def repr1(self, x: Any, level: int) -> str:
+        spent = self._spent
+        if spent >= self.maxchars:
+            return self.fillvalue
+        cls = type(x)
+        method = self._methods.get(cls)
+        if method is None:
+            # Same name-based dispatch as reprlib, resolved once per type
+            name = 'repr_' + '_'.join(cls.__name__.split())
+            method = self._methods[cls] = getattr(type(self), name, type(self).repr_instance)
+        s = method(self, x, level)
+        # Children already advanced the budget; this only adds the container's own text
+        self._spent = spent + len(s)
+        return s
 
+    def repr_dict(self, x: dict, level: int) -> str:
+        # Unlike reprlib, keeps insertion order instead of sorting every key first
+        if not x:
+            return '{}'
+        if level <= 0:
+            return '{' + self.fillvalue + '}'
+        pieces = []
+        for key, value in islice(x.items(), self.maxdict):
+            masked = should_mask_keyword(key, value)
+            pieces.append(f'{self.repr1(key, level - 1)}: {self.repr1(masked, level - 1)}')
+        if len(x) > self.maxdict:
+            pieces.append(self.fillvalue)
+        return '{' + ', '.join(pieces) + '}'
 
-def truncate_content(data: Any, max_words: int = 100) -> Any:
-    data_str = str(data)
-    words = data_str.split()
+    def repr_instance(self, x: Any, level: int) -> str:
+        field_mask = fetch_field_mask(type(x))
+        if field_mask is not None:
+            return self._repr_fields(x, field_mask, level)
+        if isinstance(x, dict):
+            return self.repr_dict(x, level)
+        if isinstance(x, list):
+            return self.repr_list(x, level)
+        if isinstance(x, tuple):
+            return self.repr_tuple(x, level)
+        if hasattr(x, '_result_cache') and hasattr(x, 'model'):
+            return self._repr_queryset(x, level)
+        return super().repr_instance(x, level)
 
-    if len(words) <= max_words:
-        return data
+    def _repr_fields(self, x: Any, field_mask: FieldMask, level: int) -> str:
+        name = type(x).__name__
+        if level <= 0:
+            return f'{name}({self.fillvalue})'
+        pieces = []
+        for field, masked in islice(field_mask, self.maxdict):
+            value = MASKED_VALUE if masked else getattr(x, field, None)
+            pieces.append(f'{field}={self.repr1(value, level - 1)}')
+        if len(field_mask) > self.maxdict:
+            pieces.append(self.fillvalue)
+        return f'{name}({", ".join(pieces)})'
 
-    truncated = ' '.join(words[:max_words]) + '...'
-    return truncated if isinstance(data, str) else f'{type(data).__name__}({truncated})'
+    def _repr_queryset(self, x: Any, level: int) -> str:
+        # Never trigger a query: only rows already fetched are shown
+        cache = x._result_cache
+        if cache is None:
+            return f'<QuerySet {x.model.__name__} (not evaluated)>'
+        return f'<QuerySet {self.repr_list(cache, level)}>'
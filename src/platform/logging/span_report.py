@@ -0,0 +1,154 @@
+"""Rebuild Logger.io span trees from an NDJSON span file.
+
+Usage:
+    python -m src.platform.logging.span_report spans.ndjson              # one tree per request
+    python -m src.platform.logging.span_report spans.ndjson --trace ID   # a single request
+    python -m src.platform.logging.span_report spans.ndjson --summary    # hottest targets
+    python -m src.platform.logging.span_report spans.ndjson --folded     # flamegraph.pl input
+"""
+
+import argparse
+from collections import defaultdict
+import json
+from pathlib import Path
+import sys
+from typing import Iterable, Iterator, Optional, TextIO
+
+
+class SpanNode:
+    __slots__ = ('id', 'target', 'start_ms', 'dur_ms', 'error', 'children')
+
+    def __init__(self, span: dict):
+        self.id: int = span['id']
+        self.target: str = span['target']
+        self.start_ms: float = span['start_ms']
+        # Spans still open when the chain ended (e.g. detached tasks) count as instant
+        self.dur_ms: float = span['dur_ms'] or 0.0
+        self.error: bool = span['error']
+        self.children: list['SpanNode'] = []
+
+    @property
+    def self_ms(self) -> float:
+        return max(self.dur_ms - sum(child.dur_ms for child in self.children), 0.0)
+
+
+class Trace:
+    __slots__ = ('trace_id', 'chain_start_time', 'roots')
+
+    def __init__(self, trace_id: str, chain_start_time: float, roots: list[SpanNode]):
+        self.trace_id = trace_id
+        self.chain_start_time = chain_start_time
+        self.roots = roots
+
+    @property
+    def dur_ms(self) -> float:
+        return sum(root.dur_ms for root in self.roots)
+
+
+def read_spans(lines: Iterable[str]) -> Iterator[dict]:
+    for line in lines:
+        if line.strip():
+            yield json.loads(line)
+
+
+def build_traces(spans: Iterable[dict]) -> list[Trace]:
+    by_trace: dict[str, list[dict]] = defaultdict(list)
+    for span in spans:
+        by_trace[span['trace']].append(span)
+
+    traces = []
+    for trace_id, trace_spans in by_trace.items():
+        nodes = {span['id']: SpanNode(span) for span in trace_spans}
+        roots = []
+        for span in sorted(trace_spans, key=lambda s: s['start_ms']):
+            parent = nodes.get(span['parent'])
+            (parent.children if parent else roots).append(nodes[span['id']])
+        traces.append(Trace(trace_id, trace_spans[0]['chain_start_time'], roots))
+    return sorted(traces, key=lambda trace: trace.chain_start_time)
+
+
+def _walk(
+    node: SpanNode, stack: tuple[str, ...] = ()
+) -> Iterator[tuple[tuple[str, ...], SpanNode]]:
+    stack = (*stack, node.target)
+    yield stack, node
+    for child in node.children:
+        yield from _walk(child, stack)
+
+
+def render_tree(trace: Trace, out: TextIO) -> None:
+    out.write(
+        f'trace {trace.trace_id} chain_start_time={trace.chain_start_time} '
+        f'total={trace.dur_ms:.3f}ms\n'
+    )
+    for root in trace.roots:
+        for stack, node in _walk(root):
+            indent = '  ' * len(stack)
+            error = ' !error' if node.error else ''
+            out.write(
+                f'{indent}+{node.start_ms:9.3f}ms {node.dur_ms:9.3f}ms '
+                f'(self {node.self_ms:.3f}ms) {node.target}{error}\n'
+            )
+
+
+def render_summary(traces: list[Trace], out: TextIO, top: int) -> None:
+    calls: dict[str, int] = defaultdict(int)
+    total: dict[str, float] = defaultdict(float)
+    own: dict[str, float] = defaultdict(float)
+    worst: dict[str, float] = defaultdict(float)
+    for trace in traces:
+        for root in trace.roots:
+            for _, node in _walk(root):
+                calls[node.target] += 1
+                total[node.target] += node.dur_ms
+                own[node.target] += node.self_ms
+                worst[node.target] = max(worst[node.target], node.dur_ms)
+
+    out.write(f'{"self ms":>12} {"total ms":>12} {"calls":>7} {"max ms":>10}  target\n')
+    for target in sorted(own, key=own.__getitem__, reverse=True)[:top]:
+        out.write(
+            f'{own[target]:12.3f} {total[target]:12.3f} {calls[target]:7d} '
+            f'{worst[target]:10.3f}  {target}\n'
+        )
+
+
+def render_folded(traces: list[Trace], out: TextIO) -> None:
+    # Folded stacks weighted by self time in microseconds, as read by flamegraph.pl
+    folded: dict[str, int] = defaultdict(int)
+    for trace in traces:
+        for root in trace.roots:
+            for stack, node in _walk(root):
+                folded[';'.join(stack)] += round(node.self_ms * 1000)
+    for stack, weight in sorted(folded.items()):
+        out.write(f'{stack} {weight}\n')
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('span_file', type=Path)
+    parser.add_argument('--trace', help='only this trace id')
+    parser.add_argument('--min-ms', type=float, default=0.0, help='skip faster requests')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--summary', action='store_true', help='aggregate self time per target')
+    mode.add_argument('--folded', action='store_true', help='folded stacks for flame graphs')
+    parser.add_argument('--top', type=int, default=20, help='rows shown by --summary')
+    args = parser.parse_args(argv)
+
+    with args.span_file.open(encoding='utf-8') as file:
+        traces = [
+            trace
+            for trace in build_traces(read_spans(file))
+            if (args.trace is None or trace.trace_id == args.trace) and trace.dur_ms >= args.min_ms
+        ]
+
+    if args.summary:
+        render_summary(traces, sys.stdout, args.top)
+    elif args.folded:
+        render_folded(traces, sys.stdout)
+    else:
+        for trace in traces:
+            render_tree(trace, sys.stdout)
+
+
+if __name__ == '__main__':
+    main()
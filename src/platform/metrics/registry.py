@@ -0,0 +1,26 @@
+"""Process-wide registry of metric collectors served by the metrics endpoint."""
+
+from typing import Callable, Iterable
+
+
+Collector = Callable[[], Iterable[str]]
+
+
+class MetricsRegistry:
+    """Collectors yield Prometheus text lines (including # HELP / # TYPE) when scraped."""
+
+    def __init__(self):
+        self._collectors: dict[str, Collector] = {}
+
+    def register(self, name: str, collector: Collector) -> None:
+        self._collectors[name] = collector
+
+    def unregister(self, name: str) -> None:
+        self._collectors.pop(name, None)
+
+    def render(self) -> str:
+        lines = [line for collector in self._collectors.values() for line in collector()]
+        return '\n'.join(lines) + '\n' if lines else ''
+
+
+metrics_registry = MetricsRegistry()
@@ -0,0 +1,30 @@
+# Generated by Django 5.1.15 on 2026-10-17 02:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('platform', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ordermodel',
+            index=models.Index(fields=['buyer', 'status', 'id'], name='order_buyer_status_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ordermodel',
+            index=models.Index(
+                fields=['seller', 'status', 'id'], name='order_seller_status_id_idx'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='ordermodel',
+            index=models.Index(fields=['buyer', 'id'], name='order_buyer_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ordermodel',
+            index=models.Index(fields=['seller', 'id'], name='order_seller_id_idx'),
+        ),
+    ]
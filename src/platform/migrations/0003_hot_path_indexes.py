@@ -0,0 +1,32 @@
+# Generated by Django 5.1.15 on 2026-10-17 02:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('platform', '0002_order_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ordermodel',
+            index=models.Index(
+                condition=models.Q(('status', 'cancelled'), _negated=True),
+                fields=['product', 'id'],
+                name='order_product_live_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='productmodel',
+            index=models.Index(
+                condition=models.Q(('is_active', True), ('status', 'available')),
+                fields=['id'],
+                name='product_available_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='productmodel',
+            index=models.Index(fields=['seller', 'id'], name='product_seller_id_idx'),
+        ),
+    ]
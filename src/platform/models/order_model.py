@@ -37,3 +37,16 @@ class OrderModel(models.Model):
         app_label = 'platform'
         db_table = 'order'
         ordering = ['id']
+        # Keyset pages of one buyer or seller, with and without a status filter
+        indexes = [
+            models.Index(fields=['buyer', 'status', 'id'], name='order_buyer_status_id_idx'),
+            models.Index(fields=['seller', 'status', 'id'], name='order_seller_status_id_idx'),
+            models.Index(fields=['buyer', 'id'], name='order_buyer_id_idx'),
+            models.Index(fields=['seller', 'id'], name='order_seller_id_idx'),
+            # get_by_product_id: the live (not cancelled) order of a product
+            models.Index(
+                fields=['product', 'id'],
+                condition=~models.Q(status=OrderStatus.CANCELLED.value),
+                name='order_product_live_idx',
+            ),
+        ]
@@ -29,3 +29,13 @@ class ProductModel(models.Model):
         app_label = 'platform'
         db_table = 'product'
         ordering = ['id']
+        indexes = [
+            # list_available: the small available subset, already in id order
+            models.Index(
+                fields=['id'],
+                condition=models.Q(is_active=True, status=ProductStatus.AVAILABLE.value),
+                name='product_available_idx',
+            ),
+            # get_by_seller
+            models.Index(fields=['seller', 'id'], name='product_seller_id_idx'),
+        ]
@@ -0,0 +1,73 @@
+"""Domain entity construction throughput with and without Logger.io in the domain layer.
+
+LOG_IO_DISABLED_LAYERS is read at import time, so each variant runs in a fresh
+interpreter. Sinks are at INFO, as in production, so the traced variant measures
+wrapper cost rather than log output.
+
+Run with: uv run python -m test.benchmark.bench_entity_construction
+"""
+
+import os
+import subprocess
+import sys
+from time import perf_counter_ns
+
+
+ITERATIONS = 20_000
+VARIANTS = {
+    'traced': '',
+    'domain,validator compiled out': 'domain,validator',
+}
+
+
+def _measure() -> None:
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'src.platform.config.settings')
+
+    from src.domain.entity.order_entity import Order
+    from src.domain.entity.product_entity import Product
+    from src.platform.logging.loguru_io import Logger
+    from src.platform.logging.loguru_io_config import io_log_format
+
+    Logger.base.remove()
+    Logger.base.add(lambda _: None, format=io_log_format, level='INFO')
+
+    start = perf_counter_ns()
+    for i in range(ITERATIONS):
+        Product.create(
+            name='Widget', description='A widget', price=i + 1, seller_id=1, is_active=True
+        )
+    product_ns = (perf_counter_ns() - start) / ITERATIONS
+
+    start = perf_counter_ns()
+    for i in range(ITERATIONS):
+        Order.create(buyer_id=1, seller_id=2, product_id=3, price=i + 1).mark_as_paid()
+    order_ns = (perf_counter_ns() - start) / ITERATIONS
+
+    print(f'{product_ns} {order_ns}')
+
+
+def _run_variant(disabled_layers: str) -> tuple[float, float]:
+    completed = subprocess.run(
+        [sys.executable, '-m', __spec__.name, '--measure'],
+        capture_output=True,
+        check=True,
+        env={**os.environ, 'LOG_IO_DISABLED_LAYERS': disabled_layers},
+        text=True,
+    )
+    product_ns, order_ns = completed.stdout.strip().splitlines()[-1].split()
+    return float(product_ns), float(order_ns)
+
+
+def main() -> None:
+    for label, disabled_layers in VARIANTS.items():
+        product_ns, order_ns = _run_variant(disabled_layers)
+        print(f'[{label}]')
+        print(f'  Product.create           : {1e9 / product_ns:12,.0f} entities/s')
+        print(f'  Order.create+mark_as_paid: {1e9 / order_ns:12,.0f} entities/s')
+
+
+if __name__ == '__main__':
+    if '--measure' in sys.argv:
+        _measure()
+    else:
+        main()
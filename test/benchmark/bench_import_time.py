@@ -0,0 +1,44 @@
+"""Cold-start import time of the ASGI entrypoint.
+
+Every run imports the app in a fresh interpreter, like a uvicorn worker spawn, so
+module caches of the benchmarking process never hide decoration-time costs.
+
+Run with: uv run python -m test.benchmark.bench_import_time
+"""
+
+from statistics import median
+import subprocess
+import sys
+
+
+MODULE = 'src.platform.config.asgi'
+RUNS = 10
+
+_TIMED_IMPORT = (
+    'from time import perf_counter_ns\n'
+    'start = perf_counter_ns()\n'
+    f'import {MODULE}\n'
+    'print(perf_counter_ns() - start)\n'
+)
+
+
+def _import_ms() -> float:
+    completed = subprocess.run(
+        [sys.executable, '-c', _TIMED_IMPORT],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return int(completed.stdout.strip().splitlines()[-1]) / 1_000_000
+
+
+def main() -> None:
+    samples = [_import_ms() for _ in range(RUNS)]
+    print(f'[import {MODULE}] ({RUNS} fresh interpreters)')
+    print(f'  median: {median(samples):8.1f} ms')
+    print(f'  min   : {min(samples):8.1f} ms')
+    print(f'  max   : {max(samples):8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
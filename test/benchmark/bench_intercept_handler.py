@@ -0,0 +1,107 @@
+"""Records per second through InterceptHandler: current handler vs the previous one.
+
+The previous handler is inlined below as it was before the fast path: it split
+access messages on quotes to find the status code, walked ``logging.currentframe()``
+for the call site and bound a fresh loguru logger for every record.
+
+Run with: uv run python -m test.benchmark.bench_intercept_handler
+"""
+
+import logging
+from time import perf_counter
+
+from loguru import logger as loguru_logger
+
+from src.platform.logging.loguru_io import Logger
+from src.platform.logging.loguru_io_config import (
+    BLANK_EXTRA,
+    InterceptHandler,
+    io_log_format,
+)
+
+
+RECORDS = 50_000
+
+
+class LegacyInterceptHandler(logging.Handler):
+    def emit(self, record):
+        message = record.getMessage()
+
+        if (message.startswith('format ') and '->' in message) or (
+            'Using selector: KqueueSelector' in message
+        ):
+            return
+
+        level = None
+        if 'HTTP/1.1' in message:
+            parts = message.split('"')
+            if len(parts) >= 3:
+                try:
+                    status_code = int(parts[2].strip().split()[0])
+                    if status_code >= 500:
+                        level = 'CRITICAL'
+                    elif status_code >= 400:
+                        level = 'ERROR'
+                    elif status_code >= 300:
+                        level = 'WARNING'
+                    elif status_code >= 200:
+                        level = 'SUCCESS'
+                    else:
+                        level = 'INFO'
+                except (ValueError, IndexError):
+                    pass
+        if level is None:
+            try:
+                level = loguru_logger.level(record.levelname).name
+            except ValueError:
+                level = record.levelno
+
+        frame, depth = logging.currentframe(), 2
+        while frame and frame.f_code.co_filename == logging.__file__:
+            frame = frame.f_back
+            depth += 1
+
+        logger_with_extra = loguru_logger.bind(**BLANK_EXTRA)
+        logger_with_extra.opt(depth=depth, exception=record.exc_info).log(level, message)
+
+
+def _records_per_second(handler: logging.Handler, logger_name: str, emit) -> float:
+    stdlib_logger = logging.getLogger(logger_name)
+    saved = stdlib_logger.handlers, stdlib_logger.propagate
+    stdlib_logger.handlers, stdlib_logger.propagate = [handler], False
+    try:
+        start = perf_counter()
+        for i in range(RECORDS):
+            emit(stdlib_logger, i)
+        return RECORDS / (perf_counter() - start)
+    finally:
+        stdlib_logger.handlers, stdlib_logger.propagate = saved
+
+
+def _access(stdlib_logger: logging.Logger, i: int) -> None:
+    status = 404 if i % 10 == 0 else 200
+    stdlib_logger.info(
+        '%s - "%s %s HTTP/%s" %d', '127.0.0.1:51234', 'GET', f'/api/product/{i}', '1.1', status
+    )
+
+
+def _application(stdlib_logger: logging.Logger, i: int) -> None:
+    stdlib_logger.warning('cache miss for %s', i)
+
+
+def main() -> None:
+    Logger.base.remove()
+    Logger.base.add(lambda _: None, format=io_log_format, level=0)
+
+    print(f'{"records":<20} {"previous":>14} {"current":>14}')
+    for label, logger_name, emit in (
+        ('uvicorn access', 'uvicorn.access', _access),
+        ('application', 'bench.app', _application),
+    ):
+        legacy = _records_per_second(LegacyInterceptHandler(), logger_name, emit)
+        current = _records_per_second(InterceptHandler(), logger_name, emit)
+        print(f'{label:<20} {legacy:10.0f} r/s {current:10.0f} r/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""Per-call overhead of `Logger.io` decorated functions.
+
+Run with: uv run python -m test.benchmark.bench_loguru_io
+"""
+
+import asyncio
+from time import perf_counter_ns
+
+from src.platform.logging.loguru_io import Logger
+from src.platform.logging.loguru_io_config import io_log_format
+
+
+ITERATIONS = 20_000
+
+
+def plain(a: int, b: int) -> int:
+    return a + b
+
+
+@Logger.io
+def traced(a: int, b: int) -> int:
+    return a + b
+
+
+async def plain_async(a: int, b: int) -> int:
+    return a + b
+
+
+@Logger.io
+async def traced_async(a: int, b: int) -> int:
+    return a + b
+
+
+async def plain_stream(count: int):
+    for i in range(count):
+        yield i
+
+
+@Logger.io
+async def traced_stream(count: int):
+    for i in range(count):
+        yield i
+
+
+@Logger.io(aggregate=True)
+async def aggregated_stream(count: int):
+    for i in range(count):
+        yield i
+
+
+def _per_item_ns(stream) -> float:
+    async def _run() -> float:
+        start = perf_counter_ns()
+        async for _ in stream(ITERATIONS):
+            pass
+        return (perf_counter_ns() - start) / ITERATIONS
+
+    return asyncio.run(_run())
+
+
+def _per_call_ns(func) -> float:
+    start = perf_counter_ns()
+    for i in range(ITERATIONS):
+        func(i, 1)
+    return (perf_counter_ns() - start) / ITERATIONS
+
+
+def _per_call_ns_async(func) -> float:
+    async def _run() -> float:
+        start = perf_counter_ns()
+        for i in range(ITERATIONS):
+            await func(i, 1)
+        return (perf_counter_ns() - start) / ITERATIONS
+
+    return asyncio.run(_run())
+
+
+def _run_suite(label: str) -> None:
+    sync_plain = _per_call_ns(plain)
+    sync_traced = _per_call_ns(traced)
+    async_plain = _per_call_ns_async(plain_async)
+    async_traced = _per_call_ns_async(traced_async)
+    print(f'[{label}]')
+    print(f'  sync : {sync_traced:10.0f} ns/call (overhead {sync_traced - sync_plain:10.0f} ns)')
+    print(f'  async: {async_traced:10.0f} ns/call (overhead {async_traced - async_plain:10.0f} ns)')
+    stream_plain = _per_item_ns(plain_stream)
+    for name, stream in (('stream', traced_stream), ('stream aggregate', aggregated_stream)):
+        per_item = _per_item_ns(stream)
+        print(
+            f'  {name:<16}: {per_item:10.0f} ns/item (overhead {per_item - stream_plain:10.0f} ns)'
+        )
+
+
+def main() -> None:
+    Logger.base.remove()
+
+    handler_id = Logger.base.add(lambda _: None, format=io_log_format, level='DEBUG')
+    _run_suite('DEBUG sink enabled')
+    Logger.base.remove(handler_id)
+
+    handler_id = Logger.base.add(lambda _: None, format=io_log_format, level='INFO')
+    _run_suite('DEBUG disabled (INFO sink)')
+    Logger.base.remove(handler_id)
+
+    handler_id = Logger.base.add(lambda _: None, format=io_log_format, level='DEBUG')
+    Logger.policies.configure('bench_loguru_io.py', enabled=False)
+    _run_suite('tracing disabled for the target')
+    Logger.policies.reset()
+    Logger.base.remove(handler_id)
+
+
+if __name__ == '__main__':
+    main()
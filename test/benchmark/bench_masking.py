@@ -0,0 +1,110 @@
+"""Masking + rendering cost of traced values: structural engine vs the previous walk.
+
+The previous implementation is inlined below as it was before the bounded repr:
+a recursive copy masking top-level dict keys, a regex pass over ``str()`` of every
+leaf, and word-based truncation of each level.
+
+Run with: uv run python -m test.benchmark.bench_masking
+"""
+
+import os
+from re import sub
+from time import perf_counter_ns
+from typing import Any
+
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'src.platform.config.settings')
+
+from src.driving_adapter.http_controller.schema.order_schema import PaymentRequest  # noqa: E402
+from src.driving_adapter.http_controller.schema.user_schema import UserIn, UserLoginIn  # noqa: E402
+from src.platform.logging.loguru_io_utils import BoundedRepr  # noqa: E402
+
+
+ITERATIONS = 5_000
+
+
+def _legacy_mask_leaf(data: Any) -> Any:
+    try:
+        data_str = str(data)
+        new_data_str = sub(r"\1\2='********'\3", data_str)  # type: ignore[call-arg]
+        return data if data_str == new_data_str else new_data_str
+    except Exception:
+        return data
+
+
+def _legacy_truncate(data: Any, max_words: int = 100) -> Any:
+    words = str(data).split()
+    if len(words) <= max_words:
+        return data
+    truncated = ' '.join(words[:max_words]) + '...'
+    return truncated if isinstance(data, str) else f'{type(data).__name__}({truncated})'
+
+
+def _legacy_mask(data: Any) -> Any:
+    if isinstance(data, dict):
+        processed = {
+            key: _legacy_mask('********' if key == 'password' else value)
+            for key, value in data.items()
+        }
+    elif isinstance(data, list | tuple):
+        processed = type(data)(_legacy_mask(item) for item in data)
+    else:
+        processed = _legacy_mask_leaf(data)
+    return _legacy_truncate(processed)
+
+
+def legacy_render(data: Any) -> str:
+    return f'{_legacy_mask(data)}'
+
+
+PAYLOADS = {
+    'register (UserIn)': (
+        (UserIn(email='buyer@example.com', password='P@ssw0rd123', role='buyer'),),
+        {},
+    ),
+    'login (UserLoginIn)': ((UserLoginIn(email='a@b.com', password='secret-pass'),), {}),
+    'pay (PaymentRequest)': ((7, PaymentRequest(card_number='4111111111111111')), {}),
+    'pay use case kwargs': ((), {'order_id': 7, 'buyer_id': 3, 'card_number': '4111111111111111'}),
+    'order list (50 rows)': (
+        (
+            [
+                {
+                    'id': i,
+                    'buyer_id': 3,
+                    'seller_id': 4,
+                    'product_id': i,
+                    'price': 1_000 + i,
+                    'status': 'paid',
+                    'product_name': f'Product {i}',
+                    'seller_name': 'seller@example.com',
+                }
+                for i in range(50)
+            ],
+        ),
+        {},
+    ),
+}
+
+
+def _per_call_ns(render, args: tuple, kwargs: dict) -> float:
+    start = perf_counter_ns()
+    for _ in range(ITERATIONS):
+        f'args: {render(args)}, kwargs: {render(kwargs)}'
+    return (perf_counter_ns() - start) / ITERATIONS
+
+
+def main() -> None:
+    bounded = BoundedRepr().render
+    print(f'{"payload":<24} {"previous":>12} {"structural":>12}')
+    for label, (args, kwargs) in PAYLOADS.items():
+        legacy_ns = _per_call_ns(legacy_render, args, kwargs)
+        bounded_ns = _per_call_ns(bounded, args, kwargs)
+        print(f'{label:<24} {legacy_ns:9.0f} ns {bounded_ns:9.0f} ns')
+    print()
+    print('Rendered with the structural engine:')
+    for label, (args, kwargs) in PAYLOADS.items():
+        print(f'  {label}: {bounded(args)[:110]} {bounded(kwargs)}')
+
+
+if __name__ == '__main__':
+    main()
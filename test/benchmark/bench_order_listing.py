@@ -0,0 +1,129 @@
+"""Latency and peak memory of a 10k-row order listing: model instances vs SQL projection.
+
+The model-instance listing is inlined below as it was before the projection: it
+loaded orders with ``select_related('product', 'buyer', 'seller')`` and built each
+row's dict, display names included, in Python. The projection is ``order_details``,
+which computes the display names in SQL and returns plain dicts.
+
+Needs a migrated database reachable with the POSTGRES_* settings. Seed rows are
+created once and reused between runs.
+Run with: uv run python -m test.benchmark.bench_order_listing
+"""
+
+import os
+from time import perf_counter
+import tracemalloc
+
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'src.platform.config.settings')
+
+import django  # noqa: E402
+
+
+django.setup()
+
+from django.contrib.auth import get_user_model  # noqa: E402
+
+from src.domain.enum.order_status import OrderStatus  # noqa: E402
+from src.domain.enum.user_role_enum import UserRole  # noqa: E402
+from src.driven_adapter.repo.order_repo_impl import order_details  # noqa: E402
+from src.platform.models.order_model import OrderModel  # noqa: E402
+from src.platform.models.product_model import ProductModel  # noqa: E402
+
+
+ROWS = 10_000
+ROUNDS = 5
+PASSWORD = 'bench-password'
+BUYER_EMAIL = 'bench-list-buyer@example.com'
+SELLER_EMAIL = 'bench-list-seller@example.com'
+
+
+def seed() -> int:
+    user_model = get_user_model()
+    users = {}
+    for email, role in ((BUYER_EMAIL, UserRole.BUYER), (SELLER_EMAIL, UserRole.SELLER)):
+        user = user_model.objects.filter(email=email).first()
+        if user is None:
+            user = user_model(email=email, role=role.value)
+            user.set_password(PASSWORD)
+            user.save()
+        users[role] = user
+    seller, buyer = users[UserRole.SELLER], users[UserRole.BUYER]
+
+    missing = ROWS - OrderModel.objects.filter(seller=seller).count()
+    if missing > 0:
+        products = ProductModel.objects.bulk_create(
+            ProductModel(name=f'Bench item {i}', description='Benchmark', price=100, seller=seller)
+            for i in range(missing)
+        )
+        OrderModel.objects.bulk_create(
+            OrderModel(
+                buyer=buyer,
+                seller=seller,
+                product=product,
+                price=product.price,
+                status=OrderStatus.PENDING_PAYMENT.value,
+            )
+            for product in products
+        )
+    return seller.id
+
+
+def list_with_instances(seller_id: int) -> list[dict]:
+    db_orders = (
+        OrderModel.objects.select_related('product', 'buyer', 'seller')
+        .filter(seller_id=seller_id)
+        .order_by('id')[:ROWS]
+    )
+    return [
+        {
+            'id': db_order.id,
+            'buyer_id': db_order.buyer_id,
+            'seller_id': db_order.seller_id,
+            'product_id': db_order.product_id,
+            'price': db_order.price,
+            'status': db_order.status,
+            'created_at': db_order.created_at,
+            'paid_at': db_order.paid_at,
+            'product_name': getattr(db_order.product, 'name', 'Unknown Product'),
+            'buyer_name': db_order.buyer.first_name or db_order.buyer.email.split('@')[0],
+            'seller_name': db_order.seller.first_name or db_order.seller.email.split('@')[0],
+        }
+        for db_order in db_orders
+    ]
+
+
+def list_with_projection(seller_id: int) -> list[dict]:
+    return list(order_details(seller_id=seller_id)[:ROWS])
+
+
+def measure(listing, seller_id: int) -> tuple[float, float]:
+    """Best wall time in ms and peak traced memory in MiB of one listing."""
+    listing(seller_id)  # Warm up the connection and query compilation
+    best = float('inf')
+    for _ in range(ROUNDS):
+        started = perf_counter()
+        listing(seller_id)
+        best = min(best, perf_counter() - started)
+    tracemalloc.start()
+    listing(seller_id)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1000, peak / (1024 * 1024)
+
+
+def main() -> None:
+    seller_id = seed()
+    assert list_with_instances(seller_id) == list_with_projection(seller_id)
+    print(f'{ROWS} orders, best of {ROUNDS}')
+    print(f'{"listing":<18}{"latency":>12}{"peak memory":>16}')
+    for name, listing in (
+        ('model instances', list_with_instances),
+        ('SQL projection', list_with_projection),
+    ):
+        latency_ms, peak_mib = measure(listing, seller_id)
+        print(f'{name:<18}{latency_ms:>10.1f}ms{peak_mib:>12.1f} MiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""Requests per second on /api/product/ and /api/order/my-orders: ORM vs asyncpg repos.
+
+Each backend is measured in its own interpreter, because REPO_BACKEND is read when
+the dependency injector is built. Requests go through the full Django ASGI app via
+httpx's ASGITransport, so middleware, session auth and serialization are included.
+Seed data is created through the ORM and reused between runs. Logger.io tracing
+is switched off in the measured process.
+
+Needs a migrated database reachable with the POSTGRES_* settings:
+Run with: uv run python -m test.benchmark.bench_repo_backends
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+from time import perf_counter
+
+
+BACKENDS = ('orm', 'asyncpg')
+PATHS = ('/api/product/', '/api/order/my-orders')
+REQUESTS = 2_000
+CONCURRENCY = 20
+PRODUCTS = 50
+PASSWORD = 'bench-password'
+BUYER_EMAIL = 'bench-buyer@example.com'
+SELLER_EMAIL = 'bench-seller@example.com'
+
+
+def seed() -> None:
+    from django.contrib.auth import get_user_model
+
+    from src.domain.enum.order_status import OrderStatus
+    from src.domain.enum.user_role_enum import UserRole
+    from src.platform.models.order_model import OrderModel
+    from src.platform.models.product_model import ProductModel
+
+    user_model = get_user_model()
+    users = {}
+    for email, role in ((BUYER_EMAIL, UserRole.BUYER), (SELLER_EMAIL, UserRole.SELLER)):
+        user = user_model.objects.filter(email=email).first()
+        if user is None:
+            user = user_model(email=email, role=role.value)
+            user.set_password(PASSWORD)
+            user.save()
+        users[role] = user
+
+    seller, buyer = users[UserRole.SELLER], users[UserRole.BUYER]
+    existing = ProductModel.objects.filter(seller=seller).count()
+    for i in range(existing, PRODUCTS):
+        product = ProductModel.objects.create(
+            name=f'Bench product {i}', description='Benchmark item', price=100 + i, seller=seller
+        )
+        if i % 2:
+            OrderModel.objects.create(
+                buyer=buyer,
+                seller=seller,
+                product=product,
+                price=product.price,
+                status=OrderStatus.PENDING_PAYMENT.value,
+            )
+
+
+async def measure() -> dict[str, float]:
+    import httpx
+
+    from src.platform.config.asgi import django_asgi_app
+
+    transport = httpx.ASGITransport(app=django_asgi_app)
+    results = {}
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+        response = await client.post(
+            '/api/user/login/', json={'email': BUYER_EMAIL, 'password': PASSWORD}
+        )
+        response.raise_for_status()
+
+        for path in PATHS:
+            await client.get(path)  # Warm up: pool, statement caches, URL resolver
+
+            async def worker(path: str, count: int) -> None:
+                for _ in range(count):
+                    (await client.get(path)).raise_for_status()
+
+            started = perf_counter()
+            await asyncio.gather(
+                *(worker(path, REQUESTS // CONCURRENCY) for _ in range(CONCURRENCY))
+            )
+            results[path] = REQUESTS / (perf_counter() - started)
+    return results
+
+
+def run_backend(backend: str) -> dict[str, float]:
+    env = dict(os.environ, REPO_BACKEND=backend)
+    output = subprocess.run(
+        [sys.executable, '-m', 'test.benchmark.bench_repo_backends', '--measure'],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    results = {}
+    for line in output.splitlines():
+        if line.startswith('RESULT '):
+            _, path, value = line.split()
+            results[path] = float(value)
+    return results
+
+
+def main() -> None:
+    print(f'{REQUESTS} requests per endpoint, {CONCURRENCY} concurrent clients')
+    results = {backend: run_backend(backend) for backend in BACKENDS}
+    print(f'{"endpoint":<24}' + ''.join(f'{backend:>12}' for backend in BACKENDS))
+    for path in PATHS:
+        row = ''.join(f'{results[backend][path]:>10.0f}/s' for backend in BACKENDS)
+        print(f'{path:<24}{row}')
+
+
+if __name__ == '__main__':
+    if '--measure' in sys.argv:
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'src.platform.config.settings')
+        import django
+
+        django.setup()
+        from src.platform.logging.log_control import apply_log_settings
+
+        # Leave tracing out of the comparison; it costs the same for both backends
+        apply_log_settings({'stdout': 'ERROR'}, {'src': False})
+        seed()
+        for path, value in asyncio.run(measure()).items():
+            print(f'RESULT {path} {value:.1f}')
+    else:
+        main()
@@ -5,6 +5,7 @@ from pathlib import Path
 
 from django.contrib.auth import get_user_model
 from dotenv import load_dotenv
+from ninja.testing.client import NinjaResponse
 from ninja_extra.testing import TestAsyncClient
 import pytest
 
@@ -35,6 +36,7 @@ class SessionTestAsyncClient(TestAsyncClient):
     1. Django Ninja's TestAsyncClient doesn't support session by default
     2. We need session for Django's login() to work properly
     3. We need to load user from session for each request to support authentication
+    4. NinjaResponse joins streaming content synchronously, which fails for async streams
     """
 
     def __init__(self, *args, **kwargs):
@@ -76,6 +78,13 @@ class SessionTestAsyncClient(TestAsyncClient):
 
         return mock
 
+    async def _call(self, func, request, kwargs):
+        """Drain async streaming responses here, where the event loop is running."""
+        response = await func(request, **kwargs)
+        if getattr(response, 'is_async', False):
+            response.streaming_content = [b''.join([c async for c in response.streaming_content])]
+        return NinjaResponse(response)
+
 
 @pytest.fixture(scope='session')
 def api_instance():
@@ -1,7 +1,12 @@
 """Integration tests for order list functionality."""
 
+from datetime import datetime, timezone
+import json
+
 import pytest
 
+from src.driven_adapter.repo.order_repo_impl import OrderRepoImpl
+from src.platform.constant.route_constant import ORDER_EXPORT
 from test.order.integration.util import (
     given_logged_in_as_buyer,
     given_logged_in_as_seller,
@@ -389,7 +394,7 @@ class TestOrderList:
         await then_response_should_contain_orders(response, 2)
 
         # All orders should have status 'paid'
-        data = response.json()
+        data = response.json()['items']
         for order in data:
             assert order['status'] == 'paid', f"Expected status 'paid', got '{order['status']}'"
 
@@ -468,8 +473,184 @@ class TestOrderList:
         await then_response_should_contain_orders(response, 1)
 
         # All orders should have status 'pending_payment'
-        data = response.json()
+        data = response.json()['items']
         for order in data:
             assert order['status'] == 'pending_payment', (
                 f"Expected status 'pending_payment', got '{order['status']}'"
             )
+
+    async def test_seller_pages_through_orders_with_cursor(self, client):
+        """Test that a seller walks their orders page by page with next_cursor."""
+        # Given a seller with five orders, two of them paid
+        users = await given_users_exist(
+            client,
+            [
+                {'email': SELLER1_EMAIL, 'password': DEFAULT_PASSWORD, 'role': 'seller'},
+                {'email': BUYER1_EMAIL, 'password': DEFAULT_PASSWORD, 'role': 'buyer'},
+            ],
+        )
+        seller1_id = users[SELLER1_EMAIL]
+        products = await given_products_exist(
+            client,
+            seller1_id,
+            [{'name': f'Product {i}', 'price': 1000 + i, 'status': 'sold'} for i in range(5)],
+        )
+        order_ids = await given_orders_exist(
+            client,
+            [
+                {
+                    'buyer_id': users[BUYER1_EMAIL],
+                    'seller_id': seller1_id,
+                    'product_id': product_id,
+                    'price': 1000 + i,
+                    'status': 'paid' if i in (1, 3) else 'pending_payment',
+                }
+                for i, product_id in enumerate(products)
+            ],
+        )
+
+        # When the seller requests pages of two orders
+        await given_logged_in_as_seller(client, SELLER1_EMAIL, DEFAULT_PASSWORD)
+        pages, cursor = [], None
+        while True:
+            query = f'?limit=2&cursor={cursor}' if cursor else '?limit=2'
+            response = await client.get(f'/order/my-orders{query}')
+            await then_response_status_code_should_be(response, 200)
+            pages.append([order['id'] for order in response.json()['items']])
+            cursor = response.json()['next_cursor']
+            if cursor is None:
+                break
+
+        # Then every order is returned once, in id order
+        assert pages == [order_ids[0:2], order_ids[2:4], order_ids[4:5]]
+
+        # And a status filter is applied before paging
+        response = await client.get(f'/order/seller/{seller1_id}?order_status=paid&limit=1')
+        assert [order['id'] for order in response.json()['items']] == [order_ids[1]]
+        next_cursor = response.json()['next_cursor']
+        response = await client.get(
+            f'/order/seller/{seller1_id}?order_status=paid&limit=1&cursor={next_cursor}'
+        )
+        assert [order['id'] for order in response.json()['items']] == [order_ids[3]]
+        assert response.json()['next_cursor'] is None
+
+    async def test_export_iterates_every_order_in_chunks(self, client):
+        """Test that the export iterator walks all matching orders across chunks."""
+        # Given a seller with five orders, two of them paid
+        users = await given_users_exist(
+            client,
+            [
+                {'email': SELLER1_EMAIL, 'password': DEFAULT_PASSWORD, 'role': 'seller'},
+                {'email': BUYER1_EMAIL, 'password': DEFAULT_PASSWORD, 'role': 'buyer'},
+            ],
+        )
+        seller1_id = users[SELLER1_EMAIL]
+        products = await given_products_exist(
+            client,
+            seller1_id,
+            [{'name': f'Product {i}', 'price': 1000 + i, 'status': 'sold'} for i in range(5)],
+        )
+        order_ids = await given_orders_exist(
+            client,
+            [
+                {
+                    'buyer_id': users[BUYER1_EMAIL],
+                    'seller_id': seller1_id,
+                    'product_id': product_id,
+                    'price': 1000 + i,
+                    'status': 'paid' if i in (1, 3) else 'pending_payment',
+                }
+                for i, product_id in enumerate(products)
+            ],
+        )
+        repo = OrderRepoImpl()
+
+        # When
+        exported = [
+            order
+            async for order in repo.iter_orders_with_details(seller_id=seller1_id, chunk_size=2)
+        ]
+        paid = [
+            order
+            async for order in repo.iter_orders_with_details(
+                seller_id=seller1_id, status='paid', chunk_size=1
+            )
+        ]
+
+        # Then
+        assert [order['id'] for order in exported] == order_ids
+        assert exported[0]['product_name'] == 'Product 0'
+        assert [order['id'] for order in paid] == [order_ids[1], order_ids[3]]
+
+    async def test_export_streams_the_user_orders_as_ndjson(self, client):
+        """Test that /order/export streams the caller's orders, one JSON document per line."""
+        # Given two buyers with orders from one seller, created on different days
+        users = await given_users_exist(
+            client,
+            [
+                {'email': SELLER1_EMAIL, 'password': DEFAULT_PASSWORD, 'role': 'seller'},
+                {'email': BUYER1_EMAIL, 'password': DEFAULT_PASSWORD, 'role': 'buyer'},
+                {'email': BUYER2_EMAIL, 'password': DEFAULT_PASSWORD, 'role': 'buyer'},
+            ],
+        )
+        seller1_id = users[SELLER1_EMAIL]
+        buyers = [users[BUYER1_EMAIL], users[BUYER1_EMAIL], users[BUYER2_EMAIL]]
+        products = await given_products_exist(
+            client,
+            seller1_id,
+            [{'name': f'Product {i}', 'price': 1000 + i, 'status': 'sold'} for i in range(3)],
+        )
+        order_ids = await given_orders_exist(
+            client,
+            [
+                {
+                    'buyer_id': buyers[i],
+                    'seller_id': seller1_id,
+                    'product_id': product_id,
+                    'price': 1000 + i,
+                    'status': 'paid' if i == 1 else 'pending_payment',
+                    'created_at': datetime(2025, 1, 10 + i, tzinfo=timezone.utc),
+                }
+                for i, product_id in enumerate(products)
+            ],
+        )
+
+        async def export(query: str = '') -> list[dict]:
+            response = await client.get(f'{ORDER_EXPORT}{query}')
+            await then_response_status_code_should_be(response, 200)
+            assert response['Content-Type'] == 'application/x-ndjson'
+            assert response['Content-Disposition'] == 'attachment; filename="orders.ndjson"'
+            body = response.content.decode()
+            assert body == '' or body.endswith('\n')
+            return [json.loads(line) for line in body.splitlines()]
+
+        # When no one is logged in
+        response = await client.get(ORDER_EXPORT)
+
+        # Then the export is refused
+        await then_response_status_code_should_be(response, 403)
+
+        # When the seller exports, with and without filters
+        await given_logged_in_as_seller(client, SELLER1_EMAIL, DEFAULT_PASSWORD)
+        seller_orders = await export()
+        seller_paid = await export('?order_status=paid')
+        seller_window = await export(
+            '?created_after=2025-01-11T00:00:00Z&created_before=2025-01-12T00:00:00Z'
+        )
+
+        # Then every order of the seller's products is streamed, filtered in the database
+        assert [order['id'] for order in seller_orders] == order_ids
+        assert seller_orders[0]['product_name'] == 'Product 0'
+        assert [order['id'] for order in seller_paid] == [order_ids[1]]
+        assert [order['id'] for order in seller_window] == [order_ids[1]]
+
+        # When the buyer exports, with and without filters
+        await given_logged_in_as_buyer(client, BUYER1_EMAIL, DEFAULT_PASSWORD)
+        buyer_orders = await export()
+        buyer_pending = await export('?order_status=pending_payment')
+        buyer_after = await export('?created_after=2025-01-11T00:00:00Z')
+
+        # Then only the buyer's own orders are streamed
+        assert [order['id'] for order in buyer_orders] == order_ids[:2]
+        assert [order['id'] for order in buyer_pending] == [order_ids[0]]
+        assert [order['id'] for order in buyer_after] == [order_ids[1]]
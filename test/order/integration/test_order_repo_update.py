@@ -0,0 +1,56 @@
+"""OrderRepoImpl.update writes and re-reads the order in a single statement."""
+
+from django.contrib.auth import get_user_model
+import pytest
+
+from src.domain.entity.order_entity import OrderStatus
+from src.driven_adapter.repo import order_repo_impl
+from src.driven_adapter.repo.order_repo_impl import OrderRepoImpl
+from src.platform.database.db_executor import db_executor
+from src.platform.models.order_model import OrderModel
+from src.platform.models.product_model import ProductModel
+from test.shared.utils import capture_repo_queries
+from test.util_constant import TEST_BUYER_EMAIL, TEST_SELLER_EMAIL
+
+
+def _create_order() -> int:
+    user_model = get_user_model()
+    seller = user_model.objects.create(email=TEST_SELLER_EMAIL, role='seller')
+    buyer = user_model.objects.create(email=TEST_BUYER_EMAIL, role='buyer')
+    product = ProductModel.objects.create(
+        name='Desk', description='Oak desk', price=300, seller=seller
+    )
+    return OrderModel.objects.create(
+        buyer=buyer, seller=seller, product=product, price=product.price
+    ).id
+
+
+@pytest.mark.django_db(transaction=True)
+class TestOrderRepoUpdate:
+    @pytest.mark.asyncio
+    async def test_update_is_one_statement(self, monkeypatch):
+        # Given
+        repo = OrderRepoImpl()
+        order = await repo.get_by_id(await db_executor.run(_create_order))
+        paid_order = order.mark_as_paid()
+
+        # When
+        async with capture_repo_queries(monkeypatch, order_repo_impl) as queries:
+            updated = await repo.update(paid_order)
+
+        # Then
+        assert len(queries) == 1
+        assert queries[0]['sql'].startswith('UPDATE "order"')
+        assert updated.status == OrderStatus.PAID
+        assert updated.paid_at == paid_order.paid_at
+        assert updated.created_at == order.created_at
+
+    @pytest.mark.asyncio
+    async def test_update_of_missing_order_raises(self):
+        # Given
+        order = await OrderRepoImpl().get_by_id(await db_executor.run(_create_order))
+        order.id = order.id + 1000
+
+        # When / Then
+        with pytest.raises(ValueError, match='not found'):
+            await OrderRepoImpl().update(order)
@@ -167,6 +167,11 @@ async def given_orders_exist(client: TestAsyncClient, orders_data: list[dict]) -
             paid_at=paid_at,
         )
         await sync_to_async(order_model.save)()
+        if order.get('created_at'):
+            # created_at is auto_now_add, so it can only be backdated after the insert
+            await sync_to_async(OrderModel.objects.filter(id=order_model.id).update)(
+                created_at=order['created_at']
+            )
         order_ids.append(order_model.id)
 
     return order_ids
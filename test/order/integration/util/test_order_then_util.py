@@ -52,15 +52,15 @@ async def then_response_status_code_should_be(response, expected_status: int):
 
 
 async def then_response_should_contain_orders(response, expected_count: int):
-    """Assert response contains expected number of orders."""
-    data = response.json()
+    """Assert the response page contains expected number of orders."""
+    data = response.json()['items']
     assert isinstance(data, list), f'Expected list, got {type(data)}'
     assert len(data) == expected_count, f'Expected {expected_count} orders, got {len(data)}'
 
 
 async def then_orders_should_include(response, expected_orders: list[dict]):
-    """Assert orders in response match expected values."""
-    data = response.json()
+    """Assert orders in the response page match expected values."""
+    data = response.json()['items']
     assert len(data) >= len(expected_orders), (
         f'Expected at least {len(expected_orders)} orders, got {len(data)}'
     )
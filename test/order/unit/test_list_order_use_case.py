@@ -0,0 +1,120 @@
+"""Unit tests for ListOrdersUseCase keyset pages and the order export stream."""
+
+from datetime import datetime, timezone
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.app.use_case.order.list_order_use_case import (
+    MAX_PAGE_SIZE,
+    ListOrdersUseCase,
+    decode_cursor,
+    encode_cursor,
+)
+from src.driving_adapter.http_controller import order_controller
+from src.platform.exception.exceptions import DomainError
+
+
+def _use_case_returning(orders: list[dict]) -> tuple[ListOrdersUseCase, Mock]:
+    order_repo = Mock()
+    order_repo.list_orders_with_details = AsyncMock(return_value=orders)
+    return ListOrdersUseCase(order_repo), order_repo
+
+
+@pytest.mark.asyncio
+async def test_page_has_next_cursor_when_more_orders_follow():
+    # Given: the repo returns one row more than the page size
+    use_case, order_repo = _use_case_returning([{'id': 3}, {'id': 7}, {'id': 9}])
+
+    # When
+    page = await use_case.list_buyer_orders(1, status='paid', limit=2)
+
+    # Then
+    assert page['items'] == [{'id': 3}, {'id': 7}]
+    assert decode_cursor(page['next_cursor']) == 7
+    order_repo.list_orders_with_details.assert_awaited_once_with(
+        after_id=None,
+        limit=3,
+        buyer_id=1,
+        status='paid',
+        created_after=None,
+        created_before=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_last_page_has_no_next_cursor_and_cursor_is_passed_as_after_id():
+    # Given
+    use_case, order_repo = _use_case_returning([{'id': 9}])
+
+    # When
+    page = await use_case.list_seller_orders(2, cursor=encode_cursor(7), limit=2)
+
+    # Then
+    assert page == {'items': [{'id': 9}], 'next_cursor': None}
+    assert order_repo.list_orders_with_details.await_args.kwargs['after_id'] == 7
+    assert order_repo.list_orders_with_details.await_args.kwargs['seller_id'] == 2
+
+
+@pytest.mark.asyncio
+async def test_limit_is_clamped():
+    use_case, order_repo = _use_case_returning([])
+
+    await use_case.list_buyer_orders(1, limit=10_000)
+
+    assert order_repo.list_orders_with_details.await_args.kwargs['limit'] == MAX_PAGE_SIZE + 1
+
+
+@pytest.mark.parametrize('cursor', ['not-base64!', encode_cursor(-1), 'YWJj'])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(DomainError, match='Invalid cursor'):
+        decode_cursor(cursor)
+
+
+@pytest.mark.asyncio
+async def test_export_streams_the_repo_iterator_for_one_owner():
+    # Given
+    async def rows():
+        yield {'id': 1}
+        yield {'id': 2}
+
+    order_repo = Mock()
+    order_repo.iter_orders_with_details = Mock(return_value=rows())
+    use_case = ListOrdersUseCase(order_repo)
+
+    # When
+    exported = [row async for row in use_case.export_orders(seller_id=2, status='paid')]
+
+    # Then
+    assert exported == [{'id': 1}, {'id': 2}]
+    assert order_repo.iter_orders_with_details.call_args.kwargs['seller_id'] == 2
+    assert order_repo.iter_orders_with_details.call_args.kwargs['status'] == 'paid'
+
+
+@pytest.mark.parametrize('owner', [{}, {'buyer_id': 1, 'seller_id': 2}])
+def test_export_needs_exactly_one_owner(owner):
+    use_case, _ = _use_case_returning([])
+
+    with pytest.raises(DomainError, match='exactly one'):
+        use_case.export_orders(**owner)
+
+
+@pytest.mark.asyncio
+async def test_ndjson_lines_are_batched_json_documents(monkeypatch):
+    # Given
+    monkeypatch.setattr(order_controller, 'NDJSON_LINES_PER_WRITE', 2)
+    created_at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+    async def rows():
+        for order_id in range(3):
+            yield {'id': order_id, 'created_at': created_at, 'paid_at': None}
+
+    # When
+    chunks = [chunk async for chunk in order_controller._ndjson_lines(rows())]
+
+    # Then
+    assert len(chunks) == 2
+    lines = b''.join(chunks).decode().splitlines()
+    assert [json.loads(line)['id'] for line in lines] == [0, 1, 2]
+    assert json.loads(lines[0])['created_at'] == '2026-01-02T03:04:05Z'
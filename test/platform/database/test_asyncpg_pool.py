@@ -0,0 +1,127 @@
+"""Unit tests for the per-event-loop asyncpg pool."""
+
+import asyncio
+import threading
+from urllib.parse import unquote, urlsplit
+
+import asyncpg
+from pydantic import SecretStr
+
+from src.platform.config.env_config import env_config
+from src.platform.database.asyncpg_pool import AsyncpgPool
+
+
+class FakePool:
+    def __init__(self):
+        self.closed_on = None
+        self.terminated = False
+
+    @property
+    def closed(self):
+        return self.closed_on is not None
+
+    async def close(self):
+        self.closed_on = asyncio.get_running_loop()
+
+    def terminate(self):
+        self.terminated = True
+
+
+def _fake_create_pool(monkeypatch) -> list[FakePool]:
+    created = []
+
+    async def create_pool(dsn, **kwargs):
+        await asyncio.sleep(0)
+        created.append(FakePool())
+        return created[-1]
+
+    monkeypatch.setattr(asyncpg, 'create_pool', create_pool)
+    return created
+
+
+def test_pool_is_created_once_per_loop(monkeypatch):
+    # Given
+    created = _fake_create_pool(monkeypatch)
+    pool = AsyncpgPool('postgresql://bench@localhost/db')
+
+    async def get_concurrently():
+        return await asyncio.gather(*(pool.get() for _ in range(5)))
+
+    # When
+    first_loop = asyncio.run(get_concurrently())
+    second_loop = asyncio.run(get_concurrently())
+
+    # Then the first loop's pool is dropped, its loop having stopped
+    assert len(created) == 2
+    assert set(map(id, first_loop)) == {id(created[0])}
+    assert set(map(id, second_loop)) == {id(created[1])}
+    assert created[0].terminated and not created[1].terminated
+
+
+def test_close_closes_the_pool_of_the_running_loop(monkeypatch):
+    # Given
+    created = _fake_create_pool(monkeypatch)
+    pool = AsyncpgPool('postgresql://bench@localhost/db')
+
+    async def get_then_close():
+        await pool.get()
+        await pool.close()
+        await pool.close()
+
+    # When
+    asyncio.run(get_then_close())
+
+    # Then
+    assert created[0].closed
+
+
+def test_close_from_another_loop_closes_the_pool_on_its_own_loop(monkeypatch):
+    # Given a pool created on a loop running in another thread
+    created = _fake_create_pool(monkeypatch)
+    pool = AsyncpgPool('postgresql://bench@localhost/db')
+    owner = asyncio.new_event_loop()
+    thread = threading.Thread(target=owner.run_forever, daemon=True)
+    thread.start()
+    asyncio.run_coroutine_threadsafe(pool.get(), owner).result(timeout=2)
+
+    # When
+    try:
+        asyncio.run(pool.close())
+    finally:
+        owner.call_soon_threadsafe(owner.stop)
+        thread.join(timeout=2)
+        owner.close()
+
+    # Then
+    assert created[0].closed_on is owner
+    assert not created[0].terminated
+
+
+def test_close_after_the_owning_loop_stopped_terminates_the_pool(monkeypatch):
+    # Given
+    created = _fake_create_pool(monkeypatch)
+    pool = AsyncpgPool('postgresql://bench@localhost/db')
+    asyncio.run(pool.get())
+
+    # When
+    asyncio.run(pool.close())
+
+    # Then
+    assert created[0].terminated
+    assert not created[0].closed
+
+
+def test_database_url_keeps_special_characters_in_credentials():
+    # Given
+    config = env_config.model_copy(
+        update={'POSTGRES_USER': 'app:ro', 'POSTGRES_PASSWORD': SecretStr('p@ss:w/rd#1')}
+    )
+
+    # When
+    url = urlsplit(config.DATABASE_URL_SYNC)
+
+    # Then
+    assert unquote(url.username) == 'app:ro'
+    assert unquote(url.password) == 'p@ss:w/rd#1'
+    assert (url.hostname, url.port) == (config.POSTGRES_SERVER, config.POSTGRES_PORT)
+    assert url.path == f'/{config.POSTGRES_DB}'
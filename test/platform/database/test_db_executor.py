@@ -0,0 +1,131 @@
+"""Unit tests for the DB executor; the jobs here never open a connection."""
+
+import asyncio
+import contextvars
+import threading
+
+from django.db import connection
+import pytest
+
+from src.platform.database.db_executor import QUEUE_DEPTH_METRIC, WAIT_METRIC, DBExecutor
+
+
+request_id = contextvars.ContextVar('request_id', default=None)
+
+
+@pytest.fixture
+def executor():
+    executor = DBExecutor(max_workers=2, name='test-db')
+    yield executor
+    executor.shutdown()
+
+
+async def test_run_returns_result_and_copies_context(executor):
+    # Given
+    request_id.set('req-1')
+
+    # When
+    result = await executor.run(lambda prefix: f'{prefix}:{request_id.get()}', 'seen')
+
+    # Then
+    assert result == 'seen:req-1'
+
+
+async def test_run_propagates_exceptions(executor):
+    def fail():
+        raise LookupError('missing row')
+
+    with pytest.raises(LookupError, match='missing row'):
+        await executor.run(fail)
+
+
+async def test_only_worker_connections_are_persistent():
+    # Given
+    executor = DBExecutor(max_workers=1, name='test-db', conn_max_age=60)
+
+    # When
+    worker_max_age = await executor.run(lambda: connection.settings_dict['CONN_MAX_AGE'])
+    executor.shutdown()
+
+    # Then request threads keep closing their connection after each request
+    assert worker_max_age == 60
+    assert connection.settings_dict['CONN_MAX_AGE'] == 0
+
+
+async def test_jobs_run_concurrently_on_separate_workers(executor):
+    # Given: each job waits until both are running
+    barrier = threading.Barrier(2, timeout=2)
+
+    def job():
+        barrier.wait()
+        return threading.current_thread().name
+
+    # When
+    names = await asyncio.gather(executor.run(job), executor.run(job))
+
+    # Then
+    assert len(set(names)) == 2
+    assert all(name.startswith('test-db') for name in names)
+
+
+async def test_metrics_count_queued_jobs_and_waits():
+    # Given: one worker kept busy so the next job queues
+    executor = DBExecutor(max_workers=1, name='test-db')
+    release = threading.Event()
+    busy = asyncio.ensure_future(executor.run(release.wait, 2))
+    queued = asyncio.ensure_future(executor.run(lambda: None))
+    await asyncio.sleep(0.05)
+
+    # When
+    during = list(executor.collect())
+    release.set()
+    await asyncio.gather(busy, queued)
+    executor.shutdown()
+
+    # Then
+    assert f'{QUEUE_DEPTH_METRIC} 1' in during
+    assert executor.queued == 0 and executor.in_flight == 0
+    assert f'{WAIT_METRIC}_count 2' in list(executor.collect())
+
+
+async def test_cancelled_queued_job_leaves_the_queue():
+    # Given: one worker kept busy and a second job waiting behind it
+    executor = DBExecutor(max_workers=1, name='test-db')
+    release = threading.Event()
+    busy = asyncio.ensure_future(executor.run(release.wait, 2))
+    ran = threading.Event()
+    queued = asyncio.ensure_future(executor.run(ran.set))
+    await asyncio.sleep(0.05)
+
+    # When
+    queued.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+    during = executor.queued
+    release.set()
+    await busy
+    executor.shutdown()
+
+    # Then
+    assert during == 0
+    assert not ran.is_set()
+    assert executor.queued == 0 and executor.in_flight == 0
+
+
+async def test_shutdown_drops_queued_jobs_from_the_queue():
+    # Given
+    executor = DBExecutor(max_workers=1, name='test-db')
+    release = threading.Event()
+    busy = asyncio.ensure_future(executor.run(release.wait, 2))
+    queued = asyncio.ensure_future(executor.run(lambda: None))
+    await asyncio.sleep(0.05)
+
+    # When
+    executor.shutdown(wait=False)
+    release.set()
+    await busy
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+
+    # Then
+    assert executor.queued == 0 and executor.in_flight == 0
@@ -0,0 +1,96 @@
+"""Unit tests for pool statistics and the readiness endpoint, without a database."""
+
+from django.db import OperationalError
+from ninja_extra.testing import TestAsyncClient
+import pytest
+
+from src.driving_adapter.http_controller import health_controller
+from src.platform.constant.route_constant import HEALTH_READY
+from src.platform.database import db_pool
+from src.platform.database.db_executor import DBExecutor
+
+
+class FakePool:
+    max_size = 10
+
+    def get_stats(self):
+        return {
+            'pool_max': 10,
+            'pool_size': 4,
+            'pool_available': 1,
+            'requests_waiting': 2,
+            'requests_num': 120,
+            'requests_wait_ms': 1500,
+            'requests_errors': 3,
+        }
+
+
+@pytest.fixture
+def ready(monkeypatch):
+    # A fresh executor: workers of the shared one keep connections from earlier DB tests
+    executor = DBExecutor(max_workers=1, name='test-db')
+    monkeypatch.setattr(health_controller, 'db_executor', executor)
+    db_pool.ready.set()
+    yield
+    db_pool.ready.clear()
+    executor.shutdown()
+
+
+def test_pool_stats_split_connections_by_state(monkeypatch):
+    # Given
+    monkeypatch.setattr(db_pool, 'db_pool', lambda alias='default': FakePool())
+
+    # When
+    stats = db_pool.pool_stats()
+    lines = list(db_pool.collect())
+
+    # Then
+    assert stats['in_use'] == 3 and stats['idle'] == 1
+    assert 'db_pool_connections{state="in_use"} 3' in lines
+    assert 'db_pool_requests_waiting 2' in lines
+    assert 'db_pool_wait_seconds_total 1.5' in lines
+    assert 'db_pool_timeouts_total 3' in lines
+
+
+def test_collect_is_empty_without_pooling(monkeypatch):
+    monkeypatch.setattr(db_pool, 'db_pool', lambda alias='default': None)
+
+    assert list(db_pool.collect()) == []
+
+
+async def test_readiness_is_unavailable_outside_the_lifespan(api_instance):
+    response = await TestAsyncClient(api_instance).get(HEALTH_READY)
+
+    assert response.status_code == 503
+    assert response.json() == {'status': 'not_ready'}
+
+
+async def test_readiness_reports_pool_stats(api_instance, monkeypatch, ready):
+    # Given
+    monkeypatch.setattr(health_controller, 'check_database', lambda: None)
+    monkeypatch.setattr(db_pool, 'db_pool', lambda alias='default': FakePool())
+
+    # When
+    response = await TestAsyncClient(api_instance).get(HEALTH_READY)
+
+    # Then
+    assert response.status_code == 200
+    body = response.json()
+    assert body['status'] == 'ready'
+    assert body['db_pool']['in_use'] == 3
+    assert body['db_executor']['queued'] == 0
+
+
+async def test_readiness_fails_when_database_is_unreachable(api_instance, monkeypatch, ready):
+    # Given
+    def unreachable():
+        raise OperationalError('connection to server at "db.internal" failed for user "app"')
+
+    monkeypatch.setattr(health_controller, 'check_database', unreachable)
+
+    # When
+    response = await TestAsyncClient(api_instance).get(HEALTH_READY)
+
+    # Then
+    assert response.status_code == 503
+    assert response.json() == {'status': 'database_unavailable'}
@@ -0,0 +1,156 @@
+"""Repository reads must be served by indexes, never by a sequential scan.
+
+The dataset is seeded and analyzed, then every read query the repositories issue
+is captured and re-run under ``EXPLAIN`` with ``enable_seqscan`` off: the planner
+still picks a sequential scan when no index can answer the query, so a missing or
+unusable index shows up as a ``Seq Scan`` node regardless of the table size.
+"""
+
+import json
+from typing import Any, Iterator, List
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+import pytest
+
+from src.domain.entity.order_entity import OrderStatus
+from src.domain.enum.product_status import ProductStatus
+from src.driven_adapter.repo import order_repo_impl, product_repo_impl, user_repo_impl
+from src.driven_adapter.repo.order_repo_impl import OrderRepoImpl
+from src.driven_adapter.repo.product_repo_impl import ProductRepoImpl
+from src.driven_adapter.repo.user_repo_impl import UserRepoImpl
+from src.platform.database.db_executor import db_executor
+from src.platform.models.order_model import OrderModel
+from src.platform.models.product_model import ProductModel
+from test.shared.utils import capture_repo_queries
+from test.util_constant import TEST_BUYER_EMAIL, TEST_SELLER_EMAIL
+
+
+PRODUCT_COUNT = 2000
+AVAILABLE_EVERY = 40  # A small available subset, as in a catalogue that has mostly sold
+
+
+def _seed() -> dict[str, int]:
+    user_model = get_user_model()
+    seller = user_model.objects.create(email=TEST_SELLER_EMAIL, role='seller')
+    buyer = user_model.objects.create(email=TEST_BUYER_EMAIL, role='buyer')
+    buyer.groups.add(Group.objects.get_or_create(name='buyer')[0])
+    products = ProductModel.objects.bulk_create(
+        ProductModel(
+            name=f'Product {i}',
+            description='Seeded',
+            price=100 + i,
+            seller=seller,
+            status=(
+                ProductStatus.AVAILABLE.value
+                if i % AVAILABLE_EVERY == 0
+                else ProductStatus.SOLD.value
+            ),
+        )
+        for i in range(PRODUCT_COUNT)
+    )
+    OrderModel.objects.bulk_create(
+        OrderModel(
+            buyer=buyer,
+            seller=seller,
+            product=product,
+            price=product.price,
+            status=OrderStatus.CANCELLED.value if i % 2 else OrderStatus.PAID.value,
+        )
+        for i, product in enumerate(products)
+    )
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+    return {'seller_id': seller.id, 'buyer_id': buyer.id, 'product_id': products[-1].id}
+
+
+def _buyer_group_query(buyer_id: int) -> List[dict[str, Any]]:
+    # The lookup IsBuyer runs on every buyer request
+    with CaptureQueriesContext(connection) as context:
+        get_user_model().objects.get(id=buyer_id).groups.filter(name='buyer').exists()
+    return context.captured_queries[-1:]
+
+
+def _plan(sql: str) -> list:
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute('SET LOCAL enable_seqscan = off')
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}')
+        plan = cursor.fetchone()[0]
+    return json.loads(plan) if isinstance(plan, str) else plan
+
+
+def _nodes(node: Any) -> Iterator[dict]:
+    if isinstance(node, list):
+        for item in node:
+            yield from _nodes(item)
+    elif isinstance(node, dict):
+        if 'Node Type' in node:
+            yield node
+        for child in (node.get('Plan'), node.get('Plans')):
+            if child is not None:
+                yield from _nodes(child)
+
+
+async def _repo_queries(monkeypatch, seeded: dict[str, int]) -> List[dict[str, Any]]:
+    order_repo, product_repo, user_repo = OrderRepoImpl(), ProductRepoImpl(), UserRepoImpl()
+    buyer_id, seller_id = seeded['buyer_id'], seeded['seller_id']
+    async with capture_repo_queries(
+        monkeypatch, order_repo_impl, product_repo_impl, user_repo_impl
+    ) as queries:
+        await order_repo.get_by_id(1)
+        await order_repo.get_by_product_id(seeded['product_id'])
+        await order_repo.get_by_buyer(buyer_id)
+        await order_repo.get_by_seller(seller_id)
+        await order_repo.list_orders_with_details(buyer_id=buyer_id, limit=50)
+        await order_repo.list_orders_with_details(
+            seller_id=seller_id, status=OrderStatus.PAID.value, after_id=100, limit=50
+        )
+        async for _ in order_repo.iter_orders_with_details(buyer_id=buyer_id, chunk_size=500):
+            pass
+        await product_repo.get_by_id(seeded['product_id'])
+        await product_repo.get_by_id_with_seller(seeded['product_id'])
+        await product_repo.get_by_seller(seller_id)
+        await product_repo.list_available()
+        await user_repo.get_by_id(buyer_id)
+    return [query for query in queries if query['sql'].lstrip().upper().startswith('SELECT')]
+
+
+@pytest.mark.django_db(transaction=True)
+class TestQueryPlans:
+    @pytest.mark.asyncio
+    async def test_no_repo_query_scans_a_table_sequentially(self, monkeypatch):
+        # Given
+        seeded = await db_executor.run(_seed)
+        queries = await _repo_queries(monkeypatch, seeded)
+        queries += await db_executor.run(_buyer_group_query, seeded['buyer_id'])
+
+        # When
+        seq_scans = []
+        for query in queries:
+            plan = await db_executor.run(_plan, query['sql'])
+            seq_scans += [
+                f'{node["Relation Name"]}: {query["sql"]}'
+                for node in _nodes(plan)
+                if node['Node Type'] == 'Seq Scan'
+            ]
+
+        # Then
+        assert len(queries) >= 13
+        assert seq_scans == []
+
+    @pytest.mark.asyncio
+    async def test_available_products_use_the_partial_index(self, monkeypatch):
+        # Given
+        await db_executor.run(_seed)
+        product_repo = ProductRepoImpl()
+        async with capture_repo_queries(monkeypatch, product_repo_impl) as queries:
+            available = await product_repo.list_available()
+
+        # When
+        plan = await db_executor.run(_plan, queries[0]['sql'])
+
+        # Then
+        assert len(available) == PRODUCT_COUNT // AVAILABLE_EVERY
+        assert 'product_available_idx' in {node.get('Index Name') for node in _nodes(plan)}
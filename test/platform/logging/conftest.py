@@ -0,0 +1,15 @@
+"""Shared fixtures for the logging tests."""
+
+import pytest
+
+from src.platform.logging.loguru_io import Logger
+
+
+@pytest.fixture
+def io_records():
+    records: list[dict] = []
+    handler_id = Logger.base.add(
+        lambda message: records.append(message.record), level='DEBUG', format='{message}'
+    )
+    yield records
+    Logger.base.remove(handler_id)
@@ -0,0 +1,111 @@
+"""Unit tests for the background stdout writer."""
+
+import threading
+import time
+from typing import Optional
+
+from src.platform.logging.background_writer import BackgroundStreamWriter, OverflowPolicy
+
+
+class RecordingStream:
+    def __init__(self, gate: Optional[threading.Event] = None, tty: bool = False):
+        self.gate = gate
+        self.tty = tty
+        self.writes: list[str] = []
+        self.flushes = 0
+
+    def write(self, text: str) -> None:
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.writes.append(text)
+
+    def flush(self) -> None:
+        self.flushes += 1
+
+    def isatty(self) -> bool:
+        return self.tty
+
+
+def test_queued_records_are_written_in_one_batch():
+    # Given a writer whose stream is blocked while records pile up
+    gate = threading.Event()
+    stream = RecordingStream(gate)
+    writer = BackgroundStreamWriter(stream)
+    writer.write('first\n')
+    time.sleep(0.05)  # the writer thread is now stuck on 'first'
+    for i in range(5):
+        writer.write(f'line {i}\n')
+
+    # When
+    gate.set()
+    assert writer.drain(5)
+
+    # Then
+    assert stream.writes == ['first\n', ''.join(f'line {i}\n' for i in range(5))]
+    assert stream.flushes == 2
+    writer.close()
+
+
+def test_drop_oldest_reports_dropped_records():
+    # Given
+    gate = threading.Event()
+    stream = RecordingStream(gate)
+    writer = BackgroundStreamWriter(stream, max_queue=2, overflow=OverflowPolicy.DROP_OLDEST)
+    writer.write('busy\n')
+    time.sleep(0.05)
+
+    # When the queue overflows the caller is never blocked
+    for i in range(5):
+        writer.write(f'line {i}\n')
+    gate.set()
+    writer.drain(5)
+
+    # Then only the newest records survive, after a note about the loss
+    assert writer.dropped == 3
+    assert stream.writes[1] == ('[log writer] 3 records dropped: queue full\nline 3\nline 4\n')
+    writer.close()
+
+
+def test_block_policy_waits_for_room():
+    # Given
+    gate = threading.Event()
+    stream = RecordingStream(gate)
+    writer = BackgroundStreamWriter(stream, max_queue=1, overflow=OverflowPolicy.BLOCK)
+    writer.write('busy\n')
+    time.sleep(0.05)
+    writer.write('queued\n')
+
+    # When
+    blocked = threading.Thread(target=writer.write, args=('waiting\n',))
+    blocked.start()
+    blocked.join(0.1)
+    assert blocked.is_alive()
+    gate.set()
+    blocked.join(5)
+    writer.drain(5)
+
+    # Then nothing is lost
+    assert writer.dropped == 0
+    assert ''.join(stream.writes) == 'busy\nqueued\nwaiting\n'
+    writer.close()
+
+
+def test_close_flushes_pending_records_and_ignores_later_writes():
+    # Given
+    stream = RecordingStream()
+    writer = BackgroundStreamWriter(stream)
+    for i in range(100):
+        writer.write(f'{i}\n')
+
+    # When
+    writer.close()
+    writer.write('after close\n')
+
+    # Then
+    assert ''.join(stream.writes) == ''.join(f'{i}\n' for i in range(100))
+
+
+def test_isatty_is_forwarded_for_colorization():
+    writer = BackgroundStreamWriter(RecordingStream(tty=True))
+    assert writer.isatty() is True
+    writer.close()
@@ -0,0 +1,85 @@
+"""Unit tests for routing standard logging records into loguru."""
+
+import logging
+import sys
+
+import pytest
+
+from src.platform.logging.loguru_io_config import InterceptHandler, access_log_level
+
+
+def _log_record(name: str, level: int, msg: str, args: tuple = (), exc_info=None):
+    return logging.LogRecord(name, level, '/srv/app/views.py', 42, msg, args, exc_info, 'handle')
+
+
+@pytest.mark.parametrize(
+    'status_code,level',
+    [(101, 'INFO'), (200, 'SUCCESS'), (302, 'WARNING'), (404, 'ERROR'), (503, 'CRITICAL')],
+)
+def test_access_log_level_follows_status_code(status_code, level):
+    assert access_log_level(status_code) == level
+
+
+def test_access_record_is_leveled_from_its_args(io_records):
+    # Given
+    record = _log_record(
+        'uvicorn.access',
+        logging.INFO,
+        '%s - "%s %s HTTP/%s" %d',
+        ('127.0.0.1:5000', 'GET', '/api/product/1', '2', 404),
+    )
+
+    # When
+    InterceptHandler().handle(record)
+
+    # Then
+    [logged] = io_records
+    assert logged['level'].name == 'ERROR'
+    assert logged['message'] == '127.0.0.1:5000 - "GET /api/product/1 HTTP/2" 404'
+
+
+def test_call_site_comes_from_the_log_record(io_records):
+    # When
+    InterceptHandler().handle(_log_record('django.request', logging.WARNING, 'slow %s', ('x',)))
+
+    # Then
+    [logged] = io_records
+    assert logged['level'].name == 'WARNING'
+    assert logged['file'].name == 'views.py'
+    assert logged['file'].path == '/srv/app/views.py'
+    assert (logged['function'], logged['line'], logged['name']) == (
+        'handle',
+        42,
+        'django.request',
+    )
+
+
+def test_unknown_level_name_falls_back_to_level_number(io_records):
+    # When
+    InterceptHandler().handle(_log_record('lib', 15, 'custom level'))
+
+    # Then
+    [logged] = io_records
+    assert logged['level'].no == 15
+
+
+def test_exception_info_is_forwarded(io_records):
+    # Given
+    try:
+        raise RuntimeError('boom')
+    except RuntimeError:
+        exc_info = sys.exc_info()
+
+    # When
+    InterceptHandler().handle(_log_record('lib', logging.ERROR, 'failed', exc_info=exc_info))
+
+    # Then
+    [logged] = io_records
+    assert logged['exception'].type is RuntimeError
+
+
+def test_noise_records_are_skipped(io_records):
+    InterceptHandler().handle(
+        _log_record('asyncio', logging.DEBUG, 'Using selector: KqueueSelector')
+    )
+    assert io_records == []
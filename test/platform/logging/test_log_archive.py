@@ -0,0 +1,94 @@
+"""Unit tests for background compression and retention of rotated logs."""
+
+import gzip
+import os
+from time import time
+import zlib
+
+import pytest
+
+from src.platform.logging.log_archive import (
+    LogArchiver,
+    compress_log,
+    remove_expired,
+)
+
+
+LINES = b''.join(b'2026-01-01 | DEBUG | line %d\n' % i for i in range(500))
+
+
+def _gzip_members(data: bytes) -> list[bytes]:
+    members = []
+    while data:
+        decompressor = zlib.decompressobj(wbits=31)
+        members.append(decompressor.decompress(data))
+        data = decompressor.unused_data
+    return members
+
+
+def test_compress_log_writes_line_aligned_gzip_members(tmp_path):
+    # Given
+    path = tmp_path / '2026-01-01_00.log'
+    path.write_bytes(LINES)
+
+    # When
+    target = compress_log(str(path), 'gz', level=1, block_size=1024)
+
+    # Then the source is replaced by a multi-member archive any gzip reader accepts
+    assert target == f'{path}.gz'
+    assert not path.exists()
+    with gzip.open(target) as archive:
+        assert archive.read() == LINES
+    members = _gzip_members(open(target, 'rb').read())
+    assert len(members) > 1
+    assert all(member.endswith(b'\n') for member in members)
+
+
+def test_compress_log_keeps_existing_archive(tmp_path):
+    # Given
+    path = tmp_path / 'app.log'
+    path.write_bytes(LINES)
+    (tmp_path / 'app.log.gz').write_bytes(b'older archive')
+
+    # When
+    target = compress_log(str(path), 'gz')
+
+    # Then
+    assert target != f'{path}.gz'
+    assert (tmp_path / 'app.log.gz').read_bytes() == b'older archive'
+
+
+def test_remove_expired_only_removes_old_files(tmp_path):
+    # Given
+    old, fresh = tmp_path / 'old.log.gz', tmp_path / 'fresh.log'
+    old.write_bytes(b'')
+    fresh.write_bytes(b'')
+    two_weeks_ago = time() - 15 * 24 * 3600
+    os.utime(old, (two_weeks_ago, two_weeks_ago))
+
+    # When
+    removed = remove_expired([str(old), str(fresh), str(tmp_path / 'gone.log')], 14 * 24 * 3600)
+
+    # Then
+    assert removed == [str(old)]
+    assert fresh.exists()
+
+
+def test_archiver_compresses_in_the_background(tmp_path):
+    # Given
+    path = tmp_path / 'app.log'
+    path.write_bytes(LINES)
+    archiver = LogArchiver('gz')
+
+    # When
+    archiver.compress(str(path))
+    archiver.shutdown(wait=True)
+
+    # Then
+    with gzip.open(f'{path}.gz') as archive:
+        assert archive.read() == LINES
+
+
+def test_archiver_rejects_unknown_codec():
+    with pytest.raises(ValueError):
+        LogArchiver('bz2')
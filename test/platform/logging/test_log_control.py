@@ -0,0 +1,143 @@
+"""Unit tests for runtime control of sink levels and tracing."""
+
+import json
+from types import SimpleNamespace
+
+from ninja_extra.testing import TestClient
+import pytest
+
+from src.platform.constant.route_constant import LOGGING_SETTINGS
+from src.platform.logging.log_control import (
+    apply_log_settings,
+    log_settings,
+    reload_log_settings,
+)
+from src.platform.logging.log_sinks import LogSinks
+from src.platform.logging.loguru_io import Logger
+
+
+ADMIN = SimpleNamespace(is_authenticated=True, is_superuser=True)
+BUYER = SimpleNamespace(is_authenticated=True, is_superuser=False)
+
+
+@pytest.fixture
+def sinks():
+    sinks = LogSinks(Logger.base)
+    messages: list[str] = []
+    sinks.add('test', messages.append, format='{message}')
+    yield sinks, messages
+    sinks.remove('test')
+
+
+@pytest.fixture
+def restore_settings():
+    saved = log_settings()
+    yield
+    apply_log_settings(saved['levels'], dict.fromkeys(log_settings()['tracing']))
+
+
+def test_set_level_re_adds_the_sink(sinks):
+    # Given
+    sinks, messages = sinks
+
+    # When
+    sinks.set_level('test', 'INFO')
+    Logger.base.debug('hidden')
+    Logger.base.info('shown')
+
+    # Then
+    assert messages == ['shown\n']
+    assert sinks.levels() == {'test': 'INFO'}
+
+
+def test_unknown_level_keeps_the_current_handler(sinks):
+    sinks, messages = sinks
+
+    with pytest.raises(ValueError):
+        sinks.set_level('test', 'LOUD')
+    Logger.base.debug('still here')
+
+    assert messages == ['still here\n']
+
+
+def test_invalid_settings_change_nothing(restore_settings):
+    before = log_settings()
+
+    with pytest.raises(ValueError, match='Unknown log sink'):
+        apply_log_settings({'stdout': 'INFO', 'missing': 'INFO'})
+
+    assert log_settings() == before
+
+
+def test_signal_reload_applies_file(tmp_path, restore_settings):
+    # Given
+    path = tmp_path / 'log_control.json'
+    path.write_text(json.dumps({'levels': {'stdout': 'WARNING'}, 'tracing': {'src.app': False}}))
+
+    # When
+    reload_log_settings(str(path))
+
+    # Then
+    assert log_settings()['levels']['stdout'] == 'WARNING'
+    assert log_settings()['tracing'] == {'src.app': False}
+
+
+def test_signal_reload_ignores_broken_file(tmp_path, restore_settings):
+    path = tmp_path / 'log_control.json'
+    path.write_text('{not json')
+    before = log_settings()
+
+    reload_log_settings(str(path))
+
+    assert log_settings() == before
+
+
+@pytest.mark.parametrize(
+    'settings',
+    [
+        {'levels': {'stdout': 10}},
+        {'levels': {'stdout': None}},
+        {'levels': {'stdout': 'WARNING'}, 'tracing': {'src.app': 'off'}},
+        {'levels': ['stdout']},
+        ['levels'],
+    ],
+)
+def test_signal_reload_ignores_badly_shaped_file(tmp_path, restore_settings, settings):
+    # Given
+    path = tmp_path / 'log_control.json'
+    path.write_text(json.dumps(settings))
+    before = log_settings()
+
+    # When
+    reload_log_settings(str(path))
+
+    # Then
+    assert log_settings() == before
+
+
+def test_settings_endpoint_is_admin_only(api_instance):
+    response = TestClient(api_instance).get(LOGGING_SETTINGS, user=BUYER)
+
+    assert response.status_code == 403
+
+
+def test_admin_changes_settings_through_endpoint(api_instance, restore_settings):
+    # When
+    response = TestClient(api_instance).put(
+        LOGGING_SETTINGS,
+        json={'levels': {'file': 'INFO'}, 'tracing': {'order_repo_impl.py::': False}},
+        user=ADMIN,
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert response.json()['levels']['file'] == 'INFO'
+    assert response.json()['tracing'] == {'order_repo_impl.py::': False}
+
+
+def test_endpoint_rejects_unknown_level(api_instance, restore_settings):
+    response = TestClient(api_instance).put(
+        LOGGING_SETTINGS, json={'levels': {'file': 'LOUD'}}, user=ADMIN
+    )
+
+    assert response.status_code == 400
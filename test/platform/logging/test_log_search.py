@@ -0,0 +1,106 @@
+"""Unit tests for the indexed search over rotated IO logs."""
+
+import io
+import os
+
+from src.platform.logging.log_archive import compress_log
+from src.platform.logging.log_index import LogIndex, index_path, parse_record_keys
+from src.platform.logging.log_search import main
+
+
+def _record(chain: str, target: str, level: str, message: str) -> str:
+    return (
+        f'2026-01-01 10:00:00.000 | {level:<8} | ┌ views.py::handle:10=>{target} | '
+        f'{message} | 0:00:01.000000 | {chain:<18}\n'
+    )
+
+
+def _write_log(path) -> str:
+    lines = []
+    for request in range(200):
+        chain = f'1767261600.{request:06d}'
+        lines.append(
+            _record(chain, 'order_use_case.py::CreateOrderUseCase.create:20', 'DEBUG', 'args: ()')
+        )
+        if request == 150:
+            lines.append(
+                _record(chain, 'order_repo_impl.py::OrderRepoImpl.create:31', 'ERROR', 'boom')
+            )
+            lines.append('Traceback (most recent call last):\n')
+            lines.append('ValueError: boom\n')
+    lines.append(_record('', '', 'INFO', 'Application shutting down...'))
+    path.write_text(''.join(lines), encoding='utf-8')
+    return ''.join(lines)
+
+
+def _search(*argv: str) -> str:
+    out = io.StringIO()
+    main(list(argv), out=out)
+    return out.getvalue()
+
+
+def test_parse_record_keys():
+    line = _record('1767261600.5', 'product.py::Product.create:12', 'SUCCESS', 'a | b')
+    assert parse_record_keys(line) == ('1767261600.5', 'product.py::Product.create:12', 'SUCCESS')
+    assert parse_record_keys('ValueError: boom\n') is None
+
+
+def test_archive_index_narrows_search_to_matching_blocks(tmp_path):
+    # Given
+    path = tmp_path / '2026-01-01_10.log'
+    _write_log(path)
+
+    # When
+    archive = compress_log(str(path), 'gz', block_size=2048)
+
+    # Then
+    index = LogIndex.load(index_path(archive))
+    assert len(index.blocks) > 5
+    assert len(index.lookup(chain='1767261600.000150')) == 1
+    assert len(index.lookup(level='ERROR')) == 1
+    assert index.lookup(chain='1767261600.000150', target='OrderRepoImpl') == index.lookup(
+        level='ERROR'
+    )
+
+
+def test_search_by_chain_returns_records_with_their_tracebacks(tmp_path):
+    # Given
+    path = tmp_path / '2026-01-01_10.log'
+    _write_log(path)
+    compress_log(str(path), 'gz', block_size=2048)
+
+    # When
+    found = _search(str(tmp_path), '--chain', '1767261600.000150', '--level', 'error')
+
+    # Then
+    assert found == (
+        _record('1767261600.000150', 'order_repo_impl.py::OrderRepoImpl.create:31', 'ERROR', 'boom')
+        + 'Traceback (most recent call last):\nValueError: boom\n'
+    )
+
+
+def test_missing_index_is_rebuilt(tmp_path):
+    # Given
+    path = tmp_path / '2026-01-01_10.log'
+    _write_log(path)
+    archive = compress_log(str(path), 'gz', block_size=2048)
+    os.remove(index_path(archive))
+
+    # When
+    found = _search(archive, '--target', 'OrderRepoImpl')
+
+    # Then
+    assert 'boom' in found
+    assert os.path.exists(index_path(archive))
+
+
+def test_uncompressed_log_is_scanned(tmp_path):
+    # Given
+    path = tmp_path / '2026-01-01_11.log'
+    content = _write_log(path)
+
+    # When
+    found = _search(str(tmp_path), '--level', 'INFO')
+
+    # Then
+    assert found == content.splitlines(keepends=True)[-1]
@@ -0,0 +1,368 @@
+"""Unit tests for the Logger.io decorator."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.platform.logging import loguru_io, loguru_io_utils
+from src.platform.logging.loguru_io import Logger
+from src.platform.logging.loguru_io_config import ENTRY_ARROW, EXIT_ARROW, ExtraField, IOLayer
+from src.platform.logging.loguru_io_context import LazyIOMessage
+from src.platform.logging.loguru_io_utils import build_call_target_func_path
+
+
+@pytest.fixture
+def trace_policies():
+    yield Logger.policies
+    Logger.policies.reset()
+
+
+@Logger.io
+async def traced_step(tag: str) -> str:
+    await asyncio.sleep(0)
+    return tag
+
+
+@Logger.io
+def traced_add(a: int, b: int) -> int:
+    return a + b
+
+
+@Logger.io
+def traced_login(email: str, password: str) -> bool:
+    return bool(email and password)
+
+
+def test_sync_call_emits_entry_and_exit_records(io_records):
+    # When
+    result = traced_add(1, 2)
+
+    # Then
+    assert result == 3
+    entry, exit_ = io_records
+    assert entry['extra'][ExtraField.ENTRY_MARKER] == ENTRY_ARROW
+    assert entry['extra'][ExtraField.EXIT_MARKER] == ''
+    assert exit_['extra'][ExtraField.ENTRY_MARKER] == ''
+    assert exit_['extra'][ExtraField.EXIT_MARKER] == EXIT_ARROW
+    assert 'traced_add' in entry['extra'][ExtraField.CALL_TARGET]
+    assert exit_['message'] == 'return: 3'
+
+
+def test_braces_in_payload_are_logged_verbatim(io_records):
+    # When
+    traced_add('{a}', '{b}')
+
+    # Then
+    assert "('{a}', '{b}')" in io_records[0]['message']
+    assert io_records[1]['message'] == 'return: {a}{b}'
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_do_not_share_markers(io_records):
+    # When two chains interleave on the event loop
+    await asyncio.gather(traced_step('task-a'), traced_step('task-b'))
+
+    # Then every exit record carries the chain start time of its own entry record
+    for tag in ('task-a', 'task-b'):
+        entry, exit_ = [r for r in io_records if tag in r['message']]
+        assert entry['extra'][ExtraField.ENTRY_MARKER] == ENTRY_ARROW
+        assert exit_['extra'][ExtraField.EXIT_MARKER] == EXIT_ARROW
+        assert (
+            entry['extra'][ExtraField.CHAIN_START_TIME]
+            == exit_['extra'][ExtraField.CHAIN_START_TIME]
+        )
+
+
+class _StrCounter:
+    renders = 0
+
+    def __repr__(self) -> str:
+        type(self).renders += 1
+        return 'StrCounter'
+
+
+@Logger.io
+def traced_identity(value):
+    return value
+
+
+def test_arguments_are_not_rendered_when_record_is_dropped():
+    # Given records from this module are filtered out before reaching any sink
+    value = _StrCounter()
+    _StrCounter.renders = 0
+    Logger.base.disable(__name__)
+
+    # When
+    try:
+        traced_identity(value)
+    finally:
+        Logger.base.enable(__name__)
+
+    # Then
+    assert _StrCounter.renders == 0
+
+
+def test_sensitive_positional_argument_is_masked(io_records):
+    # When
+    traced_login('a@b.com', 's3cret')
+
+    # Then
+    entry = io_records[0]['message']
+    assert 's3cret' not in entry
+    assert entry == "args: ('a@b.com', '********'), kwargs: {}"
+
+
+def test_arguments_are_rendered_when_record_is_emitted(io_records):
+    traced_identity(_StrCounter())
+
+    assert [r['message'] for r in io_records] == [
+        'args: (StrCounter,), kwargs: {}',
+        'return: StrCounter',
+    ]
+
+
+def test_lazy_message_renders_once_and_caches():
+    # Given
+    calls = []
+    message = LazyIOMessage(lambda value: calls.append(value) or f'value={value}', 7)
+
+    # Then
+    assert calls == []
+    assert str(message) == 'value=7'
+    assert message.format(extra='ignored') == 'value=7'
+    assert calls == [7]
+
+
+@Logger.io
+def traced_sleep(seconds: float) -> float:
+    time.sleep(seconds)
+    return seconds
+
+
+def test_unsampled_target_emits_nothing(io_records, trace_policies):
+    trace_policies.configure('test_loguru_io.py::traced_add', sample_rate=0.0)
+
+    assert traced_add(1, 2) == 3
+    assert io_records == []
+
+
+@Logger.io
+def traced_outer(a: int, b: int) -> int:
+    return traced_add(a, b)
+
+
+def test_nested_calls_reuse_the_root_draw(io_records, trace_policies, monkeypatch):
+    # Given a skipped root and a nested target admitted only by the first draw
+    draws = iter([0.3, 0.9])
+    monkeypatch.setattr(loguru_io_utils, 'random', lambda: next(draws))
+    trace_policies.configure('test_loguru_io.py::traced_outer', sample_rate=0.0)
+    trace_policies.configure('test_loguru_io.py::traced_add', sample_rate=0.5)
+
+    # When
+    assert traced_outer(1, 2) == 3
+
+    # Then only the nested target is traced, on the root's draw
+    assert len(io_records) == 2
+    assert all('traced_add' in r['extra'][ExtraField.CALL_TARGET] for r in io_records)
+
+
+def test_sampled_root_traces_the_whole_chain(io_records, trace_policies):
+    # Given
+    trace_policies.configure('test_loguru_io.py::traced_outer', sample_rate=1.0)
+    trace_policies.configure('test_loguru_io.py::traced_add', sample_rate=0.0)
+
+    # When
+    traced_outer(1, 2)
+
+    # Then the nested target is traced despite its own rate
+    targets = [r['extra'][ExtraField.CALL_TARGET] for r in io_records]
+    assert len(targets) == 4
+    assert sum('traced_add' in target for target in targets) == 2
+
+
+def test_slow_call_mode_skips_fast_calls(io_records, trace_policies):
+    trace_policies.configure('test_loguru_io.py::traced_sleep', slow_call_ms=1_000)
+
+    traced_sleep(0)
+
+    assert io_records == []
+
+
+def test_slow_call_mode_emits_entry_and_exit_for_slow_calls(io_records, trace_policies):
+    trace_policies.configure('test_loguru_io.py::traced_sleep', slow_call_ms=1)
+
+    traced_sleep(0.01)
+
+    entry, exit_ = io_records
+    assert entry['extra'][ExtraField.ENTRY_MARKER] == ENTRY_ARROW
+    assert entry['message'] == 'args: (0.01,), kwargs: {}'
+    assert exit_['extra'][ExtraField.EXIT_MARKER] == EXIT_ARROW
+
+
+def test_disabled_target_runs_untraced(io_records, trace_policies):
+    # Given
+    metrics = Logger.metrics.get(build_call_target_func_path(traced_sleep))
+    calls = metrics.latency.count
+    trace_policies.configure('test_loguru_io.py::traced_sleep', enabled=False)
+
+    # When
+    traced_sleep(0)
+
+    # Then neither records nor metrics are produced
+    assert io_records == []
+    assert metrics.latency.count == calls
+
+    # When re-enabled
+    trace_policies.configure('test_loguru_io.py::traced_sleep', enabled=True)
+    traced_sleep(0)
+
+    # Then
+    assert len(io_records) == 2
+
+
+def test_disabled_layer_returns_the_original_function(monkeypatch):
+    # Given
+    monkeypatch.setattr(loguru_io, 'IO_DISABLED_LAYERS', frozenset({IOLayer.VALIDATOR}))
+
+    def validate(instance, attribute, value):
+        return value
+
+    # Then
+    assert Logger.io(layer=IOLayer.VALIDATOR)(validate) is validate
+    assert Logger.io(validate) is not validate
+
+
+@Logger.io
+def traced_divide(a: int, b: int) -> float:
+    return a / b
+
+
+def test_every_call_feeds_the_target_metrics(trace_policies):
+    # Given sampling turned off for the target
+    trace_policies.configure('test_loguru_io.py::traced_divide', sample_rate=0.0)
+    metrics = Logger.metrics.get(build_call_target_func_path(traced_divide))
+    calls, errors = metrics.latency.count, metrics.errors
+
+    # When
+    traced_divide(1, 1)
+    with pytest.raises(ZeroDivisionError):
+        traced_divide(1, 0)
+
+    # Then
+    assert metrics.latency.count == calls + 2
+    assert metrics.errors == errors + 1
+    assert 'logger_io_errors_total{call_target="test_loguru_io.py::traced_divide' in ''.join(
+        Logger.metrics.collect()
+    )
+
+
+@Logger.io
+async def traced_rows(count: int):
+    for i in range(count):
+        yield f'row {i}'
+
+
+@Logger.io(aggregate=True)
+async def streamed_rows(count: int, fail_at: int = -1):
+    for i in range(count):
+        if i == fail_at:
+            raise ValueError('broken row')
+        received = yield b'x' * 10
+        if received is not None:
+            yield f'got {received}'
+
+
+@Logger.io(aggregate=True)
+async def streamed_objects(count: int):
+    for i in range(count):
+        yield {'id': i}
+
+
+def _traced(records: list[dict]) -> list[dict]:
+    # asyncio's own debug records land in the same sink
+    return [record for record in records if record['extra'].get(ExtraField.CALL_TARGET)]
+
+
+@pytest.mark.asyncio
+async def test_async_generator_steps_are_traced(io_records):
+    # When
+    rows = [row async for row in traced_rows(2)]
+
+    # Then creation plus one pair per step, including the final StopAsyncIteration
+    assert rows == ['row 0', 'row 1']
+    messages = [record['message'] for record in _traced(io_records)]
+    assert messages[0] == 'args: (2,), kwargs: {}'
+    assert messages[2:] == [
+        'yield: anext | args: (None,), kwargs: {}',
+        'yield: anext | return: row 0',
+        'yield: anext | args: (None,), kwargs: {}',
+        'yield: anext | return: row 1',
+        'yield: anext | args: (None,), kwargs: {}',
+        'yield: anext | return: None',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_aggregated_stream_writes_one_stats_record(io_records):
+    # When
+    stream = streamed_rows(3)
+    rows = [row async for row in stream]
+
+    # Then
+    assert rows == [b'x' * 10] * 3
+    records = _traced(io_records)
+    *_, stats = records
+    assert len(records) == 3  # the call's entry/exit pair and the stream stats
+    assert stats['message'].startswith('stream: 3 items, 30 bytes, ')
+    assert stats['message'].endswith(', exhausted')
+    assert stats['function'] == 'test_aggregated_stream_writes_one_stats_record'
+
+
+@pytest.mark.asyncio
+async def test_aggregated_object_stream_reports_no_byte_count(io_records):
+    # When
+    rows = [row async for row in streamed_objects(2)]
+
+    # Then
+    assert rows == [{'id': 0}, {'id': 1}]
+    *_, stats = _traced(io_records)
+    assert stats['message'].startswith('stream: 2 items, ')
+    assert 'bytes' not in stats['message']
+    assert stats['message'].endswith(' ms, exhausted')
+
+
+@pytest.mark.asyncio
+async def test_aggregated_stream_failure_is_recorded(io_records):
+    # Given
+    metrics = Logger.metrics.get(build_call_target_func_path(streamed_rows))
+    errors = metrics.errors
+
+    # When
+    with pytest.raises(ValueError):
+        async for _ in streamed_rows(3, fail_at=1):
+            pass
+
+    # Then
+    assert io_records[-1]['message'].startswith('stream: 1 items, 10 bytes, ')
+    assert io_records[-1]['message'].endswith('failed: ValueError')
+    assert metrics.errors == errors + 1
+
+
+@pytest.mark.asyncio
+async def test_aggregated_stream_forwards_asend_and_aclose(io_records):
+    # Given
+    stream = streamed_rows(3)
+    await stream.__anext__()
+
+    # When
+    reply = await stream.asend('ping')
+    await stream.aclose()
+    await stream.aclose()
+
+    # Then
+    assert reply == 'got ping'
+    stats = [r['message'] for r in io_records if r['message'].startswith('stream:')]
+    assert len(stats) == 1
+    assert stats[0].startswith('stream: 2 items, 18 bytes, ')
+    assert stats[0].endswith(', closed')
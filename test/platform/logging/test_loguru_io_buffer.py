@@ -0,0 +1,72 @@
+"""Unit tests for tail-based buffering of Logger.io records."""
+
+import time
+
+import pytest
+
+from src.platform.logging.loguru_io import Logger
+from src.platform.logging.loguru_io_config import ENTRY_ARROW, EXIT_ARROW, ExtraField
+
+
+@pytest.fixture
+def tail_buffering():
+    settings = Logger.tail_buffering
+    saved = (settings.enabled, settings.size, settings.latency_budget_ms)
+    settings.enabled, settings.latency_budget_ms = True, 60_000
+    yield settings
+    settings.enabled, settings.size, settings.latency_budget_ms = saved
+
+
+@Logger.io
+def buffered_leaf(value: int) -> int:
+    if value < 0:
+        raise ValueError('negative')
+    return value
+
+
+@Logger.io
+def buffered_root(value: int, delay: float = 0) -> int:
+    time.sleep(delay)
+    return buffered_leaf(value) + buffered_leaf(1)
+
+
+def test_fast_successful_chain_is_discarded(io_records, tail_buffering):
+    assert buffered_root(2) == 3
+    assert io_records == []
+
+
+def test_failed_chain_is_flushed_with_original_call_sites(io_records, tail_buffering):
+    # When
+    with pytest.raises(ValueError):
+        buffered_root(-1)
+
+    # Then the root entry, the failing leaf entry and nothing else were recorded
+    root_entry, leaf_entry = io_records
+    assert root_entry['extra'][ExtraField.ENTRY_MARKER] == ENTRY_ARROW
+    assert 'buffered_root' in root_entry['extra'][ExtraField.CALL_TARGET]
+    assert root_entry['function'] == 'test_failed_chain_is_flushed_with_original_call_sites'
+    assert root_entry['name'] == __name__
+    assert leaf_entry['function'] == 'buffered_root'
+    assert leaf_entry['time'] >= root_entry['time']
+
+
+def test_chain_over_latency_budget_is_flushed(io_records, tail_buffering):
+    tail_buffering.latency_budget_ms = 1
+
+    buffered_root(2, delay=0.01)
+
+    assert len(io_records) == 6
+    assert io_records[-1]['extra'][ExtraField.EXIT_MARKER] == EXIT_ARROW
+    assert io_records[-1]['message'] == 'return: 3'
+
+
+def test_overflowing_buffer_keeps_latest_records(io_records, tail_buffering):
+    tail_buffering.size = 1
+
+    with pytest.raises(ValueError):
+        buffered_root(-1)
+
+    warning, leaf_entry = io_records
+    assert warning['level'].name == 'WARNING'
+    assert '1 earlier IO records dropped' in warning['message']
+    assert 'buffered_leaf' in leaf_entry['extra'][ExtraField.CALL_TARGET]
@@ -0,0 +1,76 @@
+"""Unit tests for Logger.io tracing policies."""
+
+import pytest
+
+from src.platform.logging.loguru_io_policy import TracePolicyRegistry
+
+
+TARGET = 'order_repo_impl.py::OrderRepoImpl.update:80'
+
+
+def test_registered_target_uses_registry_defaults():
+    registry = TracePolicyRegistry(sample_rate=0.25, slow_call_ms=50)
+
+    policy = registry.register(TARGET)
+
+    assert policy.sample_rate == 0.25
+    assert policy.slow_threshold == 0.05
+
+
+def test_most_specific_prefix_rule_wins_and_unset_fields_inherit():
+    # Given
+    registry = TracePolicyRegistry(sample_rate=0.1)
+    policy = registry.register(TARGET)
+
+    # When
+    registry.configure('order_repo_impl.py', sample_rate=0.5, slow_call_ms=20)
+    registry.configure('order_repo_impl.py::OrderRepoImpl.update', sample_rate=1.0)
+
+    # Then the existing policy object is updated in place
+    assert policy.sample_rate == 1.0
+    assert policy.slow_threshold == 0.02
+
+
+def test_reset_restores_defaults():
+    registry = TracePolicyRegistry(sample_rate=0.1)
+    policy = registry.register(TARGET)
+    registry.configure('order_repo_impl.py', sample_rate=1.0, slow_call_ms=5)
+
+    registry.reset('order_repo_impl.py')
+
+    assert policy.sample_rate == 0.1
+    assert policy.slow_threshold is None
+
+
+def test_non_positive_slow_call_ms_turns_slow_mode_off():
+    registry = TracePolicyRegistry(slow_call_ms=10)
+    policy = registry.register(TARGET)
+
+    registry.configure(TARGET, slow_call_ms=0)
+
+    assert policy.slow_threshold is None
+
+
+def test_sample_rate_out_of_range_is_rejected():
+    with pytest.raises(ValueError, match='sample_rate'):
+        TracePolicyRegistry().configure(TARGET, sample_rate=1.5)
+
+
+def test_module_prefix_disables_targets_and_specific_rule_reenables():
+    # Given
+    registry = TracePolicyRegistry()
+    update = registry.register(TARGET, 'src.driven_adapter.repo.order_repo_impl')
+    other = registry.register('order_use_case.py::create:10', 'src.app.use_case.order')
+
+    # When
+    registry.configure('src.driven_adapter', enabled=False)
+
+    # Then
+    assert update.enabled is False
+    assert other.enabled is True
+
+    # When
+    registry.configure(TARGET, enabled=True)
+
+    # Then
+    assert update.enabled is True
@@ -0,0 +1,84 @@
+"""Unit tests for Logger.io span export and the span report CLI."""
+
+import io
+import json
+
+import pytest
+
+from src.platform.logging.loguru_io import Logger
+from src.platform.logging.span_report import build_traces, read_spans, render_folded, render_tree
+
+
+@pytest.fixture
+def span_file(tmp_path):
+    path = tmp_path / 'spans.ndjson'
+    Logger.spans.configure(path)
+    yield path
+    Logger.spans.configure(None)
+
+
+@Logger.io
+def span_leaf(value: int) -> int:
+    if value < 0:
+        raise ValueError('negative')
+    return value
+
+
+@Logger.io
+def span_root(value: int) -> int:
+    try:
+        span_leaf(value)
+    except ValueError:
+        pass
+    return span_leaf(1)
+
+
+def _read(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_chain_is_exported_as_parent_linked_spans(span_file):
+    # When
+    span_root(-1)
+
+    # Then
+    root, failed_leaf, leaf = _read(span_file)
+    assert len({root['trace'], failed_leaf['trace'], leaf['trace']}) == 1
+    assert root['parent'] is None
+    assert 'span_root' in root['target']
+    assert failed_leaf['parent'] == leaf['parent'] == root['id']
+    assert failed_leaf['error'] is True
+    assert leaf['error'] is False
+    assert 0 <= failed_leaf['start_ms'] <= leaf['start_ms'] <= root['dur_ms']
+
+
+def test_each_chain_gets_its_own_trace(span_file):
+    span_root(1)
+    span_root(2)
+
+    assert len({span['trace'] for span in _read(span_file)}) == 2
+
+
+def test_nothing_is_exported_without_a_span_file(tmp_path):
+    span_root(1)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_report_rebuilds_tree_and_folded_stacks(span_file):
+    # Given
+    span_root(-1)
+    with span_file.open() as file:
+        (trace,) = build_traces(read_spans(file))
+
+    # When
+    tree, folded = io.StringIO(), io.StringIO()
+    render_tree(trace, tree)
+    render_folded([trace], folded)
+
+    # Then
+    (root,) = trace.roots
+    assert [len(child.children) for child in root.children] == [0, 0]
+    assert '!error' in tree.getvalue()
+    stacks = [line.rsplit(' ', 1)[0] for line in folded.getvalue().splitlines()]
+    assert stacks == [root.target, f'{root.target};{root.children[0].target}']
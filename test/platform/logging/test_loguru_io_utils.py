@@ -0,0 +1,205 @@
+"""Unit tests for LoguruIO helper utilities."""
+
+from functools import wraps
+from inspect import getsourcelines
+
+from pydantic import BaseModel
+
+from src.domain.entity.product_entity import Product
+from src.platform.models.order_model import OrderModel
+from src.platform.logging.loguru_io_config import IOLayer
+from src.platform.logging.loguru_io_utils import (
+    BoundedRepr,
+    CallPlan,
+    build_call_target_func_path,
+    fetch_field_mask,
+    fetch_io_layers,
+)
+
+
+def _positional(a, b, c=3):
+    return a, b, c
+
+
+def _keyword_only(a, *, flag=False):
+    return a, flag
+
+
+def _var_args(a, *args):
+    return a, args
+
+
+def _var_kwargs(a, **kwargs):
+    return a, kwargs
+
+
+def _everything(*args, **kwargs):
+    return args, kwargs
+
+
+def _login(email, password, *args):
+    return email, password, args
+
+
+def test_call_plan_passes_matching_call_through_unchanged():
+    # Given
+    plan = CallPlan(_positional)
+    args, kwargs = (1, 2), {'c': 4}
+
+    # When
+    new_args, new_kwargs = plan.apply(args, kwargs)
+
+    # Then
+    assert new_args is args
+    assert new_kwargs is kwargs
+
+
+def test_call_plan_drops_unknown_keyword_arguments():
+    plan = CallPlan(_keyword_only)
+
+    assert plan.apply((1,), {'flag': True, 'request': object()}) == ((1,), {'flag': True})
+
+
+def test_call_plan_trims_surplus_positional_arguments():
+    plan = CallPlan(_positional)
+
+    assert plan.apply((1, 2, 3, 4, 5), {}) == ((1, 2, 3), {})
+
+
+def test_call_plan_counts_positionals_supplied_by_keyword():
+    plan = CallPlan(_positional)
+
+    assert plan.apply((1, 2, 3), {'c': 9}) == ((1, 2), {'c': 9})
+
+
+def test_call_plan_keeps_var_positional_and_var_keyword_targets_intact():
+    assert CallPlan(_var_args).apply((1, 2, 3), {'x': 1}) == ((1, 2, 3), {})
+    assert CallPlan(_var_kwargs).apply((1, 2), {'x': 1}) == ((1,), {'x': 1})
+    assert CallPlan(_everything).passthrough is True
+
+
+def _passthrough(func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+class _Service:
+    @classmethod
+    @_passthrough
+    def build(cls):
+        return cls()
+
+
+def test_call_target_points_at_the_function_definition():
+    lineno = getsourcelines(_positional)[1]
+
+    assert (
+        build_call_target_func_path(_positional) == f'test_loguru_io_utils.py::_positional:{lineno}'
+    )
+
+
+def test_call_target_sees_through_bound_and_wrapped_functions():
+    lineno = getsourcelines(_Service.build)[1]
+
+    assert build_call_target_func_path(_Service.build) == (
+        f'test_loguru_io_utils.py::_Service.build:{lineno}'
+    )
+
+
+def test_io_layers_come_from_the_src_package_and_explicit_layer():
+    assert fetch_io_layers(Product.create) == {IOLayer.DOMAIN}
+    assert fetch_io_layers(Product.create, IOLayer.VALIDATOR) == {
+        IOLayer.DOMAIN,
+        IOLayer.VALIDATOR,
+    }
+    assert fetch_io_layers(_positional) == set()
+
+
+class _CountingRepr:
+    calls = 0
+
+    def __repr__(self) -> str:
+        type(self).calls += 1
+        return 'item'
+
+
+class _Payment(BaseModel):
+    order_id: int
+    note: str
+
+
+def test_bounded_repr_stops_walking_once_the_budget_is_spent():
+    # Given
+    _CountingRepr.calls = 0
+    payload = [[_CountingRepr() for _ in range(50)] for _ in range(1_000)]
+
+    # When
+    rendered = BoundedRepr(maxitems=10, maxchars=60).render(payload)
+
+    # Then
+    assert len(rendered) <= 63
+    assert rendered.endswith('...')
+    assert _CountingRepr.calls < 20
+
+
+def test_bounded_repr_keeps_small_values_like_repr():
+    renderer = BoundedRepr()
+
+    assert renderer.render((1, 'a', {'k': [None]})) == "(1, 'a', {'k': [None]})"
+    assert renderer.render('{top-level} string') == '{top-level} string'
+    assert renderer.render({'password': 'secret'}) == "{'password': '********'}"
+
+
+def test_bounded_repr_renders_models_and_entities_field_by_field():
+    renderer = BoundedRepr(maxitems=2)
+
+    assert renderer.render(_Payment(order_id=1, note='x' * 500)).startswith(
+        "_Payment(order_id=1, note='xx"
+    )
+    assert (
+        renderer.render(Product(name='n', description='d', price=1, seller_id=1))
+        == "Product(name='n', description='d', ...)"
+    )
+
+
+def test_bounded_repr_never_evaluates_querysets():
+    # No db fixture: evaluating the queryset would raise
+    assert BoundedRepr().render(OrderModel.objects.filter(price__gt=1)) == (
+        '<QuerySet OrderModel (not evaluated)>'
+    )
+
+
+class _Credentials(BaseModel):
+    email: str
+    password: str
+
+
+def test_sensitive_fields_and_keys_are_masked_structurally():
+    renderer = BoundedRepr()
+    payload = {
+        'login': _Credentials(email='a@b.com', password='hunter22'),
+        'nested': [{'New_Password': 'x', 'card_number': '4111111111111111', 'note': 'ok'}],
+    }
+
+    rendered = renderer.render(payload)
+
+    assert 'hunter22' not in rendered
+    assert '4111111111111111' not in rendered
+    assert "_Credentials(email='a@b.com', password='********')" in rendered
+    assert "{'New_Password': '********', 'card_number': '********', 'note': 'ok'}" in rendered
+
+
+def test_call_plan_masks_sensitive_arguments_passed_by_position():
+    plan = CallPlan(_login)
+
+    assert plan.mask_args(('a@b.com', 's3cret', 'extra')) == ('a@b.com', '********', 'extra')
+    assert CallPlan(_positional).mask_args((1, 2)) == (1, 2)
+
+
+def test_field_masks_are_computed_once_per_type():
+    assert fetch_field_mask(_Credentials) is fetch_field_mask(_Credentials)
+    assert fetch_field_mask(_Credentials) == (('email', False), ('password', True))
+    assert fetch_field_mask(dict) is None
@@ -0,0 +1,96 @@
+"""Unit tests for the metrics primitives and endpoint."""
+
+from types import SimpleNamespace
+
+from ninja_extra.testing import TestClient
+from pydantic import SecretStr
+import pytest
+
+from src.platform.config.env_config import env_config
+from src.platform.constant.route_constant import METRICS_GET
+from src.platform.metrics.histogram import Histogram
+from src.platform.metrics.registry import MetricsRegistry, metrics_registry
+
+
+ADMIN = SimpleNamespace(is_authenticated=True, is_superuser=True)
+ANONYMOUS = SimpleNamespace(is_authenticated=False, is_superuser=False)
+SCRAPE_TOKEN = 'scrape-token'
+
+
+@pytest.fixture
+def scrape_token(monkeypatch):
+    monkeypatch.setattr(env_config, 'METRICS_SCRAPE_TOKEN', SecretStr(SCRAPE_TOKEN))
+
+
+def test_histogram_renders_cumulative_buckets():
+    # Given
+    histogram = Histogram(bounds=(0.1, 1.0))
+
+    # When
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+
+    # Then
+    assert list(histogram.render('latency', {'target': 'a"b'})) == [
+        'latency_bucket{target="a\\"b",le="0.1"} 2',
+        'latency_bucket{target="a\\"b",le="1"} 3',
+        'latency_bucket{target="a\\"b",le="+Inf"} 4',
+        'latency_sum{target="a\\"b"} 3.65',
+        'latency_count{target="a\\"b"} 4',
+    ]
+
+
+def test_registry_joins_collector_lines():
+    registry = MetricsRegistry()
+    registry.register('first', lambda: ['a 1'])
+    registry.register('second', lambda: ['b 2'])
+
+    assert registry.render() == 'a 1\nb 2\n'
+
+
+def test_metrics_endpoint_serves_prometheus_text(api_instance):
+    # Given
+    metrics_registry.register('test', lambda: ['# TYPE test_metric gauge', 'test_metric 1'])
+
+    # When
+    try:
+        response = TestClient(api_instance).get(METRICS_GET, user=ADMIN)
+    finally:
+        metrics_registry.unregister('test')
+
+    # Then
+    assert response.status_code == 200
+    assert response['Content-Type'].startswith('text/plain; version=0.0.4')
+    assert 'test_metric 1\n' in response.content.decode()
+
+
+@pytest.mark.parametrize(
+    'headers',
+    [{}, {'Authorization': 'Bearer wrong-token'}, {'Authorization': f'Basic {SCRAPE_TOKEN}'}],
+)
+def test_metrics_endpoint_refuses_anonymous_requests(api_instance, scrape_token, headers):
+    response = TestClient(api_instance).get(METRICS_GET, user=ANONYMOUS, headers=headers)
+
+    assert response.status_code == 403
+
+
+def test_metrics_endpoint_accepts_the_scrape_token(api_instance, scrape_token):
+    response = TestClient(api_instance).get(
+        METRICS_GET, user=ANONYMOUS, headers={'Authorization': f'Bearer {SCRAPE_TOKEN}'}
+    )
+
+    assert response.status_code == 200
+
+
+def test_metrics_endpoint_without_a_token_is_admin_only(api_instance, monkeypatch):
+    # Given no scrape token is configured
+    monkeypatch.setattr(env_config, 'METRICS_SCRAPE_TOKEN', None)
+    client = TestClient(api_instance)
+
+    # When
+    bearer = client.get(METRICS_GET, user=ANONYMOUS, headers={'Authorization': 'Bearer '})
+    admin = client.get(METRICS_GET, user=ADMIN)
+
+    # Then
+    assert bearer.status_code == 403
+    assert admin.status_code == 200
@@ -0,0 +1,49 @@
+"""The ORM and asyncpg product repositories return the same entities."""
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+import pytest
+
+from src.driven_adapter.repo.product_repo_asyncpg_impl import ProductRepoAsyncpgImpl
+from src.driven_adapter.repo.product_repo_impl import ProductRepoImpl
+from src.platform.config.env_config import env_config
+from src.platform.database.asyncpg_pool import AsyncpgPool
+from src.platform.database.db_executor import db_executor
+from src.platform.models.product_model import ProductModel
+from test.util_constant import TEST_SELLER_EMAIL
+
+
+def _create_product() -> int:
+    seller = get_user_model().objects.create(email=TEST_SELLER_EMAIL, role='seller')
+    return ProductModel.objects.create(
+        name='Desk', description='Oak desk', price=300, seller=seller
+    ).id
+
+
+def _test_database_pool() -> AsyncpgPool:
+    # The asyncpg repos must read the pytest database, not the configured one
+    config = env_config.model_copy(update={'POSTGRES_DB': connection.settings_dict['NAME']})
+    return AsyncpgPool(config.DATABASE_URL_SYNC, min_size=1, max_size=2)
+
+
+@pytest.mark.django_db(transaction=True)
+class TestProductRepoBackends:
+    @pytest.mark.asyncio
+    async def test_get_by_id_with_seller_matches_across_backends(self):
+        # Given
+        product_id = await db_executor.run(_create_product)
+        pool = _test_database_pool()
+
+        # When
+        try:
+            orm_product, orm_seller = await ProductRepoImpl().get_by_id_with_seller(product_id)
+            native_product, native_seller = await ProductRepoAsyncpgImpl(
+                pool
+            ).get_by_id_with_seller(product_id)
+        finally:
+            await pool.close()
+
+        # Then
+        assert native_product == orm_product
+        assert native_seller == orm_seller
+        assert orm_seller.name == TEST_SELLER_EMAIL
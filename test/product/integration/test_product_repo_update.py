@@ -0,0 +1,40 @@
+"""ProductRepoImpl.update writes and re-reads the product in a single statement."""
+
+from django.contrib.auth import get_user_model
+import pytest
+
+from src.domain.entity.product_entity import ProductStatus
+from src.driven_adapter.repo import product_repo_impl
+from src.driven_adapter.repo.product_repo_impl import ProductRepoImpl
+from src.platform.database.db_executor import db_executor
+from src.platform.models.product_model import ProductModel
+from test.shared.utils import capture_repo_queries
+from test.util_constant import TEST_SELLER_EMAIL
+
+
+def _create_product() -> int:
+    seller = get_user_model().objects.create(email=TEST_SELLER_EMAIL, role='seller')
+    return ProductModel.objects.create(
+        name='Desk', description='Oak desk', price=300, seller=seller
+    ).id
+
+
+@pytest.mark.django_db(transaction=True)
+class TestProductRepoUpdate:
+    @pytest.mark.asyncio
+    async def test_update_is_one_statement(self, monkeypatch):
+        # Given
+        repo = ProductRepoImpl()
+        product = await repo.get_by_id(await db_executor.run(_create_product))
+        product.price = 250
+        product.status = ProductStatus.RESERVED
+
+        # When
+        async with capture_repo_queries(monkeypatch, product_repo_impl) as queries:
+            updated = await repo.update(product)
+
+        # Then
+        assert len(queries) == 1
+        assert queries[0]['sql'].startswith('UPDATE product')
+        assert updated.price == 250
+        assert updated.status == ProductStatus.RESERVED
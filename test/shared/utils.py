@@ -1,9 +1,14 @@
-from typing import Any, Dict
+from contextlib import asynccontextmanager
+from types import ModuleType
+from typing import Any, AsyncIterator, Dict, List
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 import pytest
 from ninja_extra.testing import TestAsyncClient
 
 from src.platform.constant.route_constant import AUTH_LOGIN
+from src.platform.database.db_executor import DBExecutor
 
 
 def get_response_text(response) -> str:
@@ -86,3 +91,26 @@ def create_product(
     response = client.post(PRODUCT_BASE, json=product_data)
     assert_response_status(response, 201, 'Failed to create product')
     return response.json()
+
+
+@asynccontextmanager
+async def capture_repo_queries(
+    monkeypatch: pytest.MonkeyPatch, *repo_modules: ModuleType
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Capture the SQL that repositories of ``repo_modules`` run inside the block.
+
+    Repository queries run on DB executor threads, each with its own connection, so
+    the block routes them through a single-worker executor and captures there.
+    """
+    executor = DBExecutor(max_workers=1, name='capture-db')
+    for module in repo_modules:
+        monkeypatch.setattr(module, 'db_executor', executor)
+    context = CaptureQueriesContext(connection)
+    queries: List[Dict[str, Any]] = []
+    await executor.run(context.__enter__)
+    try:
+        yield queries
+    finally:
+        await executor.run(context.__exit__, None, None, None)
+        queries.extend(await executor.run(lambda: context.captured_queries))
+        executor.shutdown()